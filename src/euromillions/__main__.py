@@ -1,40 +1,218 @@
+import json
+import math
+import os
+from typing import List, Optional
+
 import typer
-import pandas as pd
-from euromillions.euromillions_loader import fetch_and_cache_draws, load_draws_df
-from euromillions.genetics.evolve import run_evolution
+# commands import what they need themselves, so e.g. `stats` never loads the GA
+from euromillions.genetics.parameters import (
+    CHECKPOINT_PATH,
+    ISLAND_GENERATIONS,
+    ISLANDS,
+    MIGRANTS,
+    MIGRATION_INTERVAL,
+    OFFSPRING_PER_STEP,
+    POPULATION_BACKEND,
+    POPULATION_SIZE,
+    RACING,
+    RANDOM_SEED,
+    SCORING_WORKERS,
+    SHARD_BURN_IN,
+    SHARDS,
+)
 
 app = typer.Typer()
 
 @app.command("fetch-draws")
 def fetch_draws_command():
-    fetch_and_cache_draws()
-    print("Draws fetched and cached.")
+    """
+    Fetch draws newer than the cache and merge them in (set EUROMILLIONS_DRAW_URL to use another API).
+    """
+    from euromillions.euromillions_loader import fetch_and_cache_draws
+
+    new_draws = fetch_and_cache_draws()
+    print(f"Draws fetched and cached ({new_draws} new).")
+
+@app.command("record-draws")
+def record_draws_command(
+        output: str = typer.Argument(..., help="JSON file to save the API's answer to."),
+):
+    """
+    Record the real API's full answer, for replay with serve-api.
+    """
+    from euromillions.stub_api import record_payload
+
+    print(f"Recorded {record_payload(output):,} draws to {output}")
+
+@app.command("serve-api")
+def serve_api_command(
+        source: Optional[str] = typer.Option(
+            None, help="Recorded JSON payload or draw store directory to serve; synthetic draws if omitted."
+        ),
+        draws: int = typer.Option(1_000, help="Synthetic draws to serve when there is no --source."),
+        port: int = typer.Option(8000, help="Port to listen on (localhost only)."),
+):
+    """
+    Serve draws on localhost like the real API, for fetch-draws without a network.
+    """
+    from euromillions.stub_api import StubDrawsAPI, load_payload, synthetic_payload
+
+    payload = load_payload(source) if source else synthetic_payload(draws)
+    api = StubDrawsAPI(payload, port=port)
+    print(f"Serving {len(payload):,} draws; use EUROMILLIONS_DRAW_URL={api.url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+@app.command("synthesize-draws")
+def synthesize_draws_command(
+        draws: int = typer.Option(10_000, help="Number of draws to generate (1e3 to 1e6 is typical)."),
+        output_dir: str = typer.Option("data/synthetic", help="Directory for the draw store (draws.arrow and prizes.arrow)."),
+        seed: int = typer.Option(0, help="Seed for the synthetic history."),
+        hot_number: List[int] = typer.Option([], help="Number to over-weight; repeat for several."),
+        hot_star: List[int] = typer.Option([], help="Star to over-weight; repeat for several."),
+        bias: float = typer.Option(1.0, help="How many times likelier hot balls are than the rest."),
+):
+    """
+    Write a synthetic draw history in the cached-data schema, for offline scale testing.
+    Use it with EUROMILLIONS_DATA_DIR=<output-dir>.
+    """
+    from euromillions.synthetic import write_synthetic_draws
+
+    if any(not 1 <= n <= 50 for n in hot_number) or any(not 1 <= s <= 12 for s in hot_star):
+        raise typer.BadParameter("hot numbers must be 1-50 and hot stars 1-12")
+    if bias <= 0:
+        raise typer.BadParameter("bias must be positive")
+    write_synthetic_draws(output_dir, draws, seed, hot_number, hot_star, bias)
+    print(f"Wrote {draws:,} synthetic draws to {output_dir}")
 
 @app.command("generate")
-def generate_command():
+def generate_command(
+        workers: int = typer.Option(SCORING_WORKERS, help="Processes used to score chromosomes."),
+        offspring: int = typer.Option(OFFSPRING_PER_STEP, help="Children bred and scored together per step."),
+        seed: Optional[int] = typer.Option(RANDOM_SEED, help="Run seed; random if omitted."),
+        backend: str = typer.Option(POPULATION_BACKEND, help="Population storage: 'list' or 'array'."),
+        population_size: int = typer.Option(POPULATION_SIZE, help="Number of chromosomes."),
+        resume: bool = typer.Option(False, help="Continue from the checkpoint, evolving only new draws."),
+        checkpoint: str = typer.Option(CHECKPOINT_PATH, help="Checkpoint file to write (and resume from)."),
+        profile: Optional[str] = typer.Option(
+            None, help="Write per-window timings to this file (JSON lines, or CSV if it ends in .csv)."
+        ),
+        shards: int = typer.Option(SHARDS, help="Walk the draws in this many parallel shards."),
+        burn_in: int = typer.Option(SHARD_BURN_IN, help="Draws each shard evolves over before its first."),
+        results: Optional[str] = typer.Option(
+            None, help="Write every window, draw report and event to this file (JSON lines, or .parquet)."
+        ),
+        console_interval: float = typer.Option(
+            0.0, help="Show at most one window on the console per this many seconds."
+        ),
+        quiet: bool = typer.Option(False, help="Print no per-draw output (use with --results)."),
+        racing: bool = typer.Option(
+            RACING, help="Race children on sampled draws and stop those unlikely to enter the population."
+        ),
+):
     """
     Run the full genetic algorithm evolution and print the best chromosome and its tickets.
     """
-    run_evolution()
+    if backend not in ("list", "array"):
+        raise typer.BadParameter("backend must be 'list' or 'array'")
+    if shards > 1 and (resume or profile is not None):
+        raise typer.BadParameter("--shards cannot be combined with --resume or --profile")
+    from euromillions.genetics.evolve import run_evolution
+
+    run_evolution(
+        workers=workers,
+        offspring=offspring,
+        seed=seed,
+        backend=backend,
+        population_size=population_size,
+        resume=resume,
+        checkpoint_path=checkpoint,
+        profile=profile,
+        shards=shards,
+        burn_in=burn_in,
+        results_path=results,
+        console_interval=None if quiet else console_interval,
+        racing=racing,
+    )
+
+@app.command("islands")
+def islands_command(
+        islands: int = typer.Option(ISLANDS, help="Populations, each evolved in its own process."),
+        generations: int = typer.Option(ISLAND_GENERATIONS, help="Generations each island evolves."),
+        population_size: int = typer.Option(POPULATION_SIZE, help="Chromosomes per island."),
+        migration_interval: int = typer.Option(MIGRATION_INTERVAL, help="Generations between migrations."),
+        migrants: int = typer.Option(MIGRANTS, help="Best chromosomes each island sends per migration."),
+        seed: Optional[int] = typer.Option(RANDOM_SEED, help="Run seed; random if omitted."),
+):
+    """
+    Search the latest draw window with an island model, one process per island, and print its tickets.
+    """
+    if islands < 1:
+        raise typer.BadParameter("islands must be at least 1")
+    from euromillions.genetics.islands import recommend_tickets
+
+    recommend_tickets(islands, generations, population_size, migration_interval, migrants, seed)
+
+@app.command("benchmark")
+def benchmark_command(
+        output: str = typer.Option("benchmarks.json", help="Where to write the JSON results."),
+        draws: int = typer.Option(10_000, help="Synthetic draws to benchmark against."),
+):
+    """
+    Time the strategies, the fitness function and evolve_window on synthetic data.
+    """
+    from euromillions.benchmarks import run_all
+
+    results = run_all(num_draws=draws)
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as fh:
+        json.dump(results, fh, indent=2)
+    for row in results["evolve_window"]:
+        print(f"evolve_window[{row['backend']}]: {row['children_per_s']:,.0f} children/s")
+    for row in results["islands"]:
+        print(f"islands[{row['islands']}]: {row['evaluations_per_s']:,.0f} evaluations/s")
+    print(f"Benchmark results written to {output}")
 
 @app.command("stats")
 def stats_command():
-    draws_df = load_draws_df()
-    if draws_df.empty:
+    import numpy as np
+    import pyarrow.compute as pc
+
+    from euromillions.draw_index import NUMBER_COLUMNS
+    from euromillions.euromillions_loader import DATA_DIR, load_draws_table
+    from euromillions.generators.strategies.sum_target import band_probability, sum_band
+    from euromillions.generators.strategy_registry import variant_specs
+    from euromillions.storage import read_prizes
+
+    draws = load_draws_table(["date", "has_winner"] + NUMBER_COLUMNS)
+    if draws.num_rows == 0:
         print("No draws found.")
         return
 
-    latest = pd.to_datetime(draws_df["date"]).max()
-    earliest = pd.to_datetime(draws_df["date"]).min()
-    total = len(draws_df)
-    winners = draws_df["has_winner"].sum()
-    prize_tiers = pd.json_normalize(draws_df["prizes"]).dropna().shape[0]
+    latest = pc.max(draws["date"]).as_py()
+    earliest = pc.min(draws["date"]).as_py()
+    total = draws.num_rows
+    winners = pc.sum(draws["has_winner"]).as_py()
+    prize_tiers = read_prizes(DATA_DIR, ["draw_id"]).num_rows
 
-    print(f"Latest draw date: {latest.date()}")
-    print(f"Earliest draw date: {earliest.date()}")
+    print(f"Latest draw date: {latest}")
+    print(f"Earliest draw date: {earliest}")
     print(f"Total draws: {total}")
     print(f"Winning draws: {winners}")
     print(f"Prize tiers (total across all draws): {prize_tiers}")
 
+    # exact share of all tickets each sum_target variant draws from
+    sums = np.sum([draws[name].to_numpy().astype(np.int16) for name in NUMBER_COLUMNS], axis=0)
+    mean = sums.mean() if total else math.nan
+    std = sums.std(ddof=1) if total > 1 else 0.0
+    print(f"Number sum: mean {mean:.1f}, std {std:.1f}")
+    for spec in variant_specs():
+        if spec.family == "sum_target":
+            tolerance = dict(spec.params)["tolerance"]
+            low, high = sum_band(mean, std, tolerance)
+            print(f"  sum_target {tolerance}: sums {low}-{high}, {band_probability(low, high):.2%} of tickets")
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,295 @@
+"""Offline benchmarks for the strategies, the fitness function and the GA loop.
+
+Everything runs against ``synthetic_draws_df`` on fixed seeds, so results
+from different commits and machines can be compared directly.  ``run_all``
+returns a JSON-serialisable dict; the ``benchmark`` command writes it out.
+"""
+from __future__ import annotations
+
+import datetime
+import platform
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+import numpy as np
+
+from euromillions.draw_index import DrawIndex, build_draw_index
+from euromillions.euromillions_loader import fetch_and_cache_draws
+from euromillions.generators.strategy_registry import (
+    family_variants,
+    generate_tickets_from_variants,
+    get_all_strategy_variants,
+    variant_specs,
+)
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.genetics import evolve
+from euromillions.genetics.fitness import evaluate_ticket_set
+from euromillions.genetics.islands import run_islands
+from euromillions.genetics.parameters import MIGRANTS, MIGRATION_INTERVAL
+from euromillions.genetics.racing import race_stats
+from euromillions.stub_api import StubDrawsAPI, synthetic_payload
+from euromillions.synthetic import synthetic_draws_df, write_synthetic_draws
+from ga_core.bit_population import BitPopulation
+
+HISTORY_SIZES = [100, 500, 2000]
+FITNESS_SIZES = [100, 1_000, 10_000]
+WINDOW_STEPS = 20  # consecutive windows each strategy is walked over
+EVOLVE_CHILDREN = 1_000
+RACE_WINDOW = 2_000  # draws in the long window racing is benchmarked on
+ISLAND_COUNTS = [1, 2, 4]
+ISLAND_GENERATIONS = 20
+ISLAND_POPULATION = 20
+FETCH_DRAWS = 2_000
+FETCH_NEW_DRAWS = 10  # draws added between the full and the incremental fetch
+SEED = 1234
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> dict:
+    """Per-call wall time of ``fn`` over ``repeat`` calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"calls": repeat, "mean_s": float(np.mean(times)), "min_s": float(np.min(times))}
+
+
+@contextmanager
+def _overridden(module, **values) -> Iterator[None]:
+    saved = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def bench_strategies(draws: DrawIndex, sizes: List[int] = HISTORY_SIZES) -> List[dict]:
+    """
+    Each family's variants walked forward over ``WINDOW_STEPS`` consecutive
+    histories of every size, as ``run_evolution`` would call them.
+    """
+    results = []
+    for family in dict.fromkeys(spec.family for spec in variant_specs()):
+        variants = family_variants(family)
+        for size in sizes:
+            if size + WINDOW_STEPS > len(draws):
+                continue
+            start = time.perf_counter()
+            calls = 0
+            for stop in range(size, size + WINDOW_STEPS):
+                history = draws[stop - size:stop]
+                for i, gen_fn in enumerate(variants):
+                    gen_fn(history, evolve.MAX_TICKETS, random.Random(SEED + i))
+                    calls += 1
+            elapsed = time.perf_counter() - start
+            results.append({
+                "family": family,
+                "variants": len(variants),
+                "history": size,
+                "calls": calls,
+                "mean_s": elapsed / calls,
+            })
+    return results
+
+
+def bench_fitness(draws: DrawIndex, sizes: List[int] = FITNESS_SIZES, repeat: int = 20) -> List[dict]:
+    """``evaluate_ticket_set`` on one ticket set against histories of every size."""
+    rng = random.Random(SEED)
+    tickets = [
+        (rng.sample(range(1, 51), 5), rng.sample(range(1, 13), 2))
+        for _ in range(evolve.MAX_TICKETS)
+    ]
+    results = []
+    for size in sizes:
+        if size > len(draws):
+            continue
+        history = draws.tail(size)
+        results.append({"history": size, **_timed(lambda: evaluate_ticket_set(tickets, history), repeat)})
+    return results
+
+
+def bench_ticket_generation(draws: DrawIndex, population: int = 100) -> List[dict]:
+    """``generate_tickets_from_variants`` for a random population, with and without a pool."""
+    variants = get_all_strategy_variants()
+    rng = random.Random(SEED)
+    chromosomes = [[rng.randint(0, 1) for _ in variants] for _ in range(population)]
+    window = draws.tail(evolve.SLIDING_WINDOW or len(draws))
+    results = []
+    for pooled in (False, True):
+        pool = TicketPoolCache(evolve.MAX_TICKETS, seed=SEED) if pooled else None
+        if pool is not None:
+            pool.new_window((window.offset, window.stop))
+
+        def run() -> None:
+            for chrom in chromosomes:
+                generate_tickets_from_variants(chrom, variants, window, evolve.MAX_TICKETS, pool, seed=SEED)
+
+        stats = _timed(run, 3)
+        results.append({
+            "pooled": pooled,
+            "chromosomes": population,
+            **stats,
+            "chromosomes_per_s": population / stats["mean_s"],
+        })
+    return results
+
+
+def bench_evolve_window(
+        draws: DrawIndex,
+        children: int = EVOLVE_CHILDREN,
+        backends: tuple[str, ...] = ("list", "array")
+) -> List[dict]:
+    """Children bred, scored and inserted per second by ``evolve_window``."""
+    variants = get_all_strategy_variants()
+    window = draws.tail(evolve.SLIDING_WINDOW or len(draws))
+    results = []
+    for backend in backends:
+        random.seed(SEED)
+        rng = np.random.default_rng(SEED)
+        if backend == "array":
+            population = BitPopulation.random(evolve.POPULATION_SIZE, len(variants), rng)
+        else:
+            population = evolve.initialize_population(len(variants), evolve.POPULATION_SIZE)
+        pool = TicketPoolCache(evolve.MAX_TICKETS, seed=SEED)
+        pool.new_window((window.offset, window.stop))
+        scores, prizes = evolve.score_chromosomes(
+            evolve.as_chromosomes(population), variants, window, pool
+        )
+
+        # a convergence window of at least `children` means the loop runs exactly that long
+        limits = {
+            "MAX_GENERATIONS": children,
+            "CONVERGENCE_WINDOW": max(children, evolve.CONVERGENCE_WINDOW),
+        }
+        with _overridden(evolve, **limits):
+            start = time.perf_counter()
+            _, _, _, _, best_score = evolve.evolve_window(
+                population, scores, prizes, variants, window, pool, rng=rng
+            )
+            elapsed = time.perf_counter() - start
+        results.append({
+            "backend": backend,
+            "population": evolve.POPULATION_SIZE,
+            "children": children,
+            "elapsed_s": elapsed,
+            "children_per_s": children / elapsed,
+            "best_score": best_score,
+        })
+    return results
+
+
+def bench_racing(draws: DrawIndex, children: int = EVOLVE_CHILDREN, window_size: int = RACE_WINDOW) -> List[dict]:
+    """``evolve_window`` on one long window with and without racing children."""
+    variants = get_all_strategy_variants()
+    window = draws.tail(window_size)
+    limits = {
+        "MAX_GENERATIONS": children,
+        "CONVERGENCE_WINDOW": max(children, evolve.CONVERGENCE_WINDOW),
+    }
+    results = []
+    for racing in (False, True):
+        random.seed(SEED)
+        rng = np.random.default_rng(SEED)
+        population = BitPopulation.random(evolve.POPULATION_SIZE, len(variants), rng)
+        pool = TicketPoolCache(evolve.MAX_TICKETS, seed=SEED)
+        pool.new_window((window.offset, window.stop))
+        scores, prizes = evolve.score_chromosomes(
+            evolve.as_chromosomes(population), variants, window, pool
+        )
+        race_stats().take()
+        with _overridden(evolve, **limits):
+            start = time.perf_counter()
+            _, _, _, _, best_score = evolve.evolve_window(
+                population, scores, prizes, variants, window, pool, rng=rng, racing=racing
+            )
+            elapsed = time.perf_counter() - start
+        raced = race_stats().take()
+        results.append({
+            "racing": racing,
+            "window": len(window),
+            "children": children,
+            "elapsed_s": elapsed,
+            "children_per_s": children / elapsed,
+            "best_score": best_score,
+            "stopped": raced.stopped,
+            "matches_skipped": raced.skipped(),
+        })
+    return results
+
+
+def bench_islands(
+        num_draws: int,
+        counts: List[int] = ISLAND_COUNTS,
+        generations: int = ISLAND_GENERATIONS,
+        population: int = ISLAND_POPULATION
+) -> List[dict]:
+    """``run_islands`` on the latest window of a synthetic store, for growing numbers of islands."""
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_synthetic_draws(data_dir, num_draws, SEED)
+        for islands in counts:
+            start = time.perf_counter()
+            _, best_score = run_islands(
+                islands, generations, population, MIGRATION_INTERVAL, MIGRANTS, SEED,
+                data_dir=data_dir,
+            )
+            elapsed = time.perf_counter() - start
+            evaluations = islands * population * (generations + 1)
+            results.append({
+                "islands": islands,
+                "population": population,
+                "generations": generations,
+                "elapsed_s": elapsed,
+                "evaluations_per_s": evaluations / elapsed,
+                "best_score": best_score,
+            })
+    return results
+
+
+def bench_fetch(num_draws: int = FETCH_DRAWS, new_draws: int = FETCH_NEW_DRAWS) -> List[dict]:
+    """
+    ``fetch_and_cache_draws`` against the local stand-in API: a full fetch
+    into an empty cache, then an incremental one after ``new_draws`` more.
+    """
+    payload = synthetic_payload(num_draws, SEED)
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for kind, served in (("full", payload[:-new_draws]), ("incremental", payload)):
+            with StubDrawsAPI(served) as api:
+                start = time.perf_counter()
+                fetched = fetch_and_cache_draws(api.url, data_dir)
+                results.append({
+                    "kind": kind,
+                    "new_draws": fetched,
+                    "requests": api.requests_served,
+                    "elapsed_s": time.perf_counter() - start,
+                })
+    return results
+
+
+def run_all(num_draws: int = max(FITNESS_SIZES), seed: int = SEED) -> dict:
+    """Run every benchmark on ``num_draws`` synthetic draws."""
+    draws = build_draw_index(synthetic_draws_df(num_draws, seed))
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "draws": num_draws,
+            "seed": seed,
+        },
+        "strategies": bench_strategies(draws),
+        "fitness": bench_fitness(draws),
+        "ticket_generation": bench_ticket_generation(draws),
+        "evolve_window": bench_evolve_window(draws),
+        "racing": bench_racing(draws),
+        "islands": bench_islands(num_draws),
+        "fetch": bench_fetch(),
+    }
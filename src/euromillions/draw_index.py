@@ -0,0 +1,159 @@
+"""Compact NumPy index over the draw history.
+
+The cache already stores draws as flat columns (see ``storage``), but
+the GA loop wants them as fixed-width arrays with hit matrices, bitmasks
+and a dense prize table, so the history is converted once.  Raw
+API-shaped frames (nested ``numbers``/``stars`` lists and a list of prize
+dicts per draw) are accepted too.  Slicing a ``DrawIndex`` with a
+contiguous range returns views, never copies.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from euromillions.ticket_masks import number_masks, star_masks
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+NUMBER_COUNT = 50
+STAR_COUNT = 12
+NUMBERS_PER_DRAW = 5
+STARS_PER_DRAW = 2
+
+NUMBER_COLUMNS = [f"n{i}" for i in range(1, NUMBERS_PER_DRAW + 1)]
+STAR_COLUMNS = [f"s{i}" for i in range(1, STARS_PER_DRAW + 1)]
+
+
+@dataclass(frozen=True)
+class DrawIndex:
+    numbers: np.ndarray      # (N, 5)  int8, in drawn order
+    stars: np.ndarray        # (N, 2)  int8, in drawn order
+    number_hits: np.ndarray  # (N, 50) bool, column n-1 set if n was drawn
+    star_hits: np.ndarray    # (N, 12) bool, column s-1 set if s was drawn
+    prizes: np.ndarray       # (N, 6, 3) float64, [draw, matched_numbers, matched_stars]
+    number_masks: np.ndarray  # (N,) uint64, bit n-1 set if n was drawn
+    star_masks: np.ndarray    # (N,) uint16, bit s-1 set if s was drawn
+    offset: int = 0          # position of the first row within the full history
+    history: DrawIndex | None = field(default=None, compare=False, repr=False)
+    cache: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    @property
+    def stop(self) -> int:
+        """Position just past the last row within the full history."""
+        return self.offset + len(self)
+
+    @property
+    def root(self) -> DrawIndex:
+        """The full history this index is a view of."""
+        return self if self.history is None else self.history
+
+    def __getitem__(self, key: slice) -> DrawIndex:
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("DrawIndex only supports contiguous slices")
+        start, _, _ = key.indices(len(self))
+        return DrawIndex(
+            numbers=self.numbers[key],
+            stars=self.stars[key],
+            number_hits=self.number_hits[key],
+            star_hits=self.star_hits[key],
+            prizes=self.prizes[key],
+            number_masks=self.number_masks[key],
+            star_masks=self.star_masks[key],
+            offset=self.offset + start,
+            history=self.root,
+            cache=self.cache,
+        )
+
+    def tail(self, n: int | None) -> DrawIndex:
+        """Last ``n`` draws (all of them when ``n`` is None or too large)."""
+        if n is None or n >= len(self):
+            return self
+        return self[len(self) - n:]
+
+
+def _fill_prizes(
+        prizes: np.ndarray,
+        rows: np.ndarray,
+        matched_numbers: np.ndarray,
+        matched_stars: np.ndarray,
+        values: np.ndarray
+) -> None:
+    cells = np.ravel_multi_index((rows, matched_numbers, matched_stars), prizes.shape)
+    # the first tier listed for a cell wins, as in the old lookup
+    cells, first = np.unique(cells, return_index=True)
+    prizes.flat[cells] = values[first]
+
+
+def _raw_arrays(draws_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """numbers, stars and prizes of an API-shaped frame."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    size = len(draws_df)
+    numbers = np.array(draws_df["numbers"].tolist()).astype(np.int8).reshape(size, NUMBERS_PER_DRAW)
+    stars = np.array(draws_df["stars"].tolist()).astype(np.int8).reshape(size, STARS_PER_DRAW)
+    prizes = np.zeros((size, NUMBERS_PER_DRAW + 1, STARS_PER_DRAW + 1), dtype=np.float64)
+    if "prizes" in draws_df and size:
+        lists = pa.array(draws_df["prizes"], from_pandas=True)
+        tiers = pc.list_flatten(lists)
+        _fill_prizes(
+            prizes,
+            pc.list_parent_indices(lists).to_numpy(),
+            pc.struct_field(tiers, "matched_numbers").to_numpy(),
+            pc.struct_field(tiers, "matched_stars").to_numpy(),
+            pc.fill_null(pc.struct_field(tiers, "prize"), 0.0).to_numpy(),
+        )
+    return numbers, stars, prizes
+
+
+def build_draw_index(draws_df: pd.DataFrame, prizes_df: pd.DataFrame | None = None) -> DrawIndex:
+    """
+    Convert a draws frame into a ``DrawIndex``: either normalized columns
+    (``n1``..``s2``, with prize tiers from ``prizes_df``; see ``storage``)
+    or a raw API-shaped frame carrying its own prizes.
+    """
+    if "numbers" in draws_df:
+        numbers, stars, prizes = _raw_arrays(draws_df)
+    else:
+        numbers = draws_df[NUMBER_COLUMNS].to_numpy(np.int8)
+        stars = draws_df[STAR_COLUMNS].to_numpy(np.int8)
+        prizes = np.zeros((len(draws_df), NUMBERS_PER_DRAW + 1, STARS_PER_DRAW + 1), dtype=np.float64)
+        if prizes_df is not None and len(prizes_df) and len(draws_df):
+            ids = draws_df["id"].to_numpy()
+            draw_ids = prizes_df["draw_id"].to_numpy()
+            order = np.argsort(ids, kind="stable")
+            at = np.minimum(np.searchsorted(ids, draw_ids, sorter=order), len(ids) - 1)
+            rows = order[at]
+            known = ids[rows] == draw_ids  # tiers of draws outside this frame are skipped
+            _fill_prizes(
+                prizes,
+                rows[known],
+                prizes_df["matched_numbers"].to_numpy()[known],
+                prizes_df["matched_stars"].to_numpy()[known],
+                prizes_df["prize"].to_numpy()[known],
+            )
+
+    size = len(numbers)
+    rows = np.arange(size)[:, None]
+    number_hits = np.zeros((size, NUMBER_COUNT), dtype=bool)
+    number_hits[rows, numbers - 1] = True
+    star_hits = np.zeros((size, STAR_COUNT), dtype=bool)
+    star_hits[rows, stars - 1] = True
+
+    return DrawIndex(
+        numbers, stars, number_hits, star_hits, prizes, number_masks(numbers), star_masks(stars)
+    )
+
+
+def as_draw_index(draws: DrawIndex | pd.DataFrame) -> DrawIndex:
+    """Accept either a ``DrawIndex`` or a draws frame (normalized without prizes, or raw)."""
+    if isinstance(draws, DrawIndex):
+        return draws
+    return build_draw_index(draws)
@@ -1,19 +1,110 @@
-import pandas as pd
-import requests
+"""Cached draw data.
 
-DRAW_URL = "https://euromillions.api.pedromealha.dev/v1/draws"
-DRAW_PATH = "data/draws.parquet"
-PRIZE_PATH = "data/prizes.parquet"
+The cache under ``DATA_DIR`` is the normalized, memory-mapped layout of
+``storage``; a cache in the old raw ``draws.parquet`` form is converted
+the first time it is read.
 
-def fetch_and_cache_draws():
-    response = requests.get(DRAW_URL)
-    draws = response.json()
-    draws_df = pd.DataFrame(draws)
-    draws_df.to_parquet(DRAW_PATH)
-    draws_df.to_parquet(PRIZE_PATH)  # assuming same for placeholder
+``fetch_and_cache_draws`` is incremental: it asks the API only for the
+years from the latest cached draw onwards, one request per year over a
+pooled, retrying session, merges the answers into the cache by draw
+``id`` and replaces the store atomically.  Point ``EUROMILLIONS_DRAW_URL``
+at ``stub_api`` to fetch without a network.
 
-def load_draws_df():
-    return pd.read_parquet(DRAW_PATH)
+pandas and requests are imported by the functions that use them, so
+commands that only read the cache through pyarrow start quickly.
+"""
+from __future__ import annotations
 
-def load_prizes_df():
-    return pd.read_parquet(PRIZE_PATH)
+import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from euromillions.draw_index import DrawIndex, build_draw_index
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import requests
+
+DRAW_URL = os.environ.get("EUROMILLIONS_DRAW_URL", "https://euromillions.api.pedromealha.dev/v1/draws")
+DATA_DIR = os.environ.get("EUROMILLIONS_DATA_DIR", "data")  # point at synthetic data for scale tests
+
+FIRST_DRAW_YEAR = 2004
+FETCH_TIMEOUT = (5, 60)  # seconds to connect, seconds between bytes
+FETCH_RETRIES = 3  # per request, with exponential backoff, on errors and 429/5xx
+FETCH_WORKERS = 4  # years fetched concurrently
+
+def _session() -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=FETCH_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _fetch_year(session: requests.Session, url: str, year: int) -> list[dict]:
+    response = session.get(url, params={"year": year}, timeout=FETCH_TIMEOUT)
+    if response.status_code == 404:  # no draws that year (yet)
+        return []
+    response.raise_for_status()
+    return response.json()
+
+def fetch_and_cache_draws(url: str = DRAW_URL, data_dir: str = DATA_DIR) -> int:
+    """Bring the cache in ``data_dir`` up to date; returns the number of new draws."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from euromillions import storage
+
+    cached = None
+    if storage.has_store(data_dir) or storage.migrate_legacy(data_dir):
+        cached = storage.read_draws(data_dir), storage.read_prizes(data_dir)
+
+    # the latest cached year is fetched again: it may have had draws since
+    first_year = FIRST_DRAW_YEAR
+    if cached is not None and cached[0].num_rows:
+        first_year = pc.max(cached[0]["date"]).as_py().year
+    years = range(first_year, datetime.date.today().year + 1)
+
+    with _session() as session, ThreadPoolExecutor(FETCH_WORKERS) as pool:
+        pages = list(pool.map(lambda year: _fetch_year(session, url, year), years))
+    fetched = [draw for page in pages for draw in page]
+    if not fetched:
+        return 0
+
+    if cached is None:
+        cached = storage.empty_store()
+    merged = storage.merge(cached, storage.normalize(pa.Table.from_pylist(fetched)))
+    storage.write_store(data_dir, *merged)
+    return merged[0].num_rows - cached[0].num_rows
+
+def load_draws_df() -> pd.DataFrame:
+    """Draws as flat columns (see ``storage``), ordered by date."""
+    return load_draws_table().to_pandas(date_as_object=False)
+
+def load_draws_table(columns: list[str] | None = None) -> pa.Table:
+    """The memory-mapped draws table, without going through pandas."""
+    from euromillions.storage import read_draws
+
+    return read_draws(DATA_DIR, columns)
+
+def load_prizes_df() -> pd.DataFrame:
+    """Prize tiers in long form: one row per (draw_id, matched_numbers, matched_stars)."""
+    from euromillions.storage import read_prizes
+
+    return read_prizes(DATA_DIR).to_pandas()
+
+def load_draw_history() -> tuple[pd.DataFrame, DrawIndex]:
+    """Load the draws frame together with its compact NumPy index."""
+    draws_df = load_draws_df()
+    return draws_df, build_draw_index(draws_df, load_prizes_df())
@@ -0,0 +1,25 @@
+"""Explicit random streams for strategy variants.
+
+Every variant draws from its own ``random.Random`` derived from
+(run seed, draw index, variant id).  Within one draw window all
+chromosomes that share a variant therefore get identical tickets from it
+(common random numbers), scoring is deterministic, and any process can
+rebuild the same stream without sharing state.
+"""
+import random
+
+
+def variant_rng(seed: int, draw_idx: int, variant_id: str) -> random.Random:
+    """The stream for ``variant_id`` when predicting draw ``draw_idx``."""
+    # str seeds are hashed with SHA-512, so this is stable across processes and runs
+    return random.Random(f"{seed}:{draw_idx}:{variant_id}")
+
+
+def variant_id(gen_fn) -> str:
+    """Stable id of a strategy variant: the name given to it by its factory."""
+    return gen_fn.__name__
+
+
+def ensure_rng(rng: random.Random | None) -> random.Random:
+    """``rng``, or a freshly seeded stream for callers that do not care."""
+    return rng if rng is not None else random.Random()
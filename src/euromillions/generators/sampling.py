@@ -0,0 +1,71 @@
+"""Weighted sampling without replacement for the weighted strategies.
+
+Drawing balls one at a time in proportion to their weights and rejecting
+repeats is the same distribution as the Gumbel top-k trick: add
+independent Gumbel noise to each log-weight and keep the k largest.  The
+latter needs no retries however skewed the weights are, and draws a whole
+batch of tickets in one vectorised call.
+
+The strategies keep taking a ``random.Random``; ``numpy_rng`` derives a
+NumPy generator from it, so tickets stay reproducible from the variant's
+stream (see ``generators.rng``).
+"""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from euromillions.draw_index import NUMBERS_PER_DRAW, STAR_COUNT, STARS_PER_DRAW
+from euromillions.generators.ticket_arrays import TicketArrays
+
+
+def numpy_rng(rng: random.Random) -> np.random.Generator:
+    """A NumPy generator seeded from the next 128 bits of ``rng``."""
+    return np.random.default_rng(rng.getrandbits(128))
+
+
+class WeightedSampler:
+    """Draws k distinct values from 1..len(weights) in proportion to ``weights``."""
+
+    def __init__(self, weights: np.ndarray) -> None:
+        with np.errstate(divide="ignore"):
+            self.log_weights = np.log(np.asarray(weights, dtype=float))
+
+    def sample(self, rng: np.random.Generator, rows: int, k: int) -> np.ndarray:
+        """(rows, k) int8 array of values, each row sorted ascending."""
+        keys = self.log_weights + rng.gumbel(size=(rows, len(self.log_weights)))
+        picked = (np.argpartition(-keys, k - 1, axis=1)[:, :k] + 1).astype(np.int8)
+        picked.sort(axis=1)
+        return picked
+
+
+def sample_rows(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+    """
+    One index per row of ``weights`` (rows, K), drawn in proportion to that
+    row; every row needs a positive total.
+    """
+    cum = weights.cumsum(axis=1)
+    u = rng.random(len(weights)) * cum[:, -1]
+    # zero-weight entries repeat the previous cumulative value, so are never chosen;
+    # if u rounds up to the total, fall back to the row's last positive entry
+    last = weights.shape[1] - 1 - (weights[:, ::-1] > 0).argmax(axis=1)
+    return np.minimum((cum <= u[:, None]).sum(axis=1), last)
+
+
+def uniform_stars(rng: np.random.Generator, rows: int) -> np.ndarray:
+    """(rows, 2) sorted stars, each pair uniform over the 66 possible."""
+    return WeightedSampler(np.ones(STAR_COUNT)).sample(rng, rows, STARS_PER_DRAW)
+
+
+def weighted_tickets(
+        num_weights: np.ndarray,
+        star_weights: np.ndarray,
+        num_tickets: int,
+        rng: random.Random
+) -> TicketArrays:
+    """``num_tickets`` tickets of 5 numbers and 2 stars drawn by weight, as arrays."""
+    gen = numpy_rng(rng)
+    nums = WeightedSampler(num_weights).sample(gen, num_tickets, NUMBERS_PER_DRAW)
+    stars = WeightedSampler(star_weights).sample(gen, num_tickets, STARS_PER_DRAW)
+    return nums, stars
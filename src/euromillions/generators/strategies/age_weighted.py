@@ -1,51 +1,27 @@
 import random
-import pandas as pd
 
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import weighted_tickets
+from euromillions.generators.ticket_arrays import array_generator
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
 
 def age_weighted_generator_factory(exponent: float = 1.0):
     """Generate tickets giving more weight to numbers not drawn recently."""
 
-    def generator(draws_df: pd.DataFrame, num_tickets: int):
-        numbers = list(range(1, 51))
-        stars = list(range(1, 13))
-
-        age_nums = {n: len(draws_df) for n in numbers}
-        age_stars = {s: len(draws_df) for s in stars}
-        seen_nums: set[int] = set()
-        seen_stars: set[int] = set()
-
-        for age, (_, row) in enumerate(draws_df.iloc[::-1].iterrows()):
-            for n in row["numbers"]:
-                n = int(n)
-                if n not in seen_nums:
-                    age_nums[n] = age
-                    seen_nums.add(n)
-            for s in row["stars"]:
-                s = int(s)
-                if s not in seen_stars:
-                    age_stars[s] = age
-                    seen_stars.add(s)
-            if len(seen_nums) == 50 and len(seen_stars) == 12:
-                break
-
-        num_weights = [(age_nums[n] + 1) ** exponent for n in numbers]
-        star_weights = [(age_stars[s] + 1) ** exponent for s in stars]
-
-        tickets = []
-        for _ in range(num_tickets):
-            picked_nums = set()
-            while len(picked_nums) < 5:
-                picked_nums.add(random.choices(numbers, weights=num_weights, k=1)[0])
-            picked_stars = set()
-            while len(picked_stars) < 2:
-                picked_stars.add(random.choices(stars, weights=star_weights, k=1)[0])
-            tickets.append((sorted(picked_nums), sorted(picked_stars)))
-        return tickets
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        age_nums, age_stars = rolling_stats(draws).ages(draws)
+        num_weights = (age_nums + 1) ** exponent
+        star_weights = (age_stars + 1) ** exponent
+        return weighted_tickets(num_weights, star_weights, num_tickets, rng)
 
     generator.__name__ = f"age_weighted_exp{exponent}"
     return generator
 
 
 def get_variants() -> list[callable]:
-    exps = [0.2, 0.7, 1.3, 2.0, 3.0]
-    return [age_weighted_generator_factory(e) for e in exps]
+    return family_variants("age_weighted")
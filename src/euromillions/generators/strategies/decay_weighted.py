@@ -1,37 +1,22 @@
 import random
-import pandas as pd
+
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import weighted_tickets
+from euromillions.generators.ticket_arrays import array_generator
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
 
 
 def decay_weighted_generator_factory(decay: float = 0.95, window: int | None = None):
     """Exponential decay weighting of past draws."""
 
-    def generator(draws_df: pd.DataFrame, num_tickets: int):
-        df = draws_df if window is None else draws_df.tail(window)
-        numbers = list(range(1, 51))
-        stars = list(range(1, 13))
-
-        num_scores = {n: 0.0 for n in numbers}
-        star_scores = {s: 0.0 for s in stars}
-        for age, (_, row) in enumerate(df.iloc[::-1].iterrows()):
-            factor = decay ** age
-            for n in row["numbers"]:
-                num_scores[int(n)] += factor
-            for s in row["stars"]:
-                star_scores[int(s)] += factor
-
-        num_weights = [num_scores[n] + 1e-6 for n in numbers]
-        star_weights = [star_scores[s] + 1e-6 for s in stars]
-
-        tickets = []
-        for _ in range(num_tickets):
-            nums = set()
-            while len(nums) < 5:
-                nums.add(random.choices(numbers, weights=num_weights, k=1)[0])
-            stars_pick = set()
-            while len(stars_pick) < 2:
-                stars_pick.add(random.choices(stars, weights=star_weights, k=1)[0])
-            tickets.append((sorted(nums), sorted(stars_pick)))
-        return tickets
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        num_scores, star_scores = rolling_stats(draws).decay_scores(draws, decay, window)
+        return weighted_tickets(num_scores + 1e-6, star_scores + 1e-6, num_tickets, rng)
 
     w_name = "all" if window is None else str(window)
     generator.__name__ = f"decay{decay}_w{w_name}"
@@ -39,6 +24,4 @@ def decay_weighted_generator_factory(decay: float = 0.95, window: int | None = N
 
 
 def get_variants() -> list[callable]:
-    decays = [0.85, 0.9, 0.93, 0.95, 0.98]
-    windows = [None, 10, 20, 50, 100]
-    return [decay_weighted_generator_factory(d, w) for d in decays for w in windows]
+    return family_variants("decay_weighted")
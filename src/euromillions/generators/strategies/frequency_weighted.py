@@ -1,47 +1,26 @@
 import random
-from collections import Counter
-import pandas as pd
 
-WINDOW_SIZES = [5, 10, 15, 20, 30, 50, 100]
-EXPONENTS    = [0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0]
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import weighted_tickets
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.generators.ticket_arrays import array_generator
+from euromillions.rolling_stats import rolling_stats
 
-def frequency_weighted_generator_factory(window_size: int, exponent: float):
-    def generator(draws_df: pd.DataFrame, num_tickets: int):
-        df = draws_df.iloc[-window_size:] if window_size and len(draws_df) > window_size else draws_df
-
-        num_counts, star_counts = Counter(), Counter()
-        for _, row in df.iterrows():
-            for n in row["numbers"]:
-                num_counts[int(n)] += 1
-            for s in row["stars"]:
-                star_counts[int(s)] += 1
-
-        numbers = list(range(1, 51))
-        stars   = list(range(1, 13))
 
-        num_weights  = [(num_counts[n] ** exponent) + 1 for n in numbers]
-        star_weights = [(star_counts[s] ** exponent) + 1 for s in stars]
-
-        tickets = []
-        for _ in range(num_tickets):
-            picked_nums = set()
-            while len(picked_nums) < 5:
-                picked_nums.add(random.choices(numbers, weights=num_weights, k=1)[0])
-            picked_stars = set()
-            while len(picked_stars) < 2:
-                picked_stars.add(random.choices(stars, weights=star_weights, k=1)[0])
-
-            tickets.append((sorted(picked_nums), sorted(picked_stars)))
+def frequency_weighted_generator_factory(window_size: int, exponent: float):
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        num_counts, star_counts = rolling_stats(draws).counts(draws, window_size or None)
 
-        return tickets
+        num_weights = (num_counts ** exponent) + 1
+        star_weights = (star_counts ** exponent) + 1
+        return weighted_tickets(num_weights, star_weights, num_tickets, rng)
 
     generator.__name__ = f"freq_w{window_size}_exp{exponent}"
     return generator
 
 def get_variants() -> list[callable]:
-    variants = []
-    for w in WINDOW_SIZES:
-        for e in EXPONENTS:
-            variants.append(frequency_weighted_generator_factory(w, e))
-    print(f"Generated {len(variants)} frequency-weighted variants with window sizes {WINDOW_SIZES} and exponents {EXPONENTS}.")
-    return variants
+    return family_variants("frequency_weighted")
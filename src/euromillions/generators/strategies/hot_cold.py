@@ -1,14 +1,19 @@
-import pandas as pd
-from collections import Counter
+import random
+
+import numpy as np
+
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
 
 def get_variants(window_sizes=None):
     """
     Return a list of generator functions, one per window size.
-    Each generator must accept (draws_df, max_tickets)
+    Each generator must accept (draws, max_tickets[, rng])
     and return a list of up to max_tickets (numbers, stars) tuples.
     """
     if window_sizes is None:
-        window_sizes = [13, 21, 34, 55, 89, 144, 233]  # big Fibonacci numbers
+        return family_variants("hot_cold")
 
     variants = []
     for w in window_sizes:
@@ -16,23 +21,31 @@ def get_variants(window_sizes=None):
     return variants
 
 
+def _most_common(counts: np.ndarray, ages: np.ndarray, limit: int) -> list[int]:
+    """Balls seen in the window by descending frequency, most recently drawn first on ties."""
+    order = np.lexsort((ages, -counts))
+    order = order[counts[order] > 0]
+    return (order[:limit] + 1).tolist()
+
+
 def hot_cold_generator_factory(window: int):
     """
     Build a generator that looks at the last `window` draws,
     counts frequency of each ball, then picks the hottest ones.
     """
 
-    def generator(draws_df: pd.DataFrame, max_tickets: int):
-        # we only need the last `window` draws
-        recent = draws_df.tail(window)
+    def generator(draws: DrawIndex, max_tickets: int, rng: random.Random | None = None):
+        # deterministic: `rng` is accepted for the common signature and ignored
+        draws = as_draw_index(draws)
+        stats = rolling_stats(draws)
 
-        # count how often each number/stars appeared
-        num_counts = Counter(n for row in recent["numbers"] for n in row)
-        star_counts = Counter(s for row in recent["stars"]   for s in row)
+        # how often each number/star appeared in the last `window` draws
+        num_counts, star_counts = stats.counts(draws, window)
+        num_ages, star_ages = stats.ages(draws)
 
         # sort balls by descending frequency
-        hottest_nums = [n for n, _ in num_counts.most_common(5 * max_tickets)]
-        hottest_stars = [s for s, _ in star_counts.most_common(2 * max_tickets)]
+        hottest_nums = _most_common(num_counts, num_ages, 5 * max_tickets)
+        hottest_stars = _most_common(star_counts, star_ages, 2 * max_tickets)
 
         tickets = []
         # emit up to max_tickets distinct tickets by slicing
@@ -43,4 +56,5 @@ def hot_cold_generator_factory(window: int):
                 tickets.append((nums, stars))
         return tickets
 
+    generator.__name__ = f"hot_cold_w{window}"
     return generator
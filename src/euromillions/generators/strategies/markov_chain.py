@@ -1,14 +1,19 @@
 # src/euromillions/generators/strategies/markov_chain.py
 
 import random
-from collections import Counter
-from typing import List, Tuple, Callable, Optional
-import pandas as pd
+from typing import List, Callable, Optional
+
+import numpy as np
+
+from euromillions.draw_index import NUMBER_COUNT, NUMBERS_PER_DRAW, DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import WeightedSampler, numpy_rng, sample_rows, uniform_stars
+from euromillions.generators.ticket_arrays import TicketArrays, array_generator
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
 
-# A single ticket: (five numbers, two stars)
-Ticket = Tuple[List[int], List[int]]
 # Signature for ticket generators matching the other strategies
-Generator = Callable[[pd.DataFrame, int], List[Ticket]]
+Generator = Callable[[DrawIndex, int, Optional[random.Random]], TicketArrays]
 
 
 def markov_chain_generator_factory(
@@ -28,52 +33,43 @@ def markov_chain_generator_factory(
 
     for W in window_sizes:
         def make_generator(window: int):
-            def generator(history: pd.DataFrame, max_tickets: int) -> List[Ticket]:
-                """Generate up to ``max_tickets`` using a simple Markov chain."""
-                tickets: List[Ticket] = []
+            @array_generator
+            def generator(
+                    history: DrawIndex,
+                    max_tickets: int,
+                    rng: Optional[random.Random] = None
+            ) -> TicketArrays:
+                """Generate ``max_tickets`` tickets, walking the chain for all of them at once."""
+                rng = ensure_rng(rng)
+                history = as_draw_index(history)
+                gen = numpy_rng(rng)
                 # Need at least two draws to build transitions
                 if len(history) < 2:
-                    for _ in range(max_tickets):
-                        nums = random.sample(range(1, 51), 5)
-                        stars = random.sample(range(1, 13), 2)
-                        tickets.append((nums, stars))
-                    return tickets
-
-                # Only last window+1 draws
-                df_w = history if len(history) <= window + 1 else history.iloc[-(window + 1):]
-
-                # Build transition counts: from draw_i → draw_{i+1}
-                trans: dict[int, Counter] = {i: Counter() for i in range(1, 51)}
-                num_lists = df_w["numbers"].tolist()
-                for prev, curr in zip(num_lists, num_lists[1:]):
-                    for x in prev:
-                        for y in curr:
-                            trans[int(x)][int(y)] += 1
-
-                last_nums = history.iloc[-1]["numbers"]
-                for _ in range(max_tickets):
-                    seed = random.choice(last_nums)
-                    picked = [int(seed)]
-                    pool = set(range(1, 51)) - set(picked)
-
-                    # Walk the chain to pick 4 more numbers
-                    for _ in range(4):
-                        candidates = list(pool)
-                        weights = [
-                            trans[picked[-1]].get(num, 0) + pseudocount
-                            for num in candidates
-                        ]
-                        if sum(weights) <= 0:
-                            nxt = random.choice(candidates)
-                        else:
-                            nxt = random.choices(candidates, weights, k=1)[0]
-                        picked.append(nxt)
-                        pool.remove(nxt)
-
-                    stars = random.sample(range(1, 13), 2)
-                    tickets.append((picked, stars))
-
-                return tickets
+                    nums = WeightedSampler(np.ones(NUMBER_COUNT)).sample(gen, max_tickets, NUMBERS_PER_DRAW)
+                    return nums, uniform_stars(gen, max_tickets)
+
+                # Transition counts over the last window+1 draws:
+                # trans[x-1, y-1] counts x in draw_i → y in draw_{i+1}
+                trans = rolling_stats(history).transitions(history, window) + pseudocount
+
+                rows = np.arange(max_tickets)
+                picked = np.zeros((max_tickets, NUMBER_COUNT), dtype=bool)
+                last_nums = history.numbers[-1].astype(np.int64) - 1
+                current = last_nums[gen.integers(len(last_nums), size=max_tickets)]
+                picked[rows, current] = True
+
+                # Walk the chain to pick 4 more numbers: each step looks up the
+                # row of every ticket's last pick and masks what it already holds;
+                # a row with no weight left falls back to a uniform choice
+                for _ in range(NUMBERS_PER_DRAW - 1):
+                    weights = np.where(picked, 0.0, trans[current])
+                    dead = weights.sum(axis=1) <= 0
+                    weights[dead] = ~picked[dead]
+                    current = sample_rows(gen, weights)
+                    picked[rows, current] = True
+
+                nums = (np.nonzero(picked)[1].reshape(max_tickets, NUMBERS_PER_DRAW) + 1).astype(np.int8)
+                return nums, uniform_stars(gen, max_tickets)
 
             generator.__name__ = f"markov_chain_W{window}"
             return generator
@@ -83,5 +79,10 @@ def markov_chain_generator_factory(
     return variants
 
 
-# alias for registry
-get_variants = markov_chain_generator_factory
+def markov_chain_generator(window: int, pseudocount: float = 1.0) -> Generator:
+    """The single-window variant, as listed in the registry."""
+    return markov_chain_generator_factory([window], pseudocount)[0]
+
+
+def get_variants() -> List[Generator]:
+    return family_variants("markov_chain")
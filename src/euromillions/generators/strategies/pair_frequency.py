@@ -1,54 +1,85 @@
 import random
-from collections import Counter
-import pandas as pd
+
+import numpy as np
+
+from euromillions.draw_index import NUMBER_COUNT, NUMBERS_PER_DRAW, DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import numpy_rng, sample_rows, uniform_stars
+from euromillions.generators.ticket_arrays import array_generator
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
+
+
+def _walk(gen: np.random.Generator, num_tickets: int, first_weights: np.ndarray, next_weights) -> np.ndarray:
+    """
+    Pick 5 numbers for every ticket at once: the first by ``first_weights``,
+    each later one by ``next_weights(picked, count)`` over the numbers not yet
+    taken.  ``picked`` is a (tickets, 50) 0/1 matrix of the ``count`` numbers
+    chosen so far.
+    """
+    picked = np.zeros((num_tickets, NUMBER_COUNT))
+    rows = np.arange(num_tickets)
+    weights = np.broadcast_to(first_weights, picked.shape)
+    for count in range(1, NUMBERS_PER_DRAW + 1):
+        choice = sample_rows(gen, weights)
+        picked[rows, choice] = 1
+        if count < NUMBERS_PER_DRAW:
+            weights = np.where(picked > 0, 0.0, next_weights(picked, count))
+    nums = np.nonzero(picked)[1].reshape(num_tickets, NUMBERS_PER_DRAW) + 1
+    return nums.astype(np.int8)
 
 
 def pair_frequency_generator_factory(window: int | None = None):
     """Weight choices by historical pair frequencies."""
 
-    def generator(draws_df: pd.DataFrame, num_tickets: int):
-        df = draws_df if window is None else draws_df.tail(window)
-
-        pair_counts: Counter[frozenset[int]] = Counter()
-        base_counts: Counter[int] = Counter()
-
-        for _, row in df.iterrows():
-            nums = [int(n) for n in row["numbers"]]
-            base_counts.update(nums)
-            for i in range(len(nums)):
-                for j in range(i + 1, len(nums)):
-                    pair = frozenset({nums[i], nums[j]})
-                    pair_counts[pair] += 1
-
-        numbers = list(range(1, 51))
-
-        tickets = []
-        for _ in range(num_tickets):
-            picked = set()
-            weights = [base_counts[n] + 1 for n in numbers]
-            first = random.choices(numbers, weights=weights, k=1)[0]
-            picked.add(first)
-
-            while len(picked) < 5:
-                candidates = [n for n in numbers if n not in picked]
-                cand_w = []
-                for n in candidates:
-                    w = 1
-                    for p in picked:
-                        w += pair_counts[frozenset({n, p})]
-                    cand_w.append(w)
-                nxt = random.choices(candidates, weights=cand_w, k=1)[0]
-                picked.add(nxt)
-
-            stars = random.sample(range(1, 13), 2)
-            tickets.append((sorted(picked), sorted(stars)))
-        return tickets
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        # off-diagonal entries count pairs, the diagonal counts single numbers
+        pairs = rolling_stats(draws).pair_counts(draws, window)
+        off_diagonal = pairs - np.diag(pairs.diagonal())
+
+        gen = numpy_rng(rng)
+        # a candidate's weight is 1 + its pair counts with every number already picked
+        nums = _walk(gen, num_tickets, pairs.diagonal() + 1.0, lambda picked, _: 1.0 + picked @ off_diagonal)
+        return nums, uniform_stars(gen, num_tickets)
 
     w_name = "all" if window is None else str(window)
     generator.__name__ = f"pair_freq_w{w_name}"
     return generator
 
 
+def triple_frequency_generator_factory(window: int | None = None):
+    """Like pair frequency, but later picks are weighted by triples with the numbers already picked."""
+
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        triples = rolling_stats(draws).triple_counts(draws, window)
+        pairs = np.einsum("aab->ab", triples)
+        off_diagonal = pairs - np.diag(pairs.diagonal())
+
+        flat = triples.reshape(NUMBER_COUNT, -1).astype(float)
+
+        def next_weights(picked: np.ndarray, count: int) -> np.ndarray:
+            if count == 1:
+                return 1.0 + picked @ off_diagonal
+            # sum of counts[a, b, c] over unordered pairs {a, b} of picked numbers:
+            # all ordered pairs, minus those with a == b, halved
+            by_first = (picked @ flat).reshape(len(picked), NUMBER_COUNT, NUMBER_COUNT)
+            ordered = np.einsum("tb,tbc->tc", picked, by_first)
+            return 1.0 + (ordered - picked @ pairs) / 2
+
+        gen = numpy_rng(rng)
+        nums = _walk(gen, num_tickets, pairs.diagonal() + 1.0, next_weights)
+        return nums, uniform_stars(gen, num_tickets)
+
+    w_name = "all" if window is None else str(window)
+    generator.__name__ = f"triple_freq_w{w_name}"
+    return generator
+
+
 def get_variants() -> list[callable]:
-    windows = [None, 5, 8, 13, 21, 34]
-    return [pair_frequency_generator_factory(w) for w in windows]
+    return family_variants("pair_frequency")
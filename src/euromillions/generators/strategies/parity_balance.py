@@ -1,22 +1,33 @@
 import random
-import pandas as pd
 
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
 
-def parity_balance_generator(draws_df: pd.DataFrame, num_tickets: int):
+
+def parity_balance_generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
     """Generate tickets matching the most common even/odd split."""
-    even_counts = draws_df["numbers"].apply(lambda ns: sum(1 for n in ns if int(n) % 2 == 0))
-    target_even = int(even_counts.mode()[0]) if not even_counts.empty else 2
+    rng = ensure_rng(rng)
+    draws = as_draw_index(draws)
+    splits = rolling_stats(draws).even_splits(draws)
+    # argmax picks the smallest split on ties, like Series.mode()[0]
+    target_even = int(splits.argmax()) if len(draws) else 2
 
     evens = [n for n in range(1, 51) if n % 2 == 0]
     odds = [n for n in range(1, 51) if n % 2 == 1]
 
     tickets = []
     for _ in range(num_tickets):
-        nums = random.sample(evens, target_even) + random.sample(odds, 5 - target_even)
-        stars = random.sample(range(1, 13), 2)
+        nums = rng.sample(evens, target_even) + rng.sample(odds, 5 - target_even)
+        stars = rng.sample(range(1, 13), 2)
         tickets.append((sorted(nums), sorted(stars)))
     return tickets
 
 
+def parity_balance_generator_factory():
+    return parity_balance_generator
+
+
 def get_variants() -> list[callable]:
-    return [parity_balance_generator]
+    return family_variants("parity_balance")
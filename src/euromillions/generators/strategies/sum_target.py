@@ -1,32 +1,100 @@
+import math
 import random
-import pandas as pd
+from functools import lru_cache
+
+import numpy as np
+
+from euromillions.draw_index import NUMBER_COUNT, NUMBERS_PER_DRAW, DrawIndex, as_draw_index
+from euromillions.generators.rng import ensure_rng
+from euromillions.generators.sampling import numpy_rng, uniform_stars
+from euromillions.generators.ticket_arrays import array_generator
+from euromillions.generators.strategy_registry import family_variants
+from euromillions.rolling_stats import rolling_stats
+
+MAX_SUM = sum(range(NUMBER_COUNT - NUMBERS_PER_DRAW + 1, NUMBER_COUNT + 1))
+
+
+@lru_cache(maxsize=None)
+def subset_sum_counts() -> np.ndarray:
+    """``ways[n, k, s]``: how many k-subsets of 1..n sum to s (n <= 50, k <= 5)."""
+    ways = np.zeros((NUMBER_COUNT + 1, NUMBERS_PER_DRAW + 1, MAX_SUM + 1), dtype=np.int64)
+    ways[:, 0, 0] = 1
+    for n in range(1, NUMBER_COUNT + 1):
+        ways[n] = ways[n - 1]
+        ways[n, 1:, n:] += ways[n - 1, :-1, :-n]
+    return ways
+
+
+def sum_band(mean: float, std: float, tolerance: float) -> tuple[int, int]:
+    """
+    Inclusive range of ticket sums within ``tolerance * std`` of ``mean``;
+    every sum when there is no mean (an empty window).
+    """
+    if math.isnan(mean):
+        return 0, MAX_SUM
+    std = std if std > 0 else 1
+    return max(math.ceil(mean - tolerance * std), 0), min(math.floor(mean + tolerance * std), MAX_SUM)
+
+
+def band_probability(low: int, high: int) -> float:
+    """Chance that a uniformly random ticket's numbers sum to within [low, high]."""
+    by_sum = subset_sum_counts()[NUMBER_COUNT, NUMBERS_PER_DRAW]
+    return by_sum[low:high + 1].sum() / by_sum.sum()
+
+
+def sample_sum_band(gen: np.random.Generator, rows: int, low: int, high: int) -> np.ndarray:
+    """
+    (rows, 5) sorted int8 tickets, uniform over the 5-subsets of 1..50 whose
+    sum is in [low, high]; uniform over all tickets when none is.
+
+    Each ticket gets a random rank among the allowed subsets, which is then
+    unranked through the counts table from 50 downwards: a number is taken
+    when the rank falls among the subsets that contain it.
+    """
+    ways = subset_sum_counts()
+    band = ways[NUMBER_COUNT, NUMBERS_PER_DRAW, low:high + 1] if low <= high else np.zeros(0, np.int64)
+    if band.sum() == 0:
+        low, band = 0, ways[NUMBER_COUNT, NUMBERS_PER_DRAW]
+    cumulative = band.cumsum()
+    rank = gen.integers(cumulative[-1], size=rows)
+    which = np.searchsorted(cumulative, rank, side="right")
+    target = low + which
+    rank -= cumulative[which] - band[which]
+
+    nums = np.empty((rows, NUMBERS_PER_DRAW), dtype=np.int8)
+    left = np.full(rows, NUMBERS_PER_DRAW)
+    all_rows = np.arange(rows)
+    for n in range(NUMBER_COUNT, 0, -1):
+        rest = target - n
+        with_n = np.where(
+            (left > 0) & (rest >= 0),
+            ways[n - 1, np.maximum(left - 1, 0), np.maximum(rest, 0)],
+            0
+        )
+        take = rank < with_n
+        nums[all_rows[take], left[take] - 1] = n
+        left -= take
+        target -= n * take
+        rank -= np.where(take, 0, with_n)
+    return nums
 
 
 def sum_target_generator_factory(tolerance: float = 1.0):
     """Bias selections toward sums near the historical average."""
 
-    def generator(draws_df: pd.DataFrame, num_tickets: int):
-        sums = draws_df["numbers"].apply(lambda ns: sum(int(n) for n in ns))
-        mean = sums.mean()
-        std = sums.std() if sums.std() > 0 else 1
-
-        numbers = list(range(1, 51))
-        tickets = []
-        for _ in range(num_tickets):
-            for _ in range(1000):
-                nums = sorted(random.sample(numbers, 5))
-                s = sum(nums)
-                if abs(s - mean) <= tolerance * std:
-                    stars = random.sample(range(1, 13), 2)
-                    tickets.append((nums, sorted(stars)))
-                    break
-            else:
-                tickets.append((sorted(random.sample(numbers, 5)), sorted(random.sample(range(1, 13), 2))))
-        return tickets
+    @array_generator
+    def generator(draws: DrawIndex, num_tickets: int, rng: random.Random | None = None):
+        rng = ensure_rng(rng)
+        draws = as_draw_index(draws)
+        mean, std = rolling_stats(draws).sum_mean_std(draws)
+        low, high = sum_band(mean, std, tolerance)
+
+        gen = numpy_rng(rng)
+        return sample_sum_band(gen, num_tickets, low, high), uniform_stars(gen, num_tickets)
 
     generator.__name__ = f"sum_target_{tolerance}".replace(".", "_")
     return generator
 
 
 def get_variants() -> list[callable]:
-    return [sum_target_generator_factory(t) for t in [0.2, 0.5, 1.0, 1.5, 2.0, 2.5]]
+    return family_variants("sum_target")
@@ -1,24 +1,151 @@
-from .strategies.frequency_weighted import get_variants as frequency_weighted_variants
-from .strategies.hot_cold import get_variants as hot_cold_variants
-from .strategies.markov_chain import get_variants as markov_chain_variants
-from .strategies.age_weighted import get_variants as age_weighted_variants
-from .strategies.decay_weighted import get_variants as decay_weighted_variants
-from .strategies.pair_frequency import get_variants as pair_frequency_variants
-from .strategies.parity_balance import get_variants as parity_balance_variants
-from .strategies.sum_target import get_variants as sum_target_variants
-from .ticket_generator import generate_tickets_from_variants
+"""Strategy variants, described by metadata and built on first use.
 
-__all__ = ["get_all_strategy_variants", "generate_tickets_from_variants"]
+Every variant is listed as a ``VariantSpec``: its stable id (the name
+its random stream is derived from, see ``generators.rng``), its family,
+the ``"module:factory"`` that builds it and the factory's parameters.
+Listing the variants imports no strategy module; ``VariantSpec.load``
+imports the module and calls the factory the first time a variant is
+needed, and returns the same closure afterwards.
+
+Some built-in families are optional, because adding genes changes the
+chromosome length (and with it seeded runs and saved checkpoints).  List
+them, comma separated, in ``EUROMILLIONS_OPTIONAL_VARIANTS`` (e.g.
+``triple_freq``) to switch them on; they follow the default variants.
+
+Plugins add variants through the ``euromillions.strategies`` entry point
+group.  Each entry point names a callable returning ``VariantSpec``s;
+plugin variants follow the built-in ones, ordered by entry point name,
+so chromosome positions are stable from run to run.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Callable, Iterable
+
+from .ticket_generator import generate_ticket_arrays_from_variants, generate_tickets_from_variants
+
+__all__ = [
+    "VariantSpec",
+    "ENTRY_POINT_GROUP",
+    "OPTIONAL_VARIANTS",
+    "variant_specs",
+    "family_variants",
+    "get_all_strategy_variants",
+    "generate_tickets_from_variants",
+    "generate_ticket_arrays_from_variants",
+]
+
+ENTRY_POINT_GROUP = "euromillions.strategies"
+_STRATEGIES = "euromillions.generators.strategies"
+OPTIONAL_VARIANTS = os.environ.get("EUROMILLIONS_OPTIONAL_VARIANTS", "")  # e.g. "triple_freq"
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    id: str
+    family: str
+    factory: str  # "module:attribute"
+    params: tuple[tuple[str, object], ...] = ()
+
+    def load(self) -> Callable:
+        """The variant's generator, built once and memoised."""
+        return _build(self)
+
+
+@lru_cache(maxsize=None)
+def _build(spec: VariantSpec) -> Callable:
+    module, _, attr = spec.factory.partition(":")
+    gen_fn = getattr(import_module(module), attr)(**dict(spec.params))
+    if gen_fn.__name__ != spec.id:
+        raise ValueError(f"{spec.factory} built {gen_fn.__name__!r} for variant {spec.id!r}")
+    return gen_fn
+
+
+def _spec(family: str, factory: str, id: str, **params) -> VariantSpec:
+    return VariantSpec(id, family, f"{_STRATEGIES}.{family}:{factory}", tuple(params.items()))
+
+
+def _builtin_specs() -> list[VariantSpec]:
+    specs = []
+    for w in [5, 10, 15, 20, 30, 50, 100]:
+        for e in [0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0]:
+            specs.append(_spec(
+                "frequency_weighted", "frequency_weighted_generator_factory",
+                f"freq_w{w}_exp{e}", window_size=w, exponent=e
+            ))
+    for w in [13, 21, 34, 55, 89, 144, 233]:  # big Fibonacci numbers
+        specs.append(_spec("hot_cold", "hot_cold_generator_factory", f"hot_cold_w{w}", window=w))
+    for w in [5, 8, 13, 21, 34, 55, 89]:
+        specs.append(_spec("markov_chain", "markov_chain_generator", f"markov_chain_W{w}", window=w))
+    for e in [0.2, 0.7, 1.3, 2.0, 3.0]:
+        specs.append(_spec("age_weighted", "age_weighted_generator_factory", f"age_weighted_exp{e}", exponent=e))
+    for d in [0.85, 0.9, 0.93, 0.95, 0.98]:
+        for w in [None, 10, 20, 50, 100]:
+            w_name = "all" if w is None else str(w)
+            specs.append(_spec(
+                "decay_weighted", "decay_weighted_generator_factory",
+                f"decay{d}_w{w_name}", decay=d, window=w
+            ))
+    for w in [None, 5, 8, 13, 21, 34]:
+        w_name = "all" if w is None else str(w)
+        specs.append(_spec("pair_frequency", "pair_frequency_generator_factory", f"pair_freq_w{w_name}", window=w))
+    specs.append(_spec("parity_balance", "parity_balance_generator_factory", "parity_balance_generator"))
+    for t in [0.2, 0.5, 1.0, 1.5, 2.0, 2.5]:
+        specs.append(_spec(
+            "sum_target", "sum_target_generator_factory", f"sum_target_{t}".replace(".", "_"), tolerance=t
+        ))
+    return specs
+
+
+def _optional_specs() -> dict[str, list[VariantSpec]]:
+    triples = []
+    for w in [None, 13, 34]:
+        w_name = "all" if w is None else str(w)
+        triples.append(_spec(
+            "pair_frequency", "triple_frequency_generator_factory", f"triple_freq_w{w_name}", window=w
+        ))
+    return {"triple_freq": triples}
+
+
+def _enabled_optional_specs() -> list[VariantSpec]:
+    optional = _optional_specs()
+    enabled = {name.strip() for name in OPTIONAL_VARIANTS.split(",") if name.strip()}
+    unknown = enabled - optional.keys()
+    if unknown:
+        raise ValueError(
+            f"unknown optional strategy variants {sorted(unknown)}; choose from {sorted(optional)}"
+        )
+    return [spec for name in sorted(enabled) for spec in optional[name]]
+
+
+def _plugin_specs() -> list[VariantSpec]:
+    specs = []
+    for ep in sorted(entry_points(group=ENTRY_POINT_GROUP), key=lambda ep: ep.name):
+        provided: Iterable[VariantSpec] = ep.load()()
+        specs.extend(provided)
+    return specs
+
+
+@lru_cache(maxsize=None)
+def variant_specs() -> tuple[VariantSpec, ...]:
+    """Every registered variant, in chromosome order."""
+    specs = _builtin_specs() + _enabled_optional_specs() + _plugin_specs()
+    seen = set()
+    for spec in specs:
+        if spec.id in seen:
+            raise ValueError(f"strategy variant {spec.id!r} is registered twice")
+        seen.add(spec.id)
+    return tuple(specs)
+
+
+def family_variants(family: str) -> list[Callable]:
+    """The built generators of one family, in registry order."""
+    return [spec.load() for spec in variant_specs() if spec.family == family]
 
 
 def get_all_strategy_variants() -> list:
-    variants = []
-    variants.extend(frequency_weighted_variants())
-    variants.extend(hot_cold_variants())
-    variants.extend(markov_chain_variants())
-    variants.extend(age_weighted_variants())
-    variants.extend(decay_weighted_variants())
-    variants.extend(pair_frequency_variants())
-    variants.extend(parity_balance_variants())
-    variants.extend(sum_target_variants())
-    return variants
+    return [spec.load() for spec in variant_specs()]
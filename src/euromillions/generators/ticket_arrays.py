@@ -0,0 +1,69 @@
+"""Array form of a strategy's tickets.
+
+A strategy generator normally returns ``[(numbers, stars), ...]``.
+Generators marked with ``array_generator`` return ``(numbers, stars)``
+arrays of shape (n, 5) and (n, 2) instead, int8 with every row sorted
+ascending, so batches of tickets go from the strategy through the ticket
+pool into the fitness arrays without building a list per ticket.
+
+``call_for_arrays`` accepts either kind and adapts list results.  The
+adapter keeps each list ticket's own number order, since the fitness
+pattern penalty looks at consecutive numbers as the strategy gave them.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from euromillions.draw_index import NUMBERS_PER_DRAW, STARS_PER_DRAW
+
+Ticket = tuple[list[int], list[int]]
+TicketArrays = tuple[np.ndarray, np.ndarray]
+
+
+def array_generator(gen_fn: Callable) -> Callable:
+    """Mark ``gen_fn`` as returning ``TicketArrays``."""
+    gen_fn.returns_arrays = True
+    return gen_fn
+
+
+def returns_arrays(gen_fn: Callable) -> bool:
+    return getattr(gen_fn, "returns_arrays", False)
+
+
+def empty_ticket_arrays() -> TicketArrays:
+    return (
+        np.empty((0, NUMBERS_PER_DRAW), dtype=np.int8),
+        np.empty((0, STARS_PER_DRAW), dtype=np.int8),
+    )
+
+
+def tickets_to_arrays(tickets: list[Ticket]) -> TicketArrays:
+    if not tickets:
+        return empty_ticket_arrays()
+    nums = np.array([[int(n) for n in ticket_nums] for ticket_nums, _ in tickets], dtype=np.int8)
+    stars = np.array([[int(s) for s in ticket_stars] for _, ticket_stars in tickets], dtype=np.int8)
+    return nums, stars
+
+
+def arrays_to_tickets(arrays: TicketArrays) -> list[Ticket]:
+    nums, stars = arrays
+    return list(zip(nums.tolist(), stars.tolist()))
+
+
+def concat_ticket_arrays(parts: list[TicketArrays]) -> TicketArrays:
+    if not parts:
+        return empty_ticket_arrays()
+    if len(parts) == 1:
+        return parts[0]
+    return (
+        np.concatenate([nums for nums, _ in parts]),
+        np.concatenate([stars for _, stars in parts]),
+    )
+
+
+def call_for_arrays(gen_fn: Callable, draws, count: int, rng) -> TicketArrays:
+    """Run ``gen_fn`` for ``count`` tickets and return them as arrays, whichever protocol it uses."""
+    result = gen_fn(draws, count, rng)
+    return result if returns_arrays(gen_fn) else tickets_to_arrays(result)
@@ -1,24 +1,60 @@
-def generate_tickets_from_variants(
+from euromillions.generators.rng import variant_id, variant_rng
+from euromillions.generators.ticket_arrays import (
+    TicketArrays,
+    arrays_to_tickets,
+    call_for_arrays,
+    concat_ticket_arrays,
+)
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.profiling import profiler
+
+
+def generate_ticket_arrays_from_variants(
         chromosome: list[int],
         variants: list[callable],
-        draws_df,        # pandas.DataFrame of past draws (or sliding window)
-        max_tickets: int
-) -> list[tuple[list[int], list[int]]]:
+        draws,           # DrawIndex of past draws (or sliding window)
+        max_tickets: int,
+        pool: TicketPoolCache | None = None,
+        seed: int | None = None
+) -> TicketArrays:
     """
     Given a binary chromosome and a list of strategy fns (variants),
-    run each active strategy to produce up to max_tickets total.
+    run each active strategy to produce up to max_tickets total, as
+    (n, 5) number and (n, 2) star arrays.
+    With a ``pool``, tickets come from its per-window cache instead;
+    otherwise a ``seed`` gives each variant its own reproducible stream.
     """
-    active = [fn for bit, fn in zip(chromosome, variants) if bit]
-    tickets: list[tuple[list[int], list[int]]] = []
+    active = [(i, fn) for i, (bit, fn) in enumerate(zip(chromosome, variants)) if bit]
     if not active:
-        return tickets
+        return concat_ticket_arrays([])
 
     per = max_tickets // len(active)
     extra = max_tickets % len(active)
 
-    for idx, gen_fn in enumerate(active):
+    parts: list[TicketArrays] = []
+    for idx, (variant_idx, gen_fn) in enumerate(active):
         cnt = per + (1 if idx < extra else 0)
         if cnt > 0:
-            tickets.extend(gen_fn(draws_df, cnt))
+            if pool is None:
+                name = variant_id(gen_fn)
+                rng = None if seed is None else variant_rng(seed, draws.stop, name)
+                with profiler().variant(name):
+                    parts.append(call_for_arrays(gen_fn, draws, cnt, rng))
+            else:
+                parts.append(pool.tickets(variant_idx, gen_fn, draws, cnt))
+
+    return concat_ticket_arrays(parts)
 
-    return tickets
+
+def generate_tickets_from_variants(
+        chromosome: list[int],
+        variants: list[callable],
+        draws,
+        max_tickets: int,
+        pool: TicketPoolCache | None = None,
+        seed: int | None = None
+) -> list[tuple[list[int], list[int]]]:
+    """``generate_ticket_arrays_from_variants`` as a list of (numbers, stars) tuples."""
+    return arrays_to_tickets(
+        generate_ticket_arrays_from_variants(chromosome, variants, draws, max_tickets, pool, seed)
+    )
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from euromillions.draw_index import DrawIndex
+from euromillions.generators.rng import variant_id, variant_rng
+from euromillions.generators.ticket_arrays import TicketArrays, call_for_arrays
+from euromillions.profiling import profiler
+
+DEFAULT_MAX_POOLS = 256  # comfortably above the number of registered variants
+
+
+class TicketPoolCache:
+    """
+    Per-(variant, window) pools of tickets.
+
+    The first time a variant is asked for tickets in a window it is run
+    once for ``pool_size`` tickets; later requests in the same window are
+    served from the front of that pool.  Pools are bounded by
+    ``max_pools`` and evicted least-recently-used first.  Call
+    ``new_window`` whenever the draw window moves on.
+
+    With a ``seed``, each pool is built from the variant's own stream
+    (see ``variant_rng``), so every process builds the same pools.
+    """
+
+    def __init__(
+            self,
+            pool_size: int,
+            max_pools: int = DEFAULT_MAX_POOLS,
+            seed: int | None = None
+    ) -> None:
+        self.pool_size = pool_size
+        self.max_pools = max_pools
+        self.seed = seed
+        self.window_key: Hashable = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pools: OrderedDict[tuple[int, Hashable], TicketArrays] = OrderedDict()
+
+    def new_window(self, window_key: Hashable) -> None:
+        """Drop every pool built for the previous window."""
+        self.window_key = window_key
+        self._pools.clear()
+
+    def tickets(
+            self,
+            variant_idx: int,
+            gen_fn: Callable,
+            draws: DrawIndex,
+            count: int
+    ) -> TicketArrays:
+        """The first ``count`` tickets of the variant's pool, as (numbers, stars) arrays."""
+        key = (variant_idx, self.window_key)
+        pool = self._pools.get(key)
+        if pool is None:
+            self.misses += 1
+            pool = self._build(gen_fn, draws, max(count, self.pool_size))
+            self._pools[key] = pool
+            if len(self._pools) > self.max_pools:
+                self._pools.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._pools.move_to_end(key)
+        nums, stars = pool
+        return nums[:count], stars[:count]
+
+    def _build(self, gen_fn, draws: DrawIndex, count: int) -> TicketArrays:
+        name = variant_id(gen_fn)
+        rng = None if self.seed is None else variant_rng(self.seed, draws.stop, name)
+        with profiler().variant(name):
+            return call_for_arrays(gen_fn, draws, count, rng)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def take_stats(self) -> dict:
+        """``stats()`` so far; counting starts afresh."""
+        taken = self.stats()
+        self.hits = self.misses = self.evictions = 0
+        return taken
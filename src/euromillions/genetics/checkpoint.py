@@ -0,0 +1,83 @@
+"""On-disk checkpoints of the walk-forward GA.
+
+A checkpoint holds everything ``run_evolution`` needs to carry on after
+the last draw it processed: the population (bit-packed), its scores, the
+best chromosome so far, the run seed and the state of both random
+streams.  Resuming from one therefore continues exactly where the
+original run would have gone next.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from euromillions.genetics.parameters import CHECKPOINT_EVERY, CHECKPOINT_PATH
+from ga_core.bit_population import BitPopulation
+
+
+@dataclass
+class Checkpoint:
+    population: BitPopulation
+    scores: List[float]
+    prize_scores: List[float]
+    best_chrom: List[int]
+    best_score: float
+    window_best_chrom: List[int]  # best of the last window, for reporting the draw after it
+    last_draw_idx: int  # index of the last draw whose window was evolved
+    next_reported: bool  # whether the draw after it was loaded, and so already reported on
+    seed: int
+    random_state: tuple
+    numpy_state: dict
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """Write ``checkpoint`` to ``path``, replacing any previous one atomically."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        np.savez_compressed(
+            fh,
+            population=checkpoint.population.bits,
+            length=checkpoint.population.length,
+            scores=np.asarray(checkpoint.scores, dtype=float),
+            prize_scores=np.asarray(checkpoint.prize_scores, dtype=float),
+            best_chrom=np.asarray(checkpoint.best_chrom, dtype=np.uint8),
+            best_score=checkpoint.best_score,
+            window_best_chrom=np.asarray(checkpoint.window_best_chrom, dtype=np.uint8),
+            last_draw_idx=checkpoint.last_draw_idx,
+            next_reported=checkpoint.next_reported,
+            seed=checkpoint.seed,
+            random_state=json.dumps(checkpoint.random_state),
+            numpy_state=json.dumps(checkpoint.numpy_state),
+        )
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    with np.load(path) as data:
+        version, internal, gauss = json.loads(str(data["random_state"]))
+        return Checkpoint(
+            population=BitPopulation(data["population"], int(data["length"])),
+            scores=data["scores"].tolist(),
+            prize_scores=data["prize_scores"].tolist(),
+            best_chrom=data["best_chrom"].tolist(),
+            best_score=float(data["best_score"]),
+            window_best_chrom=data["window_best_chrom"].tolist(),
+            last_draw_idx=int(data["last_draw_idx"]),
+            # older checkpoints did not say; reporting again beats skipping a draw
+            next_reported=bool(data["next_reported"]) if "next_reported" in data else False,
+            seed=int(data["seed"]),
+            random_state=(version, tuple(internal), gauss),
+            numpy_state=json.loads(str(data["numpy_state"])),
+        )
+
+
+def restore_random_streams(checkpoint: Checkpoint, rng: np.random.Generator) -> None:
+    """Put the global ``random`` stream and ``rng`` back where the run left them."""
+    random.setstate(checkpoint.random_state)
+    rng.bit_generator.state = checkpoint.numpy_state
@@ -1,31 +1,56 @@
 # src/euromillions/genetics/evolve.py
 
+import os
 import random
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 
-from euromillions.euromillions_loader import load_draws_df, load_prizes_df
+from euromillions.draw_index import NUMBER_COLUMNS, STAR_COLUMNS, DrawIndex
+from euromillions.euromillions_loader import load_draw_history
 from euromillions.generators.strategy_registry import (
     get_all_strategy_variants,
+    generate_ticket_arrays_from_variants,
     generate_tickets_from_variants,
 )
-from euromillions.genetics.fitness import evaluate_ticket_set
-
-# ─────────────────────────────────────────────────────────────────────────────
-# GA PARAMETERS
-POPULATION_SIZE = 100  # number of chromosomes
-MAX_TICKETS = 4  # tickets per chromosome
-MUTATION_RATE = 0.1  # per-gene flip probability
-MAX_GENERATIONS = 10_000  # max iters per draw‐step
-CONVERGENCE_WINDOW = 1_000  # stop if no improvement in this many gens
-SLIDING_WINDOW = 5  # None ⇒ use all past; int ⇒ only last W draws
-BIG_PRIZE_THRESHOLD = 1_000  # € threshold to start convergence tracking
-# ─────────────────────────────────────────────────────────────────────────────
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.genetics.checkpoint import (
+    CHECKPOINT_EVERY,
+    CHECKPOINT_PATH,
+    Checkpoint,
+    load_checkpoint,
+    restore_random_streams,
+    save_checkpoint,
+)
+from euromillions.genetics.fitness import evaluate_ticket_arrays, pack_ticket_arrays
+from euromillions.genetics.parallel import ScoringPool
+from euromillions.genetics.parameters import (
+    BIG_PRIZE_THRESHOLD,
+    CONVERGENCE_WINDOW,
+    MAX_GENERATIONS,
+    MAX_TICKETS,
+    MUTATION_RATE,
+    OFFSPRING_PER_STEP,
+    POPULATION_BACKEND,
+    POPULATION_SIZE,
+    RACING,
+    RANDOM_SEED,
+    SCORING_WORKERS,
+    SHARD_BURN_IN,
+    SHARDS,
+    SLIDING_WINDOW,
+)
+from euromillions.genetics.racing import can_race, race, race_stats
+from euromillions.profiling import NullProfiler, Profiler, ProfileReport, profiler, set_profiler
+from euromillions.results import ConsoleView, Results, ResultsFile, genes, results, set_results
+from euromillions.ticket_masks import mask_values, ticket_key
+from ga_core.bit_population import BitPopulation
+from ga_core.steady_state import SteadyState
+
 
 Chromosome = List[int]
 Ticket = Tuple[List[int], List[int]]
-Formatted = Tuple[List[str], List[str]]
 
 
 def initialize_population(length: int, size: int) -> List[Chromosome]:
@@ -35,6 +60,12 @@ def initialize_population(length: int, size: int) -> List[Chromosome]:
     ]
 
 
+def as_chromosomes(population: List[Chromosome] | BitPopulation) -> List[Chromosome]:
+    if isinstance(population, BitPopulation):
+        return population.to_lists()
+    return population
+
+
 def crossover(p1: Chromosome, p2: Chromosome) -> Chromosome:
     pt = random.randint(1, len(p1) - 1)
     return p1[:pt] + p2[pt:]
@@ -48,142 +79,194 @@ def mutate(chrom: Chromosome) -> Chromosome:
     return out
 
 
-def score_chromosome(
-        chrom: Chromosome,
+def score_population(
+        population: List[Chromosome],
         variants: List,
-        window_df: pd.DataFrame,
-        prizes_df: pd.DataFrame
-) -> tuple[float, float]:
-    tickets = generate_tickets_from_variants(chrom, variants, window_df, MAX_TICKETS)
-    raw_score, prize = evaluate_ticket_set(tickets, window_df, prizes_df)
-    return raw_score / len(window_df), prize
+        window: DrawIndex,
+        pool: TicketPoolCache | None = None,
+        threshold: float | None = None
+) -> tuple[List[float], List[float]]:
+    """
+    Fitness and prize of every chromosome of ``population`` on ``window``,
+    scored together in one batch.  Given the ``threshold`` a chromosome
+    must beat to matter, chromosomes are raced instead (see ``racing``):
+    those stopped get an estimate no higher than ``threshold`` and their
+    prize on the draws raced, the rest their full scores.
+    """
+    prof = profiler()
+    with prof.section("tickets"):
+        ticket_sets = [
+            generate_ticket_arrays_from_variants(chrom, variants, window, MAX_TICKETS, pool)
+            for chrom in population
+        ]
+    with prof.section("pack"):
+        nums, stars, mask = pack_ticket_arrays(ticket_sets, MAX_TICKETS)
+    if threshold is None or not can_race(window):
+        raw_scores, prizes = evaluate_ticket_arrays(nums, stars, mask, window)
+        return (raw_scores / len(window)).tolist(), prizes.tolist()
+
+    scores, prizes = race(nums, stars, mask, window, threshold)
+    return scores.tolist(), prizes.tolist()
+
+
+def score_chromosomes(
+        chromosomes: List[Chromosome],
+        variants: List,
+        window: DrawIndex,
+        pool: TicketPoolCache | None = None,
+        scoring_pool: ScoringPool | None = None,
+        threshold: float | None = None
+) -> tuple[List[float], List[float]]:
+    """``score_population`` in-process, or across ``scoring_pool`` when given."""
+    results().count_evaluations(len(chromosomes))
+    if scoring_pool is not None:
+        return scoring_pool.score(chromosomes, window, threshold)
+    return score_population(chromosomes, variants, window, pool, threshold)
+
+
+def _breed(
+        population: List[Chromosome] | BitPopulation,
+        offspring: int,
+        rng: np.random.Generator
+) -> List[Chromosome]:
+    if isinstance(population, BitPopulation):
+        return population.breed(offspring, MUTATION_RATE, rng).to_lists()
+    children = []
+    for _ in range(offspring):
+        p1, p2 = random.sample(population, 2)
+        children.append(mutate(crossover(p1, p2)))
+    return children
 
 
 def evolve_window(
-        population: List[Chromosome],
+        population: List[Chromosome] | BitPopulation,
         scores: List[float],
         prize_scores: List[float],
         variants: List,
-        window_df: pd.DataFrame,
-        prizes_df: pd.DataFrame
-) -> Tuple[List[Chromosome], List[float], List[float], Chromosome, float]:
-    best_score = max(scores)
-    best_chrom = population[scores.index(best_score)]
+        window: DrawIndex,
+        pool: TicketPoolCache | None = None,
+        scoring_pool: ScoringPool | None = None,
+        offspring: int = OFFSPRING_PER_STEP,
+        rng: np.random.Generator | None = None,
+        racing: bool = RACING
+) -> Tuple[List[Chromosome] | BitPopulation, List[float], List[float], Chromosome, float]:
+    # Members live in fixed slots; `ranking` decides which slot each accepted
+    # child overwrites, so a step costs O(log P) whatever the population size.
+    # With `racing`, children unlikely to beat the worst member are stopped
+    # early; the worst only rises during a step, so the threshold taken
+    # before it holds for all of its children.
+    # The array backend breeds from `rng`; without one it gets a fresh stream.
+    if rng is None:
+        rng = np.random.default_rng()
+    prof = profiler()
+    population = population.copy() if isinstance(population, BitPopulation) else list(population)
+    scores = list(scores)
+    prize_scores = list(prize_scores)
+    ranking = SteadyState(scores)
+    best_score = ranking.best_score
+    best_chrom = population[ranking.best_slot]
     no_improve = 0
     big_prize_found = False
     gen = 0
-    while True:
-        if big_prize_found:
+    done = False
+    while not done:
+        # Steady‐state: breed `offspring` children from the current population
+        # and score them together, then insert + drop worst one child at a time
+        with prof.section("breed"):
+            children = _breed(population, offspring, rng)
+        with prof.section("score"):
+            child_scores, child_prizes = score_chromosomes(
+                children, variants, window, pool, scoring_pool,
+                ranking.worst_score if racing else None,
+            )
+
+        for child, child_score, child_prize in zip(children, child_scores, child_prizes):
+            # Pooled tickets make fitness fixed within a window, so a big prize may
+            # never turn up; cap every draw-step at MAX_GENERATIONS regardless.
             gen += 1
-        # Steady‐state: breed one child, score it, insert + drop worst
-        p1, p2 = random.sample(population, 2)
-        child = mutate(crossover(p1, p2))
-        child_score, child_prize = score_chromosome(child, variants, window_df, prizes_df)
-
-        population.append(child)
-        scores.append(child_score)
-        prize_scores.append(child_prize)
-
-        paired = sorted(
-            zip(scores, prize_scores, population),
-            key=lambda x: x[0],
-            reverse=True
-        )[:POPULATION_SIZE]
-
-        # unzip back into two lists
-        scores_tuple, prizes_tuple, population_tuple = zip(*paired)
-        scores = list(scores_tuple)
-        prize_scores = list(prizes_tuple)
-        population = list(population_tuple)
-
-        current_best_score = scores[0]
-        if current_best_score > best_score:
-            best_score = current_best_score
-            best_chrom = population[0]
-            no_improve = 0
-        else:
-            no_improve += 1
-
-        big_prize_found = big_prize_found or child_prize >= BIG_PRIZE_THRESHOLD
-
-        if not big_prize_found and child_prize >= BIG_PRIZE_THRESHOLD:
-            print(f"First Big prize found: €{child_prize:,.2f} with {child}")
-            no_improve = 0
-
-        if big_prize_found and child_prize >= BIG_PRIZE_THRESHOLD:
-            print(f"New Big prize found: €{child_prize:.2f} with {child}")
-
-        if (big_prize_found and no_improve >= CONVERGENCE_WINDOW) or gen >= MAX_GENERATIONS:
-            break
+
+            with prof.section("replace"):
+                slot = ranking.offer(child_score)
+                if slot is not None:
+                    population[slot] = child
+                    scores[slot] = child_score
+                    prize_scores[slot] = child_prize
+
+            if ranking.best_score > best_score:
+                best_score = ranking.best_score
+                best_chrom = child
+                no_improve = 0
+            else:
+                no_improve += 1
+
+            big_prize_found = big_prize_found or child_prize >= BIG_PRIZE_THRESHOLD
+
+            if not big_prize_found and child_prize >= BIG_PRIZE_THRESHOLD:
+                results().emit(_big_prize_record(window, child, child_prize, first=True))
+                no_improve = 0
+
+            if big_prize_found and child_prize >= BIG_PRIZE_THRESHOLD:
+                results().emit(_big_prize_record(window, child, child_prize, first=False))
+
+            if (big_prize_found and no_improve >= CONVERGENCE_WINDOW) or gen >= MAX_GENERATIONS:
+                done = True
+                break
+
+    # hand the population back best-first, as a full sort would have left it
+    order = ranking.ranked_slots()
+    if isinstance(population, BitPopulation):
+        population = population.take(order)
+    else:
+        population = [population[i] for i in order]
+    scores = [scores[i] for i in order]
+    prize_scores = [prize_scores[i] for i in order]
 
     return population, scores, prize_scores, best_chrom, best_score
 
 
+def _big_prize_record(window: DrawIndex, chrom: Chromosome, prize: float, first: bool) -> dict:
+    return {"kind": "big_prize", "draw": window.stop, "chromosome": genes(chrom), "prize": prize, "first": first}
+
+
 def report_draw(
         draw_idx: int,
         draw_row: pd.Series,
         best_chrom: Chromosome,
         variants: List,
-        window_df: pd.DataFrame
+        window: DrawIndex,
+        pool: TicketPoolCache | None = None,
+        evaluations: int | None = None
 ):
-    # 1) Show the actual draw
-    draw_nums = sorted(int(n) for n in draw_row["numbers"])
-    draw_strs = sorted(int(s) for s in draw_row["stars"])
-    nums_s = " ".join(f"{n:02d}" for n in draw_nums)
-    strs_s = " ".join(f"{s:02d}" for s in draw_strs)
-    print(f"Draw {draw_idx + 1}: {nums_s} - {strs_s}")
-
-    # 2) Generate best tickets for this draw
-    raw_tickets = generate_tickets_from_variants(best_chrom, variants, window_df, MAX_TICKETS)
-
-    # 3) Deduplicate
-    seen = set()
-    unique = []
-    for nums, stars in raw_tickets:
-        key = (
-            tuple(sorted(int(x) for x in nums)),
-            tuple(sorted(int(x) for x in stars))
-        )
-        if key not in seen:
-            seen.add(key)
-            unique.append((nums, stars))
-        if len(unique) >= MAX_TICKETS:
-            break
-
-    # 4) Highlight & tally prizes
-    total_prize = 0.0
-    for idx, (nums, stars) in enumerate(unique, start=1):
-        nums_i = sorted(int(n) for n in nums)
-        stars_i = sorted(int(s) for s in stars)
-
-        hn = " ".join(f"*{n:02d}*" if n in draw_nums else f" {n:02d} " for n in nums_i)
-        hs = " ".join(f"*{s:02d}*" if s in draw_strs else f" {s:02d} " for s in stars_i)
-
-        matched_n = len(set(nums_i) & set(draw_nums))
-        matched_s = len(set(stars_i) & set(draw_strs))
-        prize_info = next(
-            (p for p in draw_row.get("prizes", [])
-             if p["matched_numbers"] == matched_n and p["matched_stars"] == matched_s),
-            None
-        )
-        prize = prize_info["prize"] if prize_info else 0.0
-        total_prize += prize
-
-        print(f"Ticket {idx}: {hn} ({hs}) → €{prize:,.2f}")
-
-    print(f"--- Total won this draw: €{total_prize:,.2f}")
-
-
-def format_tickets(raw_tickets: List[Ticket]) -> List[Formatted]:
-    formatted = []
-    for nums, stars in raw_tickets:
-        nums_i = sorted(int(n) for n in nums)
-        stars_i = sorted(int(s) for s in stars)
-        formatted.append((
-            [f"{n:02d}" for n in nums_i],
-            [f"{s:02d}" for s in stars_i]
-        ))
-    return formatted
+    """Emit a ``draw`` record: how the window's best would have done on draw ``draw_idx``."""
+    draw_nums = sorted(int(n) for n in draw_row[NUMBER_COLUMNS])
+    draw_strs = sorted(int(s) for s in draw_row[STAR_COLUMNS])
+    raw_tickets = generate_tickets_from_variants(best_chrom, variants, window, MAX_TICKETS, pool)
+    unique = dedupe_and_limit(raw_tickets, MAX_TICKETS)
+
+    draw_nmask, draw_smask = ticket_key(draw_nums, draw_strs)
+    tickets = []
+    for nums, stars in unique:
+        nmask, smask = ticket_key(nums, stars)
+        matched_n = (nmask & draw_nmask).bit_count()
+        matched_s = (smask & draw_smask).bit_count()
+        tickets.append({
+            "numbers": mask_values(nmask),
+            "stars": mask_values(smask),
+            "matched_numbers": matched_n,
+            "matched_stars": matched_s,
+            "prize": float(window.root.prizes[draw_idx, matched_n, matched_s]),
+        })
+
+    results().emit({
+        "kind": "draw",
+        "draw": draw_idx + 1,
+        "numbers": draw_nums,
+        "stars": draw_strs,
+        "chromosome": genes(best_chrom),
+        "tickets": tickets,
+        "prize": sum(ticket["prize"] for ticket in tickets),
+        "evaluations": evaluations,
+    })
 
 
 def dedupe_and_limit(
@@ -193,10 +276,7 @@ def dedupe_and_limit(
     seen = set()
     out = []
     for nums, stars in raw:
-        key = (
-            tuple(sorted(int(x) for x in nums)),
-            tuple(sorted(int(x) for x in stars))
-        )
+        key = ticket_key(nums, stars)
         if key not in seen:
             seen.add(key)
             out.append((nums, stars))
@@ -205,73 +285,292 @@ def dedupe_and_limit(
     return out
 
 
-def print_aligned_tickets(tickets: List[Formatted], title: str):
-    print(f"\n{title}")
-    print(f"{'Ticket':<6} | {'Numbers':<17} | {'Stars'}")
-    print(f"{'-' * 6}-+-{'-' * 17}-+-{'-' * 5}")
-    for idx, (nums, stars) in enumerate(tickets, start=1):
-        print(f"{idx:<6} | {' '.join(nums):<17} | {' '.join(stars)}")
-
-
-def run_evolution():
-    draws_df = load_draws_df()
-    prizes_df = load_prizes_df()
+def run_evolution(
+        workers: int = SCORING_WORKERS,
+        offspring: int = OFFSPRING_PER_STEP,
+        seed: int | None = RANDOM_SEED,
+        backend: str = POPULATION_BACKEND,
+        population_size: int = POPULATION_SIZE,
+        resume: bool = False,
+        checkpoint_path: str = CHECKPOINT_PATH,
+        profile: str | None = None,
+        shards: int = SHARDS,
+        burn_in: int = SHARD_BURN_IN,
+        results_path: str | None = None,
+        console_interval: float | None = 0.0,
+        racing: bool = RACING
+):
+    """
+    Walk the GA over the draw history and recommend tickets.  Results are
+    written to ``results_path`` (JSON lines or parquet) if given, and shown
+    on the console at most every ``console_interval`` seconds (never when
+    it is None).  ``racing`` stops scoring children early once they
+    are unlikely to enter the population (see ``racing``).
+    """
+    if shards > 1 and (resume or profile is not None):
+        raise ValueError("a sharded run can neither resume from a checkpoint nor be profiled")
+    recorder = Results(
+        ResultsFile(results_path) if results_path is not None else None,
+        ConsoleView(console_interval) if console_interval is not None else None,
+    )
+    previous = results()
+    set_results(recorder)
+    try:
+        _run_evolution(
+            workers, offspring, seed, backend, population_size, resume, checkpoint_path, profile,
+            shards, burn_in, racing
+        )
+    finally:
+        set_results(previous)
+        recorder.close()
+        if results_path is not None:
+            print(f"Results written to {results_path}")
+
+
+def _run_evolution(
+        workers: int,
+        offspring: int,
+        seed: int | None,
+        backend: str,
+        population_size: int,
+        resume: bool,
+        checkpoint_path: str,
+        profile: str | None,
+        shards: int,
+        burn_in: int,
+        racing: bool
+):
+    draws_df, draw_index = load_draw_history()
     variants = get_all_strategy_variants()
     num_strat = len(variants)
+
+    checkpoint = None
+    if resume and os.path.exists(checkpoint_path):
+        checkpoint = load_checkpoint(checkpoint_path)
+        if checkpoint.population.length != num_strat:
+            raise ValueError(
+                f"{checkpoint_path} was written for {checkpoint.population.length} strategy "
+                f"variants but {num_strat} are registered; run without --resume"
+            )
+        if checkpoint.last_draw_idx >= len(draws_df):
+            raise ValueError(
+                f"{checkpoint_path} goes up to draw {checkpoint.last_draw_idx + 1} "
+                f"but only {len(draws_df)} draws are loaded"
+            )
+        seed = checkpoint.seed
+    elif resume:
+        print(f"No checkpoint at {checkpoint_path}; starting from the first draw.")
+
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    print(f"Run seed: {seed}")
+
     print(f"Using {num_strat} strategy variants for evolution.")
     for variant in variants:
         print(f"Variant: {variant}")
 
-    # initial population & scores
-    population = initialize_population(num_strat, POPULATION_SIZE)
-    scores = [0.0] * POPULATION_SIZE
-    prizes = [0.0] * POPULATION_SIZE
+    if shards > 1:
+        # imported here to avoid a cycle: shards imports this module
+        from euromillions.genetics.shards import walk_forward_sharded
 
-    best_global_score = float("-inf")
-    best_global_chrom = None
+        best_global_chrom, _ = walk_forward_sharded(
+            len(draws_df), shards, burn_in, workers, offspring, seed, backend, population_size, racing
+        )
+        report_final_tickets(best_global_chrom, variants, draw_index, seed)
+        return
+
+    # initial population; scored afresh on every window
+    if checkpoint is not None:
+        population = checkpoint.population
+        if backend != "array":
+            population = population.to_lists()
+        restore_random_streams(checkpoint, rng)
+        print(f"Resuming after draw {checkpoint.last_draw_idx + 1}/{len(draws_df)}")
+    else:
+        population = initial_population(backend, population_size, num_strat, rng)
+
+    # one pool per variant and window, shared by every chromosome scored on it
+    # (common random numbers); seeded so worker processes build the same pools
+    pool = TicketPoolCache(MAX_TICKETS, seed=seed)
+    # the report opens first: a bad path then fails before any worker starts
+    report = None
+    if profile is not None:
+        report = ProfileReport(profile)
+        set_profiler(Profiler())
+    scoring_pool = None
+    try:
+        if workers > 1:
+            scoring_pool = ScoringPool(draw_index, workers, MAX_TICKETS, seed)
+        _, best_global_chrom, _ = _walk_forward(
+            draws_df, draw_index, variants, population, pool, scoring_pool, offspring, rng, seed,
+            checkpoint, checkpoint_path, report, racing=racing
+        )
+    finally:
+        if scoring_pool is not None:
+            scoring_pool.close()
+        if report is not None:
+            set_profiler(NullProfiler())
+            report.close()
+            print(f"Profile written to {profile}")
 
+    report_final_tickets(best_global_chrom, variants, draw_index, seed)
+
+
+def initial_population(
+        backend: str,
+        size: int,
+        length: int,
+        rng: np.random.Generator
+) -> List[Chromosome] | BitPopulation:
+    if backend == "array":
+        return BitPopulation.random(size, length, rng)
+    return initialize_population(length, size)
+
+
+def report_final_tickets(best_chrom: Chromosome, variants: List, draw_index: DrawIndex, seed: int) -> None:
+    # Final recommendation for next draw
+    raw_final = generate_tickets_from_variants(
+        best_chrom, variants, draw_index, MAX_TICKETS, seed=seed
+    )
+    raw_final = dedupe_and_limit(raw_final, MAX_TICKETS)
+    results().emit({
+        "kind": "final",
+        "chromosome": genes(best_chrom),
+        "tickets": [
+            {"numbers": sorted(int(n) for n in nums), "stars": sorted(int(s) for s in stars)}
+            for nums, stars in raw_final
+        ],
+    })
+
+
+def _window_bounds(draw_idx: int) -> tuple[int, int]:
+    window_start = 0 if SLIDING_WINDOW is None else max(0, draw_idx - SLIDING_WINDOW + 1)
+    return window_start, draw_idx + 1
+
+
+def first_walk_idx() -> int:
+    """The first draw with a full window behind it, where the walk starts."""
+    return 0 if SLIDING_WINDOW is None else SLIDING_WINDOW - 1
+
+
+def _walk_forward(
+        draws_df: pd.DataFrame,
+        draw_index: DrawIndex,
+        variants: List,
+        population: List[Chromosome] | BitPopulation,
+        pool: TicketPoolCache,
+        scoring_pool: ScoringPool | None,
+        offspring: int,
+        rng: np.random.Generator,
+        seed: int,
+        checkpoint: Checkpoint | None,
+        checkpoint_path: str | None,
+        report: ProfileReport | None = None,
+        draw_range: range | None = None,
+        racing: bool = RACING
+) -> tuple[List[Chromosome] | BitPopulation, Chromosome, float]:
+    """
+    Evolve ``population`` window by window over ``draw_range`` (by default
+    every draw after the checkpoint) and report on each following draw.
+    Returns the final population and the best chromosome and score seen;
+    no checkpoints are written when ``checkpoint_path`` is None.
+    """
     draws_len = len(draws_df)
-    for draw_idx, draw_row in draws_df.iterrows():
+    if checkpoint is None:
+        best_global_score = float("-inf")
+        best_global_chrom = None
+        first_idx = 0
+    else:
+        best_global_score = checkpoint.best_score
+        best_global_chrom = checkpoint.best_chrom
+        first_idx = checkpoint.last_draw_idx + 1
+        if not checkpoint.next_reported and first_idx < draws_len:
+            window_start, stop = _window_bounds(checkpoint.last_draw_idx)
+            pool.new_window((window_start, stop))
+            report_draw(
+                first_idx, draws_df.iloc[first_idx], checkpoint.window_best_chrom,
+                variants, draw_index[window_start:stop], pool
+            )
+
+    if draw_range is None:
+        draw_range = range(max(first_idx, first_walk_idx()), draws_len)
+    processed = 0
+    for draw_idx in draw_range:
         idx_plus_1 = draw_idx + 1
-        if SLIDING_WINDOW is not None and idx_plus_1 < SLIDING_WINDOW:
-            continue
 
-        window_start = 0 if SLIDING_WINDOW is None else max(0, draw_idx - SLIDING_WINDOW + 1)
-        window_df = draws_df.iloc[window_start: idx_plus_1]
-        window_len = len(window_df)
+        window_start, _ = _window_bounds(draw_idx)
+        window = draw_index[window_start: idx_plus_1]
+        window_len = len(window)
 
-        print(f"\n=== Draw {idx_plus_1}/{draws_len} using last {window_len} draws ===")
+        pool.new_window((window_start, idx_plus_1))
+        if report is not None:
+            profiler().reset()
+        results().take_evaluations()
 
         # score initial population
-        scored = [
-            score_chromosome(chrom, variants, window_df, prizes_df)
-            for chrom in population
-        ]
-        scores, prizes = map(list, zip(*scored))
+        scores, prizes = score_chromosomes(
+            as_chromosomes(population), variants, window, pool, scoring_pool
+        )
 
         # evolve on this window
         population, scores, prizes, best_local_chrom, best_local_score = evolve_window(
-            population, scores, prizes, variants, window_df, prizes_df
+            population, scores, prizes, variants, window, pool, scoring_pool, offspring, rng,
+            racing,
         )
+        evaluations = results().take_evaluations()
+        if report is not None:
+            report.write(profiler().window_report(idx_plus_1, window_len, evaluations))
+        stats = pool.take_stats() if scoring_pool is None else scoring_pool.take_stats()
+        raced = (race_stats() if scoring_pool is None else scoring_pool.race).take()
+        results().emit({
+            "kind": "window",
+            "draw": idx_plus_1,
+            "draws": draws_len,
+            "window": window_len,
+            "evaluations": evaluations,
+            "best_score": best_local_score,
+            "chromosome": genes(best_local_chrom),
+            "pool_hits": stats["hits"],
+            "pool_misses": stats["misses"],
+            "race_children": raced.children,
+            "race_stopped": raced.stopped,
+            "race_matches": raced.matches,
+            "race_full_matches": raced.full_matches,
+        })
 
         # out‑of‑sample report on NEXT draw
         next_idx = draw_idx + 1
         if next_idx < draws_len:
             next_row = draws_df.iloc[next_idx]
-            report_draw(next_idx, next_row, best_local_chrom, variants, window_df)
+            report_draw(next_idx, next_row, best_local_chrom, variants, window, pool, evaluations)
 
         # track all‑time best chromosome
         if best_local_score > best_global_score:
             best_global_score = best_local_score
             best_global_chrom = best_local_chrom
 
-    # Final recommendation for next draw
-    raw_final = generate_tickets_from_variants(
-        best_global_chrom, variants, draws_df, MAX_TICKETS
-    )
-    raw_final = dedupe_and_limit(raw_final, MAX_TICKETS)
-    formatted = format_tickets(raw_final)
-    print_aligned_tickets(formatted, "=== Final Recommended Tickets for Next Draw ===")
+        processed += 1
+        if checkpoint_path is None:
+            continue
+        if processed % CHECKPOINT_EVERY == 0 or next_idx == draw_range.stop:
+            save_checkpoint(checkpoint_path, Checkpoint(
+                population=population if isinstance(population, BitPopulation)
+                else BitPopulation.from_lists(population),
+                scores=scores,
+                prize_scores=prizes,
+                best_chrom=best_global_chrom,
+                best_score=best_global_score,
+                window_best_chrom=best_local_chrom,
+                last_draw_idx=draw_idx,
+                next_reported=next_idx < draws_len,
+                seed=seed,
+                random_state=random.getstate(),
+                numpy_state=rng.bit_generator.state,
+            ))
+
+    return population, best_global_chrom, best_global_score
 
 
 if __name__ == "__main__":
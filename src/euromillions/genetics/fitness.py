@@ -1,8 +1,12 @@
 import logging
-import math
-from collections import Counter
+
+import numpy as np
 import pandas as pd
 
+from euromillions.draw_index import DrawIndex, as_draw_index
+from euromillions.profiling import profiler
+from euromillions.ticket_masks import match_counts, number_masks, star_masks
+
 logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────────────────────
@@ -21,79 +25,105 @@ ENTROPY_BONUS_WEIGHT     = 0.05  # γ
 PATTERN_PENALTY_WEIGHT   = 1.0   # δ
 # ─────────────────────────────────────────────────────────────
 
-def evaluate_ticket_set(
-        tickets: list[tuple[list[int], list[int]]],
-        draws_df: pd.DataFrame,
-        prizes_df: pd.DataFrame = None
-) -> tuple[float, float]:
+Ticket = tuple[list[int], list[int]]
+
+
+def pack_ticket_sets(
+        ticket_sets: list[list[Ticket]],
+        max_tickets: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    1) Normalize tickets → ensure all nums & stars are ints
-    2) Prize‐only score (if enabled)
-    3) Frequency penalty
-    4) Uniformity penalty
-    5) Entropy bonus
-    6) Pattern penalty (straight‐line / arithmetic sequences)
+    Pack one ticket list per chromosome into padded arrays:
+    numbers (P, T, 5), stars (P, T, 2) and a (P, T) mask of real tickets.
     """
-    # 1) Normalize
-    clean_tix = []
-    for nums, stars in tickets:
-        clean_nums  = [int(n) for n in nums]
-        clean_stars = [int(s) for s in stars]
-        clean_tix.append((clean_nums, clean_stars))
-    tickets = clean_tix
-
-    # 2) Prize‐only score
-    prize_score = 0.0
-    if USE_PRIZE_SCORE:
-        for _, row in draws_df.iterrows():
-            draw_nums  = set(map(int, row["numbers"]))
-            draw_stars = set(map(int, row["stars"]))
-            prize_list = row.get("prizes", [])
-            for ticket_nums, ticket_stars in tickets:
-                matched_n = len(draw_nums.intersection(ticket_nums))
-                matched_s = len(draw_stars.intersection(ticket_stars))
-                pi = next(
-                    (p for p in prize_list
-                     if p["matched_numbers"] == matched_n
-                     and p["matched_stars"]   == matched_s),
-                    None
-                )
-                if pi:
-                    prize_score += pi.get("prize", 0.0)
-
-    # Build flat count of picks
-    num_counts = Counter()
-    total_picks = 0
-    for nums, _ in tickets:
-        for n in nums:
-            num_counts[n] += 1
-            total_picks += 1
-    counts = [num_counts.get(i, 0) for i in range(1, 51)]
-
-    # 3) Frequency penalty
-    freq_pen = sum(c**2 for c in counts) if USE_FREQ_PENALTY else 0.0
-
-    # 4) Uniformity penalty
-    uniformity_pen = 0.0
-    if USE_UNIFORMITY_PENALTY:
+    if max_tickets is None:
+        max_tickets = max((len(t) for t in ticket_sets), default=0)
+    size = len(ticket_sets)
+    nums = np.ones((size, max_tickets, 5), dtype=np.int8)
+    stars = np.ones((size, max_tickets, 2), dtype=np.int8)
+    mask = np.zeros((size, max_tickets), dtype=bool)
+    for p, tickets in enumerate(ticket_sets):
+        for t, (ticket_nums, ticket_stars) in enumerate(tickets[:max_tickets]):
+            nums[p, t] = [int(n) for n in ticket_nums]
+            stars[p, t] = [int(s) for s in ticket_stars]
+            mask[p, t] = True
+    return nums, stars, mask
+
+
+def pack_ticket_arrays(
+        array_sets: list[tuple[np.ndarray, np.ndarray]],
+        max_tickets: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``pack_ticket_sets`` for sets already in (numbers, stars) array form."""
+    if max_tickets is None:
+        max_tickets = max((len(nums) for nums, _ in array_sets), default=0)
+    size = len(array_sets)
+    nums = np.ones((size, max_tickets, 5), dtype=np.int8)
+    stars = np.ones((size, max_tickets, 2), dtype=np.int8)
+    mask = np.zeros((size, max_tickets), dtype=bool)
+    for p, (set_nums, set_stars) in enumerate(array_sets):
+        count = min(len(set_nums), max_tickets)
+        nums[p, :count] = set_nums[:count]
+        stars[p, :count] = set_stars[:count]
+        mask[p, :count] = True
+    return nums, stars, mask
+
+
+def evaluate_ticket_arrays(
+        ticket_nums: np.ndarray,
+        ticket_stars: np.ndarray,
+        ticket_mask: np.ndarray,
+        draws: DrawIndex
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score P ticket sets at once; see ``pack_ticket_sets`` for the layout.
+    Returns (fitness, prize_score) vectors of length P.
+    """
+    size = len(ticket_nums)
+    live = ticket_mask[..., None]
+    prof = profiler()
+
+    # 2) Prize‐only score: (draw, set, ticket) match counts by popcount, looked up in the tier table
+    prize_score = np.zeros(size)
+    if USE_PRIZE_SCORE and ticket_mask.any():
+        with prof.section("fitness.prize"):
+            # (set, ticket, draw): draws on the contiguous axis, so each ticket's total is
+            # summed in the same order whatever the batch size or padding
+            matched_n = match_counts(number_masks(ticket_nums)[..., None], draws.number_masks)
+            matched_s = match_counts(star_masks(ticket_stars)[..., None], draws.star_masks)
+            won = draws.prizes[np.arange(len(draws)), matched_n, matched_s]
+            prize_score = (won.sum(axis=-1) * ticket_mask).sum(axis=1)
+
+    with prof.section("fitness.frequency"):
+        # Per-set count of picks for each number
+        offsets = np.arange(size)[:, None, None] * 50
+        counts = np.bincount(
+            (offsets + ticket_nums - 1).ravel(),
+            weights=np.broadcast_to(live, ticket_nums.shape).ravel(),
+            minlength=size * 50,
+        ).reshape(size, 50)
+        total_picks = counts.sum(axis=1)
+
+        # 3) Frequency penalty
+        freq_pen = (counts ** 2).sum(axis=1)
+
+        # 4) Uniformity penalty
         ideal = total_picks / 50
-        uniformity_pen = sum((c - ideal)**2 for c in counts)
+        uniformity_pen = ((counts - ideal[:, None]) ** 2).sum(axis=1)
 
     # 5) Entropy bonus
-    entropy_bonus = 0.0
-    if USE_ENTROPY_BONUS and total_picks > 0:
-        ent = 0.0
-        for c in counts:
-            if c > 0:
-                p = c / total_picks
-                ent -= p * math.log(p)
-        entropy_bonus = ent
-
-    # 6) Pattern penalty
-    pattern_pen = _pattern_penalty(tickets) if USE_PATTERN_PENALTY else 0.0
+    with prof.section("fitness.entropy"), np.errstate(divide="ignore", invalid="ignore"):
+        p = counts / total_picks[:, None]
+        entropy_bonus = -np.where(counts > 0, p * np.log(p), 0.0).sum(axis=1)
+
+    # 6) Pattern penalty: tickets whose numbers form an exact arithmetic sequence
+    with prof.section("fitness.pattern"):
+        diffs = np.diff(ticket_nums.astype(np.int16), axis=-1)
+        straight = (diffs == diffs[..., :1]).all(axis=-1) & ticket_mask
+        pattern_pen = straight.sum(axis=1).astype(float)
 
     # Combine
-    fitness = 0.0
+    fitness = np.zeros(size)
     if USE_PRIZE_SCORE:
         fitness += prize_score
     if USE_FREQ_PENALTY:
@@ -105,26 +135,31 @@ def evaluate_ticket_set(
     if USE_PATTERN_PENALTY:
         fitness -= PATTERN_PENALTY_WEIGHT * pattern_pen
 
-    logger.debug(
-        f"Breakdown → prize: {prize_score:.2f}, freq_pen: {freq_pen:.2f}, "
-        f"uni_pen: {uniformity_pen:.2f}, entropy: {entropy_bonus:.4f}, "
-        f"pattern_pen: {pattern_pen:.1f} → total {fitness:.2f}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for i in range(size):
+            logger.debug(
+                f"Breakdown → prize: {prize_score[i]:.2f}, freq_pen: {freq_pen[i]:.2f}, "
+                f"uni_pen: {uniformity_pen[i]:.2f}, entropy: {entropy_bonus[i]:.4f}, "
+                f"pattern_pen: {pattern_pen[i]:.1f} → total {fitness[i]:.2f}"
+            )
     return fitness, prize_score
 
 
-def _pattern_penalty(tickets: list[tuple[list[int], list[int]]]) -> float:
+def evaluate_ticket_set(
+        tickets: list[Ticket],
+        draws: DrawIndex | pd.DataFrame,
+        prizes_df: pd.DataFrame = None
+) -> tuple[float, float]:
     """
-    +1 penalty for any ticket whose numbers form an exact arithmetic
-    sequence (i.e. all diffs equal).
+    1) Normalize tickets → ensure all nums & stars are ints
+    2) Prize‐only score (if enabled)
+    3) Frequency penalty
+    4) Uniformity penalty
+    5) Entropy bonus
+    6) Pattern penalty (straight‐line / arithmetic sequences)
+
+    Single-set form of ``evaluate_ticket_arrays``.
     """
-    penalty = 0.0
-    for nums, _ in tickets:
-        if len(nums) < 2:
-            continue
-        # ensure ints (should already be)
-        nums = [int(n) for n in nums]
-        diffs = [nums[i+1] - nums[i] for i in range(len(nums)-1)]
-        if len(set(diffs)) == 1:
-            penalty += 1.0
-    return penalty
+    nums, stars, mask = pack_ticket_sets([tickets])
+    fitness, prize_score = evaluate_ticket_arrays(nums, stars, mask, as_draw_index(draws))
+    return float(fitness[0]), float(prize_score[0])
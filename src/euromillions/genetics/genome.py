@@ -3,7 +3,7 @@ from typing import List
 from euromillions.generators.ticket_generator import generate_tickets_from_variants
 from euromillions.generators.strategy_registry import get_all_strategy_variants
 from euromillions.genetics.fitness import evaluate_ticket_set
-from euromillions.euromillions_loader import load_draws_df, load_prizes_df
+from euromillions.euromillions_loader import load_draw_history, load_prizes_df
 
 Chromosome = List[int]
 MAX_ACTIVE_STRATEGIES = 4  # Example limit
@@ -32,7 +32,7 @@ def mutate_chromosome(chromosome: Chromosome, mutation_rate: float = 0.1, max_ac
 
 def evaluate_chromosome(chromosome: Chromosome) -> float:
     all_variants = get_all_strategy_variants()
-    draws_df = load_draws_df()
+    _, draw_index = load_draw_history()
     prizes_df = load_prizes_df()
 
     selected_variants = [
@@ -44,8 +44,8 @@ def evaluate_chromosome(chromosome: Chromosome) -> float:
     tickets = generate_tickets_from_variants(
         chromosome,
         selected_variants,
-        draws_df,
+        draw_index,
         max_tickets=7,
     )
-    fitness, _ = evaluate_ticket_set(tickets, draws_df, prizes_df)
+    fitness, _ = evaluate_ticket_set(tickets, draw_index, prizes_df)
     return fitness
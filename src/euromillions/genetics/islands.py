@@ -0,0 +1,98 @@
+"""Island-model search over the latest draw window.
+
+``generate`` carries one population through every window in turn, so its
+walk is sequential and only the scoring of each step spreads over cores.
+``run_islands`` instead searches the window the next draw will be played
+from with ``ga_core.IslandModel``: one ``Evolver`` per process, migrating
+its best chromosomes along a ring every few generations.  Each island
+loads the draw history itself from the memory-mapped store in
+``data_dir`` and builds its own ticket pools (seeded like ``generate``'s),
+so only chromosomes and scores cross processes.
+"""
+from __future__ import annotations
+
+import random
+from typing import List
+
+from euromillions import euromillions_loader
+from euromillions.generators.strategy_registry import get_all_strategy_variants
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.genetics import evolve
+from ga_core import Evolver, IslandModel
+
+Chromosome = List[int]
+
+_island: dict = {}
+
+
+def _init_island(data_dir: str, window: int | None, seed: int) -> None:
+    euromillions_loader.DATA_DIR = data_dir
+    _, draw_index = euromillions_loader.load_draw_history()
+    draws = draw_index.tail(window)
+    pool = TicketPoolCache(evolve.MAX_TICKETS, seed=seed)
+    pool.new_window((draws.offset, draws.stop))
+    _island["draws"] = draws
+    _island["variants"] = get_all_strategy_variants()
+    _island["pool"] = pool
+
+
+def _random_population(size: int) -> List[Chromosome]:
+    return evolve.initialize_population(len(_island["variants"]), size)
+
+
+def _fitness(chrom: Chromosome) -> float:
+    scores, _ = evolve.score_population([chrom], _island["variants"], _island["draws"], _island["pool"])
+    return scores[0]
+
+
+def run_islands(
+        islands: int,
+        generations: int,
+        population_size: int,
+        migration_interval: int,
+        migrants: int,
+        seed: int,
+        window: int | None = evolve.SLIDING_WINDOW,
+        data_dir: str | None = None
+) -> tuple[Chromosome, float]:
+    """
+    Evolve ``islands`` populations on the last ``window`` draws (all of
+    them when None) of the store in ``data_dir`` (the loader's by
+    default); returns the best chromosome found and its score.
+    """
+    initargs = (data_dir or euromillions_loader.DATA_DIR, window, seed)
+    evolvers = [
+        Evolver(
+            population_size=population_size,
+            init_func=_random_population,
+            fitness_func=_fitness,
+            mutate_func=evolve.mutate,
+            crossover_func=evolve.crossover,
+            initializer=_init_island,
+            initargs=initargs,
+        )
+        for _ in range(islands)
+    ]
+    model = IslandModel(evolvers, migration_interval, migrants, seed=seed)
+    return model.run(generations)
+
+
+def recommend_tickets(
+        islands: int,
+        generations: int,
+        population_size: int,
+        migration_interval: int,
+        migrants: int,
+        seed: int | None
+) -> None:
+    """Run the islands on the latest window and report the best chromosome's tickets for the next draw."""
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    print(f"Run seed: {seed}")
+    print(f"Evolving {islands} islands of {population_size} for {generations} generations")
+    best_chrom, best_score = run_islands(
+        islands, generations, population_size, migration_interval, migrants, seed
+    )
+    print(f"Best score: {best_score:.4f}")
+    _, draw_index = euromillions_loader.load_draw_history()
+    evolve.report_final_tickets(best_chrom, get_all_strategy_variants(), draw_index, seed)
@@ -0,0 +1,142 @@
+"""Process-pool fitness scoring for the walk-forward GA.
+
+Strategy variants are closures and cannot be pickled, so every worker is
+initialised once with the draw arrays and rebuilds the variant list from
+the registry itself.  After that only chromosomes and window bounds go
+out and (score, prize) pairs come back.  Ticket pools draw from
+per-variant streams (see ``generators.rng``), so each worker builds
+exactly the pools the parent would and results match the serial path.
+Racing draws its sample from the window bounds alone, so it stops the
+same children in a worker as in the parent.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
+from euromillions.draw_index import DrawIndex
+from euromillions.generators.strategy_registry import get_all_strategy_variants
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.genetics.racing import RaceStats, race_stats
+
+_worker: dict = {}
+
+
+def _init_worker(
+        numbers: np.ndarray,
+        stars: np.ndarray,
+        number_hits: np.ndarray,
+        star_hits: np.ndarray,
+        prizes: np.ndarray,
+        number_masks: np.ndarray,
+        star_masks: np.ndarray,
+        max_tickets: int,
+        seed: int
+) -> None:
+    _worker["draws"] = DrawIndex(
+        numbers, stars, number_hits, star_hits, prizes, number_masks, star_masks
+    )
+    _worker["variants"] = get_all_strategy_variants()
+    _worker["pool"] = TicketPoolCache(max_tickets, seed=seed)
+
+
+def _score_chunk(
+        chromosomes: List[List[int]],
+        start: int,
+        stop: int,
+        threshold: float | None
+) -> tuple[List[float], List[float], int, int, int, dict]:
+    # imported here to avoid a cycle: evolve imports this module
+    from euromillions.genetics.evolve import score_population
+
+    pool: TicketPoolCache = _worker["pool"]
+    if pool.window_key != (start, stop):
+        pool.new_window((start, stop))
+    before = (pool.hits, pool.misses, pool.evictions)
+    window = _worker["draws"][start:stop]
+    scores, prizes = score_population(chromosomes, _worker["variants"], window, pool, threshold)
+    return (
+        scores,
+        prizes,
+        pool.hits - before[0],
+        pool.misses - before[1],
+        pool.evictions - before[2],
+        race_stats().take().as_dict(),
+    )
+
+
+class ScoringPool:
+    """Scores chromosomes on a draw window across worker processes."""
+
+    def __init__(self, draws: DrawIndex, workers: int, max_tickets: int, seed: int) -> None:
+        history = draws.root
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.race = RaceStats()  # summed over every worker until taken
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                history.numbers,
+                history.stars,
+                history.number_hits,
+                history.star_hits,
+                history.prizes,
+                history.number_masks,
+                history.star_masks,
+                max_tickets,
+                seed,
+            ),
+        )
+
+    def __enter__(self) -> ScoringPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def score(
+            self,
+            chromosomes: List[List[int]],
+            window: DrawIndex,
+            threshold: float | None = None
+    ) -> tuple[List[float], List[float]]:
+        """Same result as ``score_population`` on ``window``, in input order."""
+        size = -(-len(chromosomes) // self.workers)
+        chunks = [chromosomes[i:i + size] for i in range(0, len(chromosomes), size)]
+        scores: List[float] = []
+        prizes: List[float] = []
+        for chunk_scores, chunk_prizes, hits, misses, evictions, raced in self._executor.map(
+                _score_chunk, chunks, [window.offset] * len(chunks), [window.stop] * len(chunks),
+                [threshold] * len(chunks)
+        ):
+            scores.extend(chunk_scores)
+            prizes.extend(chunk_prizes)
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+            self.race.add(raced)
+        return scores, prizes
+
+    def stats(self) -> dict:
+        """Ticket pool statistics summed over every worker."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def take_stats(self) -> dict:
+        """``stats()`` so far; counting starts afresh."""
+        taken = self.stats()
+        self.hits = self.misses = self.evictions = 0
+        return taken
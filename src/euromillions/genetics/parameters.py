@@ -0,0 +1,33 @@
+"""GA parameters.
+
+Kept free of imports so the CLI can show them as option defaults without
+loading the GA stack; ``evolve`` and ``checkpoint`` take their values
+from here.
+"""
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GA PARAMETERS
+POPULATION_SIZE = 100  # number of chromosomes
+MAX_TICKETS = 4  # tickets per chromosome
+MUTATION_RATE = 0.1  # per-gene flip probability
+MAX_GENERATIONS = 10_000  # max iters per draw‐step
+CONVERGENCE_WINDOW = 1_000  # stop if no improvement in this many gens
+SLIDING_WINDOW = 5  # None ⇒ use all past; int ⇒ only last W draws
+BIG_PRIZE_THRESHOLD = 1_000  # € threshold to start convergence tracking
+SCORING_WORKERS = 1  # >1 ⇒ score children in a process pool
+OFFSPRING_PER_STEP = 1  # children bred and scored together per steady-state step
+RANDOM_SEED = None  # None ⇒ pick one per run (printed so it can be replayed)
+POPULATION_BACKEND = "list"  # "array" ⇒ packed bit matrix, for populations of 10^4 and up
+SHARDS = 1  # >1 ⇒ split the walk over the draws into this many parallel shards
+SHARD_BURN_IN = 20  # draws each shard evolves over, unreported, before its first one
+RACING = False  # True ⇒ race children on sampled draws and fully score only likely entrants
+RACE_FIRST_DRAWS = 32  # draws (at least 2) a child is raced on before it can be stopped; doubles per stage
+RACE_CONFIDENCE_Z = 3.0  # normal quantile of the upper bound that must clear the worst member
+ISLANDS = 4  # populations the islands command evolves, one process each
+ISLAND_GENERATIONS = 100  # generations each island evolves
+MIGRATION_INTERVAL = 10  # generations between migrations
+MIGRANTS = 2  # best chromosomes each island sends its neighbour per migration
+# ─────────────────────────────────────────────────────────────────────────────
+
+CHECKPOINT_PATH = "data/checkpoint.npz"
+CHECKPOINT_EVERY = 50  # draws between checkpoints; one is always written at the end
@@ -0,0 +1,156 @@
+"""Racing evaluation: stop scoring children unlikely to enter the population.
+
+A child's fitness is its total prize over the window's draws plus
+ticket-only terms (frequency, uniformity, entropy, pattern), divided by
+the window length, and a steady-state step only keeps it if that beats
+the current worst member.  Matching every ticket against every draw is
+the expensive part on long windows, so ``race`` plays children against
+the draws in a fixed random order, first on ``RACE_FIRST_DRAWS`` draws
+and then in stages that double the draws seen.  After each stage a
+child's remaining winnings are bounded by a normal upper confidence
+bound on its per-draw mean (with the finite-population correction, since
+draws are sampled without replacement); once even that total cannot
+beat the worst member, the child is stopped.  Survivors race on to the
+last draw, which gives them their full score; only the order their
+prizes are summed in differs from plain scoring.
+
+Prize distributions are heavy-tailed, so the bound is a heuristic: a
+child that has won nothing yet is stopped even though a later jackpot
+could have saved it.  ``RACE_CONFIDENCE_Z`` trades that risk against
+the work skipped; ``race_stats()`` counts both until they are taken.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from euromillions.draw_index import DrawIndex
+from euromillions.genetics import fitness
+from euromillions.genetics.parameters import RACE_CONFIDENCE_Z, RACE_FIRST_DRAWS
+from euromillions.profiling import profiler
+from euromillions.ticket_masks import match_counts, number_masks, star_masks
+
+
+class RaceStats:
+    """Children raced and draw matches (ticket set × draw) done against what full scoring costs."""
+
+    FIELDS = ("children", "stopped", "matches", "full_matches")
+
+    def __init__(self) -> None:
+        self.children = 0
+        self.stopped = 0
+        self.matches = 0
+        self.full_matches = 0
+
+    def add(self, counts: dict) -> None:
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name) + counts[name])
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def take(self) -> RaceStats:
+        """The counts so far, as a new ``RaceStats``; counting starts afresh."""
+        taken = RaceStats()
+        taken.add(self.as_dict())
+        for name in self.FIELDS:
+            setattr(self, name, 0)
+        return taken
+
+    def skipped(self) -> float:
+        """Share of the draw matches full scoring would have done that were skipped."""
+        return 1 - self.matches / self.full_matches if self.full_matches else 0.0
+
+
+_stats = RaceStats()
+
+
+def race_stats() -> RaceStats:
+    return _stats
+
+
+def can_race(window: DrawIndex) -> bool:
+    """Racing only pays when there are draws left after the first stage."""
+    return fitness.USE_PRIZE_SCORE and len(window) > 2 * RACE_FIRST_DRAWS
+
+
+def race_order(window: DrawIndex) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The window's number masks, star masks and flattened prize tables in a
+    random order fixed by its bounds, so every process races alike; each
+    stage then reads a contiguous slice.
+    """
+    key = ("race_order", window.offset, window.stop)
+    if key not in window.cache:
+        order = np.random.default_rng([window.offset, window.stop]).permutation(len(window))
+        window.cache[key] = (
+            window.number_masks[order],
+            window.star_masks[order],
+            window.prizes[order].reshape(-1),
+        )
+    return window.cache[key]
+
+
+def race(
+        ticket_nums: np.ndarray,
+        ticket_stars: np.ndarray,
+        ticket_mask: np.ndarray,
+        window: DrawIndex,
+        threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Race P ticket sets (laid out as for ``evaluate_ticket_arrays``) for a
+    place above ``threshold``.  Returns (score, prize) vectors like
+    ``score_population``: survivors get their full scores, stopped sets an
+    estimate of at most ``threshold`` and the prize won on the draws raced.
+    """
+    if RACE_FIRST_DRAWS < 2:
+        raise ValueError("RACE_FIRST_DRAWS must be at least 2 to estimate a variance")
+    size, total = len(ticket_nums), len(window)
+    # ticket-only terms: the fitness with no draws to win on
+    terms, _ = fitness.evaluate_ticket_arrays(ticket_nums, ticket_stars, ticket_mask, window[0:0])
+    needed = threshold * total - terms  # the prize total a set must beat
+
+    nmasks = number_masks(ticket_nums)[..., None]
+    smasks = star_masks(ticket_stars)[..., None]
+    draw_nmasks, draw_smasks, prizes = race_order(window)
+    cells_per_draw = window.prizes[0].size
+    stars_per_draw = window.prizes.shape[2]
+    weights = ticket_mask.astype(float)
+    alive = np.ones(size, dtype=bool)
+    won_sum = np.zeros(size)
+    won_sq = np.zeros(size)
+    raced = np.zeros(size, dtype=np.int64)
+    scores = np.zeros(size)
+
+    start, stop = 0, min(RACE_FIRST_DRAWS, total)
+    with profiler().section("fitness.race"):
+        while start < total and alive.any():
+            sets = np.flatnonzero(alive)
+            matched_n = match_counts(nmasks[sets], draw_nmasks[start:stop])
+            matched_s = match_counts(smasks[sets], draw_smasks[start:stop])
+            first_cells = np.arange(start * cells_per_draw, stop * cells_per_draw, cells_per_draw)
+            cells = first_cells + matched_n * stars_per_draw + matched_s
+            per_draw = np.einsum("std,st->sd", prizes.take(cells), weights[sets])  # (sets, draws)
+            won_sum[sets] += per_draw.sum(axis=1)
+            won_sq[sets] += (per_draw ** 2).sum(axis=1)
+            raced[sets] = stop
+
+            seen, left = stop, total - stop
+            if left:
+                mean = won_sum[sets] / seen
+                var = np.maximum(won_sq[sets] / seen - mean ** 2, 0.0) * seen / (seen - 1)
+                spread = RACE_CONFIDENCE_Z * np.sqrt(var / seen * left / (total - 1))
+                out = won_sum[sets] + left * (mean + spread) <= needed[sets]
+                stopped = sets[out]
+                estimate = (won_sum[stopped] + left * mean[out] + terms[stopped]) / total
+                scores[stopped] = np.minimum(estimate, threshold)
+                alive[stopped] = False
+            start, stop = stop, min(2 * stop, total)
+
+    scores[alive] = (won_sum[alive] + terms[alive]) / total
+    stats = race_stats()
+    stats.children += size
+    stats.stopped += int(size - alive.sum())
+    stats.matches += int(raced.sum())
+    stats.full_matches += size * total
+    return scores, won_sum
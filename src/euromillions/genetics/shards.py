@@ -0,0 +1,133 @@
+"""Sharded walk-forward: the draw history split across processes.
+
+``run_evolution`` carries one population from window to window, so its
+walk over the draws is inherently sequential.  A sharded run cuts the
+walked draws into contiguous ranges and walks each in its own process,
+from a fresh population warm-started by a burn-in: the shard first
+evolves, silently, over the ``burn_in`` draws just before its range.
+Each shard's result records are collected and passed on to the run's
+``results()`` in draw order, and the global best is the best of the
+shards' bests (the earliest on ties, as in a sequential run).
+
+Shard 0 starts at the first walked draw with the run seed, exactly like a
+sequential run, so a single shard reproduces one; later shards derive
+their GA streams from the run seed and their number.  Ticket pools keep
+the run seed everywhere, so a window's tickets do not depend on which
+shard scores it.  Workers load the draw history themselves from the
+memory-mapped store; only ranges, seeds and results cross processes.
+"""
+from __future__ import annotations
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
+from euromillions import euromillions_loader
+from euromillions.generators.strategy_registry import get_all_strategy_variants
+from euromillions.generators.ticket_pool import TicketPoolCache
+from euromillions.genetics import evolve
+from euromillions.genetics.parallel import ScoringPool
+from euromillions.results import RecordList, Results, results, set_results
+
+Chromosome = List[int]
+
+
+def shard_ranges(first: int, stop: int, shards: int) -> List[range]:
+    """``range(first, stop)`` cut into at most ``shards`` contiguous, near-equal ranges."""
+    bounds = np.linspace(first, stop, min(shards, max(stop - first, 1)) + 1).round().astype(int)
+    return [range(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def shard_seed(seed: int, shard: int) -> int:
+    if shard == 0:
+        return seed
+    return int(np.random.SeedSequence([seed, shard]).generate_state(1)[0])
+
+
+def _init_worker(data_dir: str) -> None:
+    # spawned workers would otherwise read the default directory
+    euromillions_loader.DATA_DIR = data_dir
+
+
+def _run_shard(
+        shard: int,
+        draws: range,
+        burn_in: int,
+        workers: int,
+        offspring: int,
+        seed: int,
+        backend: str,
+        population_size: int,
+        racing: bool
+) -> tuple[List[dict], Chromosome, float]:
+    """Walk one shard; returns its result records, best chromosome and best score."""
+    draws_df, draw_index = euromillions_loader.load_draw_history()
+    variants = get_all_strategy_variants()
+
+    ga_seed = shard_seed(seed, shard)
+    random.seed(ga_seed)
+    rng = np.random.default_rng(ga_seed)
+    population = evolve.initial_population(backend, population_size, len(variants), rng)
+    pool = TicketPoolCache(evolve.MAX_TICKETS, seed=seed)
+    scoring_pool = ScoringPool(draw_index, workers, evolve.MAX_TICKETS, seed) if workers > 1 else None
+    try:
+        warm_up = range(max(evolve.first_walk_idx(), draws.start - burn_in), draws.start)
+        set_results(Results())  # burn-in results are dropped
+        population, _, _ = evolve._walk_forward(
+            draws_df, draw_index, variants, population, pool, scoring_pool,
+            offspring, rng, seed, None, None, draw_range=warm_up, racing=racing,
+        )
+
+        records = RecordList()
+        set_results(records)
+        _, best_chrom, best_score = evolve._walk_forward(
+            draws_df, draw_index, variants, population, pool, scoring_pool,
+            offspring, rng, seed, None, None, draw_range=draws, racing=racing,
+        )
+    finally:
+        if scoring_pool is not None:
+            scoring_pool.close()
+    return records.records, best_chrom, best_score
+
+
+def walk_forward_sharded(
+        draws_len: int,
+        shards: int,
+        burn_in: int,
+        workers: int,
+        offspring: int,
+        seed: int,
+        backend: str,
+        population_size: int,
+        racing: bool
+) -> tuple[Chromosome, float]:
+    """
+    Walk every draw across ``shards`` processes (each scoring with
+    ``workers`` more), emitting the shards' records in draw order.
+    Returns the best chromosome and score of the whole run.
+    """
+    ranges = shard_ranges(evolve.first_walk_idx(), draws_len, shards)
+    print(f"Walking {sum(map(len, ranges))} draws in {len(ranges)} shards (burn-in {burn_in} draws)")
+    best_chrom, best_score = None, float("-inf")
+    with ProcessPoolExecutor(
+            max_workers=max(len(ranges), 1),
+            initializer=_init_worker,
+            initargs=(euromillions_loader.DATA_DIR,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _run_shard, shard, draws, burn_in, workers, offspring, seed, backend, population_size,
+                racing,
+            )
+            for shard, draws in enumerate(ranges)
+        ]
+        # shards finish in any order but are reported in draw order
+        for future in futures:
+            records, shard_chrom, shard_score = future.result()
+            for record in records:
+                results().emit(record)
+            if shard_score > best_score:
+                best_chrom, best_score = shard_chrom, shard_score
+    return best_chrom, best_score
@@ -0,0 +1,154 @@
+"""Hot-path timers for ``generate --profile``.
+
+The ticket generators, the fitness function and ``evolve_window`` time
+their sections through ``profiler()``.  By default that is a
+``NullProfiler`` whose sections are a shared no-op context manager, so the
+instrumentation costs a function call when profiling is off.  With a
+``Profiler`` installed, ``_walk_forward`` turns each draw window's totals
+into one report row and starts afresh.
+
+With ``--workers`` > 1, strategy and fitness sections run in the worker
+processes and are not collected; the parent still times ``score`` as a
+whole.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    __slots__ = ("totals", "calls", "name", "start")
+
+    def __init__(self, totals: dict, calls: dict, name: str) -> None:
+        self.totals = totals
+        self.calls = calls
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.totals[self.name] += time.perf_counter() - self.start
+        self.calls[self.name] += 1
+
+
+class NullProfiler:
+    enabled = False
+
+    def section(self, name: str):
+        return _NULL_SECTION
+
+    def variant(self, name: str):
+        return _NULL_SECTION
+
+
+class Profiler:
+    """Section and per-variant timings for one window at a time."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.section_time: dict[str, float] = defaultdict(float)
+        self.section_calls: dict[str, int] = defaultdict(int)
+        self.variant_time: dict[str, float] = defaultdict(float)
+        self.variant_calls: dict[str, int] = defaultdict(int)
+        self.started = time.perf_counter()
+
+    def section(self, name: str) -> _Section:
+        return _Section(self.section_time, self.section_calls, name)
+
+    def variant(self, name: str) -> _Section:
+        return _Section(self.variant_time, self.variant_calls, name)
+
+    def window_report(self, draw: int, window_len: int, evaluations: int) -> dict:
+        """The window's timings, with the ``evaluations`` it took (counted by ``results()``)."""
+        elapsed = time.perf_counter() - self.started
+        return {
+            "draw": draw,
+            "window": window_len,
+            "elapsed_s": elapsed,
+            "evaluations": evaluations,
+            "evals_per_s": evaluations / elapsed if elapsed else 0.0,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "sections": {
+                name: {"calls": self.section_calls[name], "seconds": seconds}
+                for name, seconds in sorted(self.section_time.items())
+            },
+            "variants": {
+                name: {"calls": self.variant_calls[name], "seconds": seconds}
+                for name, seconds in sorted(self.variant_time.items())
+            },
+        }
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+class ProfileReport:
+    """
+    Writes one row per window: JSON lines, or long-format CSV
+    (draw, kind, name, calls, seconds, value) when ``path`` ends in ``.csv``.
+    """
+
+    CSV_FIELDS = ["draw", "kind", "name", "calls", "seconds", "value"]
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh = open(path, "w", newline="")
+        self._csv = None
+        if path.endswith(".csv"):
+            self._csv = csv.DictWriter(self._fh, fieldnames=self.CSV_FIELDS)
+            self._csv.writeheader()
+
+    def __enter__(self) -> ProfileReport:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def write(self, report: dict) -> None:
+        if self._csv is None:
+            self._fh.write(json.dumps(report) + "\n")
+        else:
+            draw = report["draw"]
+            for name in ("elapsed_s", "evaluations", "evals_per_s", "peak_rss_bytes"):
+                self._csv.writerow({"draw": draw, "kind": "window", "name": name, "value": report[name]})
+            for kind in ("sections", "variants"):
+                for name, row in report[kind].items():
+                    self._csv.writerow({"draw": draw, "kind": kind[:-1], "name": name, **row})
+        self._fh.flush()
+
+
+_active: NullProfiler | Profiler = NullProfiler()
+
+
+def profiler() -> NullProfiler | Profiler:
+    return _active
+
+
+def set_profiler(active: NullProfiler | Profiler) -> None:
+    global _active
+    _active = active
@@ -0,0 +1,254 @@
+"""The results stream of ``generate``.
+
+The walk-forward loop does not print; it emits one plain dict per event
+through ``results()``:
+
+``window``
+    a draw window has been evolved: its last draw, length, evaluations
+    used, best score and chromosome, and the window's ticket pool and
+    racing counters.
+``draw``
+    the out-of-sample check of the next draw: its numbers, the window
+    best's tickets with their matches and prizes, and the total won.
+``big_prize``
+    a child won at least ``BIG_PRIZE_THRESHOLD`` on its window.
+``final``
+    the recommended tickets for the next real draw.
+
+A ``Results`` hands every record to a ``ResultsFile`` (JSON lines, or
+parquet when the path ends in ``.parquet``), which writes them in batches
+rather than line by line, and to an optional ``ConsoleView`` that renders
+them as the familiar text, at most one window per ``interval`` seconds.
+Chromosomes are stored as strings of ``0``/``1`` genes.
+
+The default recorder only has a console view showing everything, which
+is what ``generate`` always printed.
+"""
+from __future__ import annotations
+
+import json
+import time
+from typing import Iterable, List
+
+import pyarrow as pa
+
+RESULTS_BATCH = 256  # records buffered before a write
+
+_TICKET = pa.struct([
+    ("numbers", pa.list_(pa.int8())),
+    ("stars", pa.list_(pa.int8())),
+    ("matched_numbers", pa.int8()),
+    ("matched_stars", pa.int8()),
+    ("prize", pa.float64()),
+])
+# every kind of record fits this schema; fields a kind does not use are null
+RECORD_SCHEMA = pa.schema([
+    ("kind", pa.string()),
+    ("draw", pa.int32()),
+    ("draws", pa.int32()),
+    ("window", pa.int32()),
+    ("evaluations", pa.int64()),
+    ("best_score", pa.float64()),
+    ("chromosome", pa.string()),
+    ("pool_hits", pa.int64()),
+    ("pool_misses", pa.int64()),
+    ("race_children", pa.int64()),
+    ("race_stopped", pa.int64()),
+    ("race_matches", pa.int64()),
+    ("race_full_matches", pa.int64()),
+    ("numbers", pa.list_(pa.int8())),
+    ("stars", pa.list_(pa.int8())),
+    ("tickets", pa.list_(_TICKET)),
+    ("prize", pa.float64()),
+    ("first", pa.bool_()),
+])
+
+
+def genes(chromosome: Iterable[int]) -> str:
+    return "".join("1" if gene else "0" for gene in chromosome)
+
+
+class ResultsFile:
+    """Buffers records and appends them to ``path`` ``batch_size`` at a time."""
+
+    def __init__(self, path: str, batch_size: int = RESULTS_BATCH) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer: List[dict] = []
+        self._parquet = None
+        self._fh = None
+        if path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            self._parquet = pq.ParquetWriter(path, RECORD_SCHEMA)
+        else:
+            self._fh = open(path, "w")
+
+    def write(self, record: dict) -> None:
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._parquet is not None:
+            self._parquet.write_table(pa.Table.from_pylist(self._buffer, schema=RECORD_SCHEMA))
+        else:
+            self._fh.write("".join(json.dumps(record) + "\n" for record in self._buffer))
+            self._fh.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._parquet is not None:
+            self._parquet.close()
+        else:
+            self._fh.close()
+
+
+def _marked(values: List[int], drawn: List[int]) -> str:
+    return " ".join(f"*{v:02d}*" if v in drawn else f" {v:02d} " for v in values)
+
+
+class ConsoleView:
+    """
+    Renders records as text.  With ``interval`` > 0 a window (and the draw
+    report that follows it) is shown only if ``interval`` seconds have
+    passed since the last one shown, and big prizes at most as often; the
+    final tickets are always shown.
+    """
+
+    def __init__(self, interval: float = 0.0) -> None:
+        self.interval = interval
+        self._last_window = float("-inf")
+        self._last_event = float("-inf")
+        self._showing = True
+        self._skipped = 0
+
+    def _due(self, last: float) -> bool:
+        return time.monotonic() - last >= self.interval
+
+    def show(self, record: dict) -> None:
+        kind = record["kind"]
+        if kind == "window":
+            self._showing = self._due(self._last_window)
+            if not self._showing:
+                self._skipped += 1
+                return
+            self._last_window = time.monotonic()
+            self._window(record)
+        elif kind == "draw":
+            if self._showing:
+                self._draw(record)
+        elif kind == "big_prize":
+            if self._due(self._last_event):
+                self._last_event = time.monotonic()
+                self._big_prize(record)
+        elif kind == "final":
+            self._final(record)
+
+    def _window(self, record: dict) -> None:
+        skipped, self._skipped = self._skipped, 0
+        lines = []
+        if skipped:
+            lines.append(f"\n({skipped} windows not shown)")
+        lines.append(
+            f"\n=== Draw {record['draw']}/{record['draws']} using last {record['window']} draws ==="
+        )
+        lookups = record["pool_hits"] + record["pool_misses"]
+        hit_rate = record["pool_hits"] / lookups if lookups else 0.0
+        lines.append(
+            f"Ticket pool: {record['pool_hits']:,} hits, {record['pool_misses']:,} misses "
+            f"({hit_rate:.1%} hit rate)"
+        )
+        if record["race_children"]:
+            saved = 1 - record["race_matches"] / record["race_full_matches"]
+            lines.append(
+                f"Racing: {record['race_stopped']:,} of {record['race_children']:,} children stopped "
+                f"early ({saved:.1%} of draw matches skipped)"
+            )
+        print("\n".join(lines))
+
+    def _draw(self, record: dict) -> None:
+        numbers, stars = record["numbers"], record["stars"]
+        lines = [
+            f"Draw {record['draw']}: {' '.join(f'{n:02d}' for n in numbers)} - "
+            f"{' '.join(f'{s:02d}' for s in stars)}"
+        ]
+        for idx, ticket in enumerate(record["tickets"], start=1):
+            lines.append(
+                f"Ticket {idx}: {_marked(ticket['numbers'], numbers)} "
+                f"({_marked(ticket['stars'], stars)}) → €{ticket['prize']:,.2f}"
+            )
+        lines.append(f"--- Total won this draw: €{record['prize']:,.2f}")
+        print("\n".join(lines))
+
+    def _big_prize(self, record: dict) -> None:
+        chromosome = [int(gene) for gene in record["chromosome"]]
+        if record["first"]:
+            print(f"First Big prize found: €{record['prize']:,.2f} with {chromosome}")
+        else:
+            print(f"New Big prize found: €{record['prize']:.2f} with {chromosome}")
+
+    def _final(self, record: dict) -> None:
+        lines = [
+            "\n=== Final Recommended Tickets for Next Draw ===",
+            f"{'Ticket':<6} | {'Numbers':<17} | {'Stars'}",
+            f"{'-' * 6}-+-{'-' * 17}-+-{'-' * 5}",
+        ]
+        for idx, ticket in enumerate(record["tickets"], start=1):
+            nums = " ".join(f"{n:02d}" for n in ticket["numbers"])
+            stars = " ".join(f"{s:02d}" for s in ticket["stars"])
+            lines.append(f"{idx:<6} | {nums:<17} | {stars}")
+        print("\n".join(lines))
+
+
+class Results:
+    """Fans records out to a file and a console view (either may be None) and counts evaluations."""
+
+    def __init__(self, file: ResultsFile | None = None, console: ConsoleView | None = None) -> None:
+        self.file = file
+        self.console = console
+        self.evaluations = 0
+
+    def emit(self, record: dict) -> None:
+        if self.file is not None:
+            self.file.write(record)
+        if self.console is not None:
+            self.console.show(record)
+
+    def count_evaluations(self, count: int) -> None:
+        self.evaluations += count
+
+    def take_evaluations(self) -> int:
+        """Evaluations counted since the last call."""
+        count, self.evaluations = self.evaluations, 0
+        return count
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+
+class RecordList(Results):
+    """Keeps records in memory, e.g. to send them from a worker process."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[dict] = []
+
+    def emit(self, record: dict) -> None:
+        self.records.append(record)
+
+
+_active: Results = Results(console=ConsoleView())
+
+
+def results() -> Results:
+    return _active
+
+
+def set_results(active: Results) -> None:
+    global _active
+    _active = active
@@ -0,0 +1,334 @@
+"""Incrementally maintained statistics over sliding draw windows.
+
+``run_evolution`` moves its window forward one draw at a time, so the
+strategies keep asking for the same statistics over a span that differs
+from the previous call by one draw at each end.  Each tracker remembers
+the span it currently covers and, when the next request is that span
+advanced by one draw, adds the entering draw and removes the leaving one
+instead of rescanning.  Any other request rebuilds the tracker from the
+``DrawIndex`` arrays.
+
+Trackers are keyed by the statistic and the window the strategy asked
+for, and live on the full history shared by all of its views, so every
+variant with the same window size reads the same state.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from euromillions.draw_index import NUMBER_COUNT, STAR_COUNT, DrawIndex
+
+
+class _Tracker(ABC):
+    """A statistic over rows ``[start, stop)`` of the full history."""
+
+    def __init__(self, history: DrawIndex) -> None:
+        self.history = history
+        self.start = 0
+        self.stop = 0
+        self._reset()
+
+    def move_to(self, start: int, stop: int) -> None:
+        if (start, stop) == (self.start, self.stop):
+            return
+        if stop == self.stop + 1 and self.start <= start <= self.start + 1 and self.start < self.stop:
+            self._push(self.stop)
+            self.stop = stop
+            if start > self.start:
+                self._pop(self.start)
+                self.start = start
+            return
+        self.start, self.stop = start, stop
+        self._reset()
+        if stop > start:
+            self._rebuild(start, stop)
+
+    @abstractmethod
+    def _reset(self) -> None:
+        ...
+
+    @abstractmethod
+    def _push(self, row: int) -> None:
+        ...
+
+    @abstractmethod
+    def _pop(self, row: int) -> None:
+        ...
+
+    @abstractmethod
+    def _rebuild(self, start: int, stop: int) -> None:
+        ...
+
+
+class _Counts(_Tracker):
+    def _reset(self) -> None:
+        self.numbers = np.zeros(NUMBER_COUNT, dtype=np.int64)
+        self.stars = np.zeros(STAR_COUNT, dtype=np.int64)
+
+    def _push(self, row: int) -> None:
+        self.numbers += self.history.number_hits[row]
+        self.stars += self.history.star_hits[row]
+
+    def _pop(self, row: int) -> None:
+        self.numbers -= self.history.number_hits[row]
+        self.stars -= self.history.star_hits[row]
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        self.numbers = self.history.number_hits[start:stop].sum(axis=0, dtype=np.int64)
+        self.stars = self.history.star_hits[start:stop].sum(axis=0, dtype=np.int64)
+
+
+class _DecayScores(_Tracker):
+    """Sum of ``decay ** age`` over appearances, the newest draw having age 0."""
+
+    def __init__(self, history: DrawIndex, decay: float) -> None:
+        self.decay = decay
+        super().__init__(history)
+
+    def _reset(self) -> None:
+        self.numbers = np.zeros(NUMBER_COUNT)
+        self.stars = np.zeros(STAR_COUNT)
+
+    def _push(self, row: int) -> None:
+        self.numbers *= self.decay
+        self.numbers += self.history.number_hits[row]
+        self.stars *= self.decay
+        self.stars += self.history.star_hits[row]
+
+    def _pop(self, row: int) -> None:
+        # called after the push, so the newest row is self.stop - 1
+        factor = self.decay ** (self.stop - 1 - row)
+        self.numbers -= factor * self.history.number_hits[row]
+        self.stars -= factor * self.history.star_hits[row]
+        np.maximum(self.numbers, 0.0, out=self.numbers)
+        np.maximum(self.stars, 0.0, out=self.stars)
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        factors = self.decay ** np.arange(stop - start - 1, -1, -1)
+        self.numbers = factors @ self.history.number_hits[start:stop]
+        self.stars = factors @ self.history.star_hits[start:stop]
+
+
+class _LastSeen(_Tracker):
+    """Row each ball was last drawn in; rows before the span are capped by ``ages``."""
+
+    NEVER = -(1 << 40)
+
+    def _reset(self) -> None:
+        self.numbers = np.full(NUMBER_COUNT, self.NEVER, dtype=np.int64)
+        self.stars = np.full(STAR_COUNT, self.NEVER, dtype=np.int64)
+
+    def _push(self, row: int) -> None:
+        self.numbers[self.history.number_hits[row]] = row
+        self.stars[self.history.star_hits[row]] = row
+
+    def _pop(self, row: int) -> None:
+        pass
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        rows = np.arange(start, stop)[:, None]
+        self.numbers = np.where(self.history.number_hits[start:stop], rows, self.NEVER).max(axis=0)
+        self.stars = np.where(self.history.star_hits[start:stop], rows, self.NEVER).max(axis=0)
+
+    def ages(self) -> tuple[np.ndarray, np.ndarray]:
+        """Draws since each ball was last seen, ``len(span)`` if never seen in it."""
+        size = self.stop - self.start
+        newest = self.stop - 1
+        return (
+            np.minimum(newest - self.numbers, size),
+            np.minimum(newest - self.stars, size),
+        )
+
+
+class _PairCounts(_Tracker):
+    """Co-occurrence of numbers within a draw; the diagonal holds single counts."""
+
+    def _reset(self) -> None:
+        self.pairs = np.zeros((NUMBER_COUNT, NUMBER_COUNT), dtype=np.int64)
+
+    def _push(self, row: int) -> None:
+        hits = self.history.number_hits[row]
+        self.pairs += np.outer(hits, hits)
+
+    def _pop(self, row: int) -> None:
+        hits = self.history.number_hits[row]
+        self.pairs -= np.outer(hits, hits)
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        hits = self.history.number_hits[start:stop].astype(np.int64)
+        self.pairs = hits.T @ hits
+
+
+class _TripleCounts(_Tracker):
+    """
+    ``counts[a-1, b-1, c-1]``: draws containing a, b and c.  Repeated
+    indices give pair and single counts, e.g. ``counts[a-1, a-1, c-1]``.
+    Each draw touches only its own 5x5x5 block.
+    """
+
+    SIZE = NUMBER_COUNT ** 3
+
+    def _reset(self) -> None:
+        self.counts = np.zeros((NUMBER_COUNT,) * 3, dtype=np.int64)
+
+    def _flat_cells(self, rows: slice | int) -> np.ndarray:
+        idx = self.history.numbers[rows].astype(np.int64) - 1
+        return (
+            idx[..., :, None, None] * NUMBER_COUNT ** 2
+            + idx[..., None, :, None] * NUMBER_COUNT
+            + idx[..., None, None, :]
+        ).ravel()
+
+    def _push(self, row: int) -> None:
+        self.counts.ravel()[self._flat_cells(row)] += 1
+
+    def _pop(self, row: int) -> None:
+        self.counts.ravel()[self._flat_cells(row)] -= 1
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        cells = np.bincount(self._flat_cells(slice(start, stop)), minlength=self.SIZE)
+        self.counts = cells.reshape((NUMBER_COUNT,) * 3)
+
+
+class _Transitions(_Tracker):
+    """``counts[x-1, y-1]``: x drawn in one draw and y in the next, within the span."""
+
+    def _reset(self) -> None:
+        self.counts = np.zeros((NUMBER_COUNT, NUMBER_COUNT), dtype=np.int64)
+
+    def _push(self, row: int) -> None:
+        if row > self.start:
+            self.counts += np.outer(self.history.number_hits[row - 1], self.history.number_hits[row])
+
+    def _pop(self, row: int) -> None:
+        if row + 1 < self.stop:
+            self.counts -= np.outer(self.history.number_hits[row], self.history.number_hits[row + 1])
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        hits = self.history.number_hits[start:stop].astype(np.int64)
+        self.counts = hits[:-1].T @ hits[1:]
+
+
+class _EvenSplits(_Tracker):
+    """Histogram of how many even numbers each draw had (0..5)."""
+
+    def _reset(self) -> None:
+        self.histogram = np.zeros(6, dtype=np.int64)
+
+    def _evens(self, rows: slice | int) -> np.ndarray:
+        return (self.history.numbers[rows] % 2 == 0).sum(axis=-1)
+
+    def _push(self, row: int) -> None:
+        self.histogram[self._evens(row)] += 1
+
+    def _pop(self, row: int) -> None:
+        self.histogram[self._evens(row)] -= 1
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        self.histogram = np.bincount(self._evens(slice(start, stop)), minlength=6)
+
+
+class _SumMoments(_Tracker):
+    """Count, sum and sum of squares of the number totals per draw."""
+
+    def _reset(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+
+    def _row_sum(self, row: int) -> int:
+        return int(self.history.numbers[row].sum(dtype=np.int64))
+
+    def _push(self, row: int) -> None:
+        s = self._row_sum(row)
+        self.count += 1
+        self.total += s
+        self.total_sq += s * s
+
+    def _pop(self, row: int) -> None:
+        s = self._row_sum(row)
+        self.count -= 1
+        self.total -= s
+        self.total_sq -= s * s
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        sums = self.history.numbers[start:stop].sum(axis=1, dtype=np.int64)
+        self.count = len(sums)
+        self.total = int(sums.sum())
+        self.total_sq = int((sums * sums).sum())
+
+    def mean_std(self) -> tuple[float, float]:
+        """Mean and sample standard deviation (NaN where undefined)."""
+        if self.count == 0:
+            return float("nan"), float("nan")
+        mean = self.total / self.count
+        if self.count == 1:
+            return mean, float("nan")
+        # integer arithmetic keeps the variance exact
+        var = (self.count * self.total_sq - self.total * self.total) / (self.count * (self.count - 1))
+        return mean, var ** 0.5
+
+
+class RollingStats:
+    """Every tracker kept for one draw history."""
+
+    def __init__(self, history: DrawIndex) -> None:
+        self.history = history
+        self._trackers: dict[tuple, _Tracker] = {}
+
+    def _tracker(self, key: tuple, draws: DrawIndex, window: int | None, factory) -> _Tracker:
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = factory(self.history)
+        start = draws.offset if window is None else max(draws.offset, draws.stop - window)
+        tracker.move_to(start, draws.stop)
+        return tracker
+
+    def counts(self, draws: DrawIndex, window: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Number and star counts over ``draws.tail(window)``."""
+        t = self._tracker(("counts", window), draws, window, _Counts)
+        return t.numbers, t.stars
+
+    def decay_scores(
+            self,
+            draws: DrawIndex,
+            decay: float,
+            window: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Exponentially decayed counts over ``draws.tail(window)``."""
+        t = self._tracker(("decay", decay, window), draws, window, lambda h: _DecayScores(h, decay))
+        return t.numbers, t.stars
+
+    def ages(self, draws: DrawIndex) -> tuple[np.ndarray, np.ndarray]:
+        """Draws since each ball was last seen in ``draws`` (``len(draws)`` if never)."""
+        return self._tracker(("last_seen",), draws, None, _LastSeen).ages()
+
+    def pair_counts(self, draws: DrawIndex, window: int | None = None) -> np.ndarray:
+        """(50, 50) co-occurrence counts over ``draws.tail(window)``."""
+        return self._tracker(("pairs", window), draws, window, _PairCounts).pairs
+
+    def triple_counts(self, draws: DrawIndex, window: int | None = None) -> np.ndarray:
+        """(50, 50, 50) co-occurrence counts over ``draws.tail(window)``."""
+        return self._tracker(("triples", window), draws, window, _TripleCounts).counts
+
+    def transitions(self, draws: DrawIndex, window: int) -> np.ndarray:
+        """(50, 50) draw-to-next-draw counts over ``draws.tail(window + 1)``."""
+        return self._tracker(("transitions", window), draws, window + 1, _Transitions).counts
+
+    def even_splits(self, draws: DrawIndex) -> np.ndarray:
+        """How many draws in ``draws`` had 0..5 even numbers."""
+        return self._tracker(("even_splits",), draws, None, _EvenSplits).histogram
+
+    def sum_mean_std(self, draws: DrawIndex) -> tuple[float, float]:
+        """Mean and sample std of the number totals in ``draws``."""
+        return self._tracker(("sums",), draws, None, _SumMoments).mean_std()
+
+
+def rolling_stats(draws: DrawIndex) -> RollingStats:
+    """The ``RollingStats`` shared by ``draws`` and every other view of its history."""
+    stats = draws.cache.get("rolling_stats")
+    if stats is None:
+        stats = draws.cache["rolling_stats"] = RollingStats(draws.root)
+    return stats
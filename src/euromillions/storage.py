@@ -0,0 +1,210 @@
+"""Normalized on-disk layout of the draw history.
+
+The API returns one object per draw with nested ``numbers``/``stars``
+string lists and a list of prize dicts.  The cache stores it as two flat
+tables instead:
+
+``draws.arrow``
+    ``id``, ``date`` (date32), ``n1``..``n5`` and ``s1``, ``s2`` (int8,
+    in drawn order) and ``has_winner``; one row per draw, ordered by
+    date then id.
+``prizes.arrow``
+    ``draw_id`` (the draw's ``id``), ``matched_numbers``,
+    ``matched_stars``, ``prize`` and ``winners``; one row per prize tier,
+    in the API's order.
+
+Both are uncompressed Arrow IPC (Feather v2) files, so ``read_draws`` and
+``read_prizes`` memory-map them, and building frames or a ``DrawIndex``
+from them touches no Python objects.  ``normalize`` converts API-shaped
+tables with Arrow compute kernels; ``write_store`` replaces both files
+atomically.
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterable
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from euromillions.draw_index import NUMBER_COLUMNS, STAR_COLUMNS
+
+DRAWS_FILE = "draws.arrow"
+PRIZES_FILE = "prizes.arrow"
+LEGACY_DRAWS_FILE = "draws.parquet"  # raw API frame, as cached before the normalized layout
+
+DRAWS_SCHEMA = pa.schema(
+    [("id", pa.int32()), ("date", pa.date32())]
+    + [(name, pa.int8()) for name in NUMBER_COLUMNS + STAR_COLUMNS]
+    + [("has_winner", pa.bool_())]
+)
+PRIZES_SCHEMA = pa.schema([
+    ("draw_id", pa.int32()),
+    ("matched_numbers", pa.int8()),
+    ("matched_stars", pa.int8()),
+    ("prize", pa.float64()),
+    ("winners", pa.int32()),
+])
+
+
+def normalize(raw: pa.Table | pa.RecordBatch) -> tuple[pa.Table, pa.Table]:
+    """(draws, prizes) tables for API-shaped ``raw`` draws."""
+    raw = pa.Table.from_batches([raw]) if isinstance(raw, pa.RecordBatch) else raw
+    raw = raw.combine_chunks()
+    ids = pc.cast(raw["id"], pa.int32())
+
+    columns = {"id": ids, "date": pc.cast(raw["date"], pa.date32())}
+    for name, field, k in (
+        [(name, "numbers", k) for k, name in enumerate(NUMBER_COLUMNS)]
+        + [(name, "stars", k) for k, name in enumerate(STAR_COLUMNS)]
+    ):
+        columns[name] = pc.cast(pc.list_element(raw[field], k), pa.int8())
+    columns["has_winner"] = pc.fill_null(pc.cast(raw["has_winner"], pa.bool_()), False)
+    draws = pa.table(columns, schema=DRAWS_SCHEMA)
+
+    # one row per tier; rows of draws without a prize list simply do not appear
+    tiers = pc.list_flatten(raw["prizes"])
+    prizes = pa.table({
+        "draw_id": pc.take(ids, pc.list_parent_indices(raw["prizes"])),
+        "matched_numbers": pc.cast(pc.struct_field(tiers, "matched_numbers"), pa.int8()),
+        "matched_stars": pc.cast(pc.struct_field(tiers, "matched_stars"), pa.int8()),
+        "prize": pc.fill_null(pc.cast(pc.struct_field(tiers, "prize"), pa.float64()), 0.0),
+        "winners": pc.fill_null(pc.cast(pc.struct_field(tiers, "winners"), pa.int32()), 0),
+    }, schema=PRIZES_SCHEMA)
+    return draws, prizes
+
+
+def empty_store() -> tuple[pa.Table, pa.Table]:
+    return DRAWS_SCHEMA.empty_table(), PRIZES_SCHEMA.empty_table()
+
+
+def merge(
+        old: tuple[pa.Table, pa.Table],
+        new: tuple[pa.Table, pa.Table]
+) -> tuple[pa.Table, pa.Table]:
+    """
+    ``old`` with every draw of ``new`` added or, for ids already present,
+    replaced.  An id repeated within ``new`` keeps its last row.
+    """
+    old_draws, old_prizes = old
+    new_draws, new_prizes = new
+    ids = new_draws["id"].to_numpy()
+    _, last = np.unique(ids[::-1], return_index=True)
+    if len(last) < len(ids):
+        new_draws = new_draws.take(np.sort(len(ids) - 1 - last))
+    keep_draws = pc.invert(pc.is_in(old_draws["id"], new_draws["id"]))
+    keep_prizes = pc.invert(pc.is_in(old_prizes["draw_id"], new_draws["id"]))
+    draws = pa.concat_tables([old_draws.filter(keep_draws), new_draws])
+    draws = draws.sort_by([("date", "ascending"), ("id", "ascending")])
+    prizes = pa.concat_tables([old_prizes.filter(keep_prizes), new_prizes])
+    return draws, prizes
+
+
+def _path(data_dir: str, name: str) -> str:
+    return os.path.join(data_dir, name)
+
+
+def has_store(data_dir: str) -> bool:
+    return os.path.exists(_path(data_dir, DRAWS_FILE)) and os.path.exists(_path(data_dir, PRIZES_FILE))
+
+
+class StoreWriter:
+    """
+    Streams normalized batches into ``data_dir``.  Both files are written
+    under temporary names and only replace the store on a clean ``close``.
+    """
+
+    def __init__(self, data_dir: str) -> None:
+        os.makedirs(data_dir, exist_ok=True)
+        self.data_dir = data_dir
+        self._writers = {
+            name: pa.ipc.new_file(_path(data_dir, name) + ".tmp", schema)
+            for name, schema in ((DRAWS_FILE, DRAWS_SCHEMA), (PRIZES_FILE, PRIZES_SCHEMA))
+        }
+
+    def write(self, draws: pa.Table, prizes: pa.Table) -> None:
+        self._writers[DRAWS_FILE].write_table(draws)
+        self._writers[PRIZES_FILE].write_table(prizes)
+
+    def close(self) -> None:
+        for name, writer in self._writers.items():
+            writer.close()
+        for name in self._writers:
+            os.replace(_path(self.data_dir, name) + ".tmp", _path(self.data_dir, name))
+
+    def abort(self) -> None:
+        for name, writer in self._writers.items():
+            writer.close()
+            os.remove(_path(self.data_dir, name) + ".tmp")
+
+    def __enter__(self) -> StoreWriter:
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_store(data_dir: str, draws: pa.Table, prizes: pa.Table) -> None:
+    with StoreWriter(data_dir) as writer:
+        writer.write(draws, prizes)
+
+
+def write_raw_batches(data_dir: str, batches: Iterable[pa.RecordBatch | pa.Table]) -> None:
+    """Normalize API-shaped ``batches`` into the store one at a time."""
+    with StoreWriter(data_dir) as writer:
+        for batch in batches:
+            writer.write(*normalize(batch))
+
+
+def migrate_legacy(data_dir: str) -> bool:
+    """Convert a raw ``draws.parquet`` cache to the normalized store; False if there is none."""
+    import pyarrow.parquet as pq
+
+    legacy_path = _path(data_dir, LEGACY_DRAWS_FILE)
+    if not os.path.exists(legacy_path):
+        return False
+    legacy = pq.ParquetFile(legacy_path)
+    write_raw_batches(data_dir, legacy.iter_batches())
+    return True
+
+
+def _read(path: str, columns: list[str] | None) -> pa.Table:
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table if columns is None else table.select(columns)
+
+
+def read_draws(data_dir: str, columns: list[str] | None = None) -> pa.Table:
+    """The memory-mapped draws table, migrating a legacy cache on first use."""
+    if not has_store(data_dir) and not migrate_legacy(data_dir):
+        raise FileNotFoundError(f"no draw history in {data_dir}; run fetch-draws first")
+    return _read(_path(data_dir, DRAWS_FILE), columns)
+
+
+def read_prizes(data_dir: str, columns: list[str] | None = None) -> pa.Table:
+    """The memory-mapped prizes table, migrating a legacy cache on first use."""
+    if not has_store(data_dir) and not migrate_legacy(data_dir):
+        raise FileNotFoundError(f"no draw history in {data_dir}; run fetch-draws first")
+    return _read(_path(data_dir, PRIZES_FILE), columns)
+
+
+def to_payload(draws: pa.Table, prizes: pa.Table) -> list[dict]:
+    """Turn normalized tables back into API-shaped draw dicts (for the stand-in API)."""
+    tiers: dict[int, list[dict]] = {}
+    for row in prizes.to_pylist():
+        tiers.setdefault(row.pop("draw_id"), []).append(row)
+    payload = []
+    for row in draws.to_pylist():
+        payload.append({
+            "id": row["id"],
+            "draw_id": f"{row['id']:06d}",
+            "numbers": [str(row[name]) for name in NUMBER_COLUMNS],
+            "stars": [str(row[name]) for name in STAR_COLUMNS],
+            "date": row["date"].isoformat(),
+            "prizes": tiers.get(row["id"], []),
+            "has_winner": row["has_winner"],
+        })
+    return payload
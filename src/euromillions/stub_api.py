@@ -0,0 +1,145 @@
+"""A local stand-in for the draws API, for fetching without a network.
+
+``StubDrawsAPI`` serves a list of draw payloads over HTTP on localhost,
+answering ``GET /v1/draws`` (optionally ``?year=YYYY``) like the real
+API; a year without draws answers ``[]``, or ``404`` with
+``missing_year_status=404``.  Payloads come from a JSON recording of the
+real API (``record_payload``), from an existing draw store or from the
+synthetic generator, so fetching can be exercised and timed offline::
+
+    with StubDrawsAPI(synthetic_payload(1_000)) as api:
+        fetch_and_cache_draws(api.url, data_dir)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DRAWS_PATH = "/v1/draws"
+
+
+def load_payload(path: str) -> list[dict]:
+    """Draws from a JSON recording, or from a draw store directory (see ``storage``)."""
+    if os.path.isdir(path):
+        from euromillions.storage import read_draws, read_prizes, to_payload
+
+        return to_payload(read_draws(path), read_prizes(path))
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def record_payload(path: str, url: str | None = None) -> int:
+    """Save the real API's full answer to ``path`` for later replay; returns the draw count."""
+    import requests
+
+    from euromillions.euromillions_loader import DRAW_URL, FETCH_TIMEOUT
+
+    response = requests.get(url or DRAW_URL, timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+    draws = response.json()
+    with open(path, "w") as fh:
+        json.dump(draws, fh)
+    return len(draws)
+
+
+def synthetic_payload(num_draws: int, seed: int = 0) -> list[dict]:
+    """``num_draws`` synthetic draws as the API would return them."""
+    from euromillions.synthetic import synthetic_draws_table
+
+    return synthetic_draws_table(num_draws, seed).to_pylist()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != DRAWS_PATH:
+            self.send_error(404)
+            return
+        with self.server.lock:
+            self.server.requests_served += 1
+        year = parse_qs(url.query).get("year", [None])[0]
+        body = self.server.page(year)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # keep test and benchmark output quiet
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], draws: list[dict], missing_year_status: int) -> None:
+        super().__init__(address, _Handler)
+        self.requests_served = 0
+        self.missing_year_status = missing_year_status
+        self.lock = threading.Lock()
+        by_year: dict[str, list[dict]] = {}
+        for draw in draws:
+            by_year.setdefault(draw["date"][:4], []).append(draw)
+        self._pages: dict[str | None, bytes] = {None: json.dumps(draws).encode()}
+        self._pages.update((year, json.dumps(page).encode()) for year, page in by_year.items())
+
+    def page(self, year: str | None) -> bytes | None:
+        """The answer for ``year``; None for a year without draws that should 404."""
+        if year in self._pages:
+            return self._pages[year]
+        return None if self.missing_year_status == 404 else b"[]"
+
+
+class StubDrawsAPI:
+    """Serves ``draws`` on localhost from a background thread while in use as a context manager."""
+
+    def __init__(
+            self,
+            draws: list[dict],
+            host: str = "127.0.0.1",
+            port: int = 0,
+            missing_year_status: int = 200
+    ) -> None:
+        self._server = _Server((host, port), draws, missing_year_status)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{DRAWS_PATH}"
+
+    @property
+    def requests_served(self) -> int:
+        return self._server.requests_served
+
+    def start(self) -> StubDrawsAPI:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StubDrawsAPI:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Serve in the foreground until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
@@ -0,0 +1,169 @@
+"""Synthetic draw histories in the same shape as the API's data.
+
+``write_synthetic_draws`` produces a draw store (see ``storage``) that
+``load_draws_df``/``load_prizes_df`` read exactly like the real one, at
+any size from a handful of draws to millions.  Draws are built in chunks
+with NumPy and normalized into the store chunk by chunk, so memory stays
+flat.
+
+Prize tables follow the real tier structure: each tier's winner count is
+Poisson around its odds times the tickets sold, lower tiers pay a jittered
+typical amount, and the jackpot rolls over until somebody matches 5+2.
+
+Biases can be planted to check that the strategies find them: every ball
+in ``hot_numbers``/``hot_stars`` is ``bias`` times as likely to be drawn as
+any other.
+"""
+from __future__ import annotations
+
+from typing import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from euromillions.draw_index import NUMBER_COUNT, NUMBERS_PER_DRAW, STAR_COUNT, STARS_PER_DRAW
+from euromillions.generators.sampling import WeightedSampler
+from euromillions.storage import write_raw_batches
+
+FIRST_DRAW_DATE = "2004-02-13"
+LAST_DRAW_DATE = "2261-12-31"  # pandas timestamps end in 2262; later draws share dates
+DRAW_INTERVAL_DAYS = 3.5
+TICKETS_PER_DRAW = 30_000_000
+JACKPOT_START = 17_000_000.0
+JACKPOT_ROLLOVER = 8_000_000.0
+JACKPOT_CAP = 250_000_000.0
+CHUNK_SIZE = 100_000
+
+# (matched numbers, matched stars, odds of one ticket winning, typical prize in €), best tier first
+PRIZE_TIERS = [
+    (5, 2, 1 / 139_838_160, JACKPOT_START),
+    (5, 1, 1 / 6_991_908, 300_000.0),
+    (5, 0, 1 / 3_107_515, 60_000.0),
+    (4, 2, 1 / 621_503, 2_500.0),
+    (4, 1, 1 / 31_075, 150.0),
+    (3, 2, 1 / 14_125, 80.0),
+    (4, 0, 1 / 13_811, 50.0),
+    (2, 2, 1 / 985, 15.0),
+    (3, 1, 1 / 706, 12.0),
+    (3, 0, 1 / 314, 10.0),
+    (1, 2, 1 / 188, 8.0),
+    (2, 1, 1 / 49, 6.0),
+    (2, 0, 1 / 22, 4.0),
+]
+
+_PRIZE_TYPE = pa.struct([
+    ("matched_numbers", pa.int64()),
+    ("matched_stars", pa.int64()),
+    ("prize", pa.float64()),
+    ("winners", pa.int64()),
+])
+
+
+def _ball_weights(count: int, hot: Sequence[int], bias: float) -> np.ndarray:
+    weights = np.ones(count)
+    weights[np.asarray(hot, dtype=int) - 1] = bias
+    return weights
+
+
+def _list_array(values: np.ndarray, value_type: pa.DataType) -> pa.ListArray:
+    rows, width = values.shape
+    offsets = pa.array(np.arange(0, (rows + 1) * width, width, dtype=np.int32))
+    return pa.ListArray.from_arrays(offsets, pa.array(values.ravel(), type=value_type))
+
+
+def _draw_dates(start: int, stop: int, num_draws: int) -> np.ndarray:
+    first = np.datetime64(FIRST_DRAW_DATE, "D")
+    span = (np.datetime64(LAST_DRAW_DATE, "D") - first).astype(int)
+    step = min(DRAW_INTERVAL_DAYS, span / max(num_draws - 1, 1))
+    days = (np.arange(start, stop) * step).astype(np.int64)
+    return np.datetime_as_string(first + days, unit="D")
+
+
+def _chunks(
+        num_draws: int,
+        seed: int,
+        hot_numbers: Sequence[int],
+        hot_stars: Sequence[int],
+        bias: float
+) -> Iterator[pa.RecordBatch]:
+    rng = np.random.default_rng(seed)
+    number_sampler = WeightedSampler(_ball_weights(NUMBER_COUNT, hot_numbers, bias))
+    star_sampler = WeightedSampler(_ball_weights(STAR_COUNT, hot_stars, bias))
+    tiers = np.array([(n, s, odds, prize) for n, s, odds, prize in PRIZE_TIERS])
+    jackpot = JACKPOT_START
+
+    for start in range(0, num_draws, CHUNK_SIZE):
+        rows = min(CHUNK_SIZE, num_draws - start)
+        numbers = number_sampler.sample(rng, rows, NUMBERS_PER_DRAW)
+        stars = star_sampler.sample(rng, rows, STARS_PER_DRAW)
+
+        winners = rng.poisson(tiers[:, 2] * TICKETS_PER_DRAW, size=(rows, len(tiers)))
+        prizes = np.round(tiers[:, 3] * rng.uniform(0.5, 1.5, size=(rows, len(tiers))), 2)
+        has_winner = winners[:, 0] > 0
+        # the jackpot carries over between chunks, so walk it row by row
+        jackpots = np.empty(rows)
+        for row in range(rows):
+            jackpots[row] = jackpot
+            jackpot = JACKPOT_START if has_winner[row] else min(jackpot + JACKPOT_ROLLOVER, JACKPOT_CAP)
+        prizes[:, 0] = jackpots
+
+        prize_structs = pa.StructArray.from_arrays(
+            [
+                pa.array(np.tile(tiers[:, 0].astype(np.int64), rows)),
+                pa.array(np.tile(tiers[:, 1].astype(np.int64), rows)),
+                pa.array(prizes.ravel()),
+                pa.array(winners.ravel().astype(np.int64)),
+            ],
+            fields=list(_PRIZE_TYPE),
+        )
+        tier_offsets = pa.array(np.arange(0, (rows + 1) * len(tiers), len(tiers), dtype=np.int32))
+        ids = np.arange(start + 1, start + rows + 1)
+
+        yield pa.RecordBatch.from_arrays(
+            [
+                pa.array(ids),
+                pa.array(np.char.zfill(ids.astype(str), 6)),
+                _list_array(numbers.astype(str), pa.string()),
+                _list_array(stars.astype(str), pa.string()),
+                pa.array(_draw_dates(start, start + rows, num_draws)),
+                pa.ListArray.from_arrays(tier_offsets, prize_structs),
+                pa.array(has_winner),
+            ],
+            names=["id", "draw_id", "numbers", "stars", "date", "prizes", "has_winner"],
+        )
+
+
+def synthetic_draws_table(
+        num_draws: int,
+        seed: int = 0,
+        hot_numbers: Sequence[int] = (),
+        hot_stars: Sequence[int] = (),
+        bias: float = 1.0
+) -> pa.Table:
+    return pa.Table.from_batches(list(_chunks(num_draws, seed, hot_numbers, hot_stars, bias)))
+
+
+def synthetic_draws_df(
+        num_draws: int,
+        seed: int = 0,
+        hot_numbers: Sequence[int] = (),
+        hot_stars: Sequence[int] = (),
+        bias: float = 1.0
+) -> pd.DataFrame:
+    """A synthetic history as an API-shaped frame, which ``build_draw_index`` accepts directly."""
+    return synthetic_draws_table(num_draws, seed, hot_numbers, hot_stars, bias).to_pandas()
+
+
+def write_synthetic_draws(
+        out_dir: str,
+        num_draws: int,
+        seed: int = 0,
+        hot_numbers: Sequence[int] = (),
+        hot_stars: Sequence[int] = (),
+        bias: float = 1.0
+) -> None:
+    """Write a synthetic draw store under ``out_dir``."""
+    if num_draws < 1:
+        raise ValueError("num_draws must be at least 1")
+    write_raw_batches(out_dir, _chunks(num_draws, seed, hot_numbers, hot_stars, bias))
@@ -0,0 +1,53 @@
+"""Bitmask encoding of tickets and draws.
+
+Bit ``n - 1`` of a uint64 number mask is set when ``n`` is on the ticket
+(or was drawn); stars use a uint16 mask the same way.  The number of
+matches between a ticket and a draw is then ``popcount(ticket & draw)``,
+which vectorises across every ticket and every draw in a window, and the
+(number mask, star mask) pair is an order-independent 10-byte key for a
+ticket, used for deduplication.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+TicketKey = tuple[int, int]
+
+
+def _masks(values: np.ndarray, dtype: type) -> np.ndarray:
+    bits = np.left_shift(dtype(1), np.asarray(values).astype(dtype) - dtype(1))
+    return np.bitwise_or.reduce(bits, axis=-1)
+
+
+def number_masks(numbers: np.ndarray) -> np.ndarray:
+    """uint64 masks of the last axis of ``numbers`` (values 1..50)."""
+    return _masks(numbers, np.uint64)
+
+
+def star_masks(stars: np.ndarray) -> np.ndarray:
+    """uint16 masks of the last axis of ``stars`` (values 1..12)."""
+    return _masks(stars, np.uint16)
+
+
+def match_counts(ticket_masks: np.ndarray, draw_masks: np.ndarray) -> np.ndarray:
+    """Popcount of ``ticket_masks & draw_masks`` (broadcasting), as uint8."""
+    return np.bitwise_count(ticket_masks & draw_masks)
+
+
+def mask_of(values: Iterable) -> int:
+    """Python-int mask of one ticket's numbers or stars."""
+    mask = 0
+    for v in values:
+        mask |= 1 << (int(v) - 1)
+    return mask
+
+
+def ticket_key(nums: Iterable, stars: Iterable) -> TicketKey:
+    return mask_of(nums), mask_of(stars)
+
+
+def mask_values(mask: int) -> list[int]:
+    """The sorted values whose bits are set in ``mask``."""
+    return [bit + 1 for bit in range(mask.bit_length()) if mask >> bit & 1]
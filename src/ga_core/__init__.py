@@ -7,6 +7,8 @@ from .evolver import (
     NoImprovement,
     ConvergenceFunc,
 )
+from .bit_population import BitPopulation
+from .islands import IslandModel
 
 __all__ = [
     "Evolver",
@@ -14,4 +16,6 @@ __all__ = [
     "never_stop",
     "NoImprovement",
     "ConvergenceFunc",
+    "BitPopulation",
+    "IslandModel",
 ]
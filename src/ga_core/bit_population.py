@@ -0,0 +1,92 @@
+"""Packed bit-matrix population for binary chromosomes.
+
+Chromosomes are stored one per row with ``np.packbits``, eight genes to a
+byte, so a population of 10^5 chromosomes over ~100 genes takes about a
+megabyte.  Initialisation, one-point crossover and bit-flip mutation work
+on whole generations at once and never unpack the matrix; padding bits
+past ``length`` are kept at zero throughout.
+"""
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+
+def _packed_mask(keep: np.ndarray) -> np.ndarray:
+    """Pack a (k, length) boolean matrix into (k, ceil(length / 8)) bytes."""
+    return np.packbits(keep, axis=1)
+
+
+def one_point_crossover(
+        parents_a: np.ndarray,
+        parents_b: np.ndarray,
+        length: int,
+        rng: np.random.Generator
+) -> np.ndarray:
+    """Row i takes genes ``[0, cut_i)`` from ``parents_a[i]`` and the rest from ``parents_b[i]``."""
+    cuts = rng.integers(1, length, size=len(parents_a))
+    mask = _packed_mask(np.arange(length) < cuts[:, None])
+    return (parents_a & mask) | (parents_b & ~mask)
+
+
+def bit_flip_mutation(
+        bits: np.ndarray,
+        length: int,
+        rate: float,
+        rng: np.random.Generator
+) -> np.ndarray:
+    """Flip every gene independently with probability ``rate``."""
+    flips = _packed_mask(rng.random((len(bits), length)) < rate)
+    return bits ^ flips
+
+
+class BitPopulation:
+    """A population of binary chromosomes of equal ``length``."""
+
+    def __init__(self, bits: np.ndarray, length: int) -> None:
+        self.bits = bits
+        self.length = length
+
+    @classmethod
+    def random(cls, size: int, length: int, rng: np.random.Generator, p: float = 0.5) -> BitPopulation:
+        """Each gene set independently with probability ``p``."""
+        return cls(_packed_mask(rng.random((size, length)) < p), length)
+
+    @classmethod
+    def from_lists(cls, chromosomes: List[List[int]]) -> BitPopulation:
+        genes = np.asarray(chromosomes, dtype=bool)
+        return cls(_packed_mask(genes), genes.shape[1])
+
+    def __len__(self) -> int:
+        return len(self.bits)
+
+    def __getitem__(self, row: int) -> List[int]:
+        return np.unpackbits(self.bits[row], count=self.length).tolist()
+
+    def __setitem__(self, row: int, chromosome: List[int]) -> None:
+        self.bits[row] = np.packbits(np.asarray(chromosome, dtype=bool))
+
+    def copy(self) -> BitPopulation:
+        return BitPopulation(self.bits.copy(), self.length)
+
+    def unpacked(self) -> np.ndarray:
+        """(size, length) uint8 gene matrix."""
+        return np.unpackbits(self.bits, axis=1, count=self.length)
+
+    def to_lists(self) -> List[List[int]]:
+        return self.unpacked().tolist()
+
+    def take(self, idx: np.ndarray) -> BitPopulation:
+        return BitPopulation(self.bits[idx], self.length)
+
+    def concat(self, other: BitPopulation) -> BitPopulation:
+        return BitPopulation(np.concatenate([self.bits, other.bits]), self.length)
+
+    def breed(self, count: int, mutation_rate: float, rng: np.random.Generator) -> BitPopulation:
+        """``count`` children, each from two distinct uniformly chosen parents."""
+        first = rng.integers(len(self), size=count)
+        second = rng.integers(len(self) - 1, size=count)
+        second += second >= first
+        children = one_point_crossover(self.bits[first], self.bits[second], self.length, rng)
+        return BitPopulation(bit_flip_mutation(children, self.length, mutation_rate, rng), self.length)
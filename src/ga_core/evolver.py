@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Generic, List, Tuple, TypeVar
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
 
 Chromosome = TypeVar("Chromosome")
 Score = float
@@ -62,6 +63,17 @@ def default_select(population: List[Chromosome],
 
 @dataclass
 class Evolver(Generic[Chromosome]):
+    """
+    Generational GA driver.
+
+    With ``workers > 1`` fitness is evaluated in a process pool created on
+    first use; ``fitness_func`` must then be picklable (a module-level
+    function) and ``initializer(*initargs)`` runs once in every worker to
+    load whatever the fitness function needs.  Scores come back in
+    population order, so a deterministic fitness function gives the same
+    run as the serial path.  Call ``close`` (or use the evolver as a
+    context manager) to shut the pool down; ``run`` does so itself.
+    """
     population_size: int
     init_func: InitFunc
     fitness_func: FitnessFunc
@@ -71,12 +83,36 @@ class Evolver(Generic[Chromosome]):
     elite_size: int = 1
     convergence_func: ConvergenceFunc = never_stop
     history: List[Tuple[Chromosome, Score]] = field(default_factory=list)
+    workers: int = 1
+    initializer: Optional[Callable[..., None]] = None
+    initargs: Tuple[Any, ...] = ()
+    _executor: Optional[ProcessPoolExecutor] = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> Evolver[Chromosome]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def initialize(self) -> List[Chromosome]:
         return self.init_func(self.population_size)
 
     def score_population(self, population: List[Chromosome]) -> List[Score]:
-        return [self.fitness_func(ch) for ch in population]
+        if self.workers <= 1:
+            return [self.fitness_func(ch) for ch in population]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        chunksize = max(1, len(population) // (self.workers * 4))
+        return list(self._executor.map(self.fitness_func, population, chunksize=chunksize))
 
     def evolve_generation(self, population: List[Chromosome], scores: List[Score]) -> Tuple[List[Chromosome], List[Score]]:
         parents = self.select_func(population, scores, self.elite_size)
@@ -90,6 +126,12 @@ class Evolver(Generic[Chromosome]):
         return next_pop, next_scores
 
     def run(self, generations: int) -> Tuple[Chromosome, Score]:
+        try:
+            return self._run(generations)
+        finally:
+            self.close()
+
+    def _run(self, generations: int) -> Tuple[Chromosome, Score]:
         population = self.initialize()
         scores = self.score_population(population)
         best_idx = int(max(range(len(scores)), key=lambda i: scores[i]))
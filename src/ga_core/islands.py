@@ -0,0 +1,198 @@
+"""Island-model GA: several ``Evolver`` populations in parallel processes.
+
+Each island is one ``Evolver`` running in its own process, with its own
+configuration and random stream.  Every ``migration_interval``
+generations the islands pause, send their best ``migrants`` chromosomes
+(with scores) to the coordinator, which forwards them along the
+topology; each island replaces its worst members with the arrivals and
+carries on.  Only chromosomes and scores travel: an island loads its data
+once, through its evolver's ``initializer(*initargs)``, inside its own
+process.
+
+Topologies:
+
+``"ring"``
+    island ``i`` sends to island ``i + 1`` (wrapping around).
+``"random"``
+    a fresh random ring every migration, so each island still receives
+    exactly one batch of migrants.
+
+Migrants keep the score they had on their home island, so islands are
+expected to share a fitness function; selection, operators, population
+size and elitism may differ freely.  Each evolver's ``convergence_func``
+is not consulted; ``IslandModel.convergence_func`` sees the best score
+across all islands after every migration.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import random
+import traceback
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from typing import Generic, List, Optional, Tuple
+
+from .evolver import Chromosome, ConvergenceFunc, Evolver, Score, never_stop
+
+TOPOLOGIES = ("ring", "random")
+STOP_TIMEOUT = 10.0  # seconds an island gets to exit before it is terminated
+
+Migrants = Tuple[List[Chromosome], List[Score]]
+
+
+def _top(population: List[Chromosome], scores: List[Score], k: int) -> Migrants:
+    order = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+    return [population[i] for i in order], [scores[i] for i in order]
+
+
+def _immigrate(
+        population: List[Chromosome],
+        scores: List[Score],
+        migrants: Migrants
+) -> None:
+    """Overwrite the worst members of ``population`` with ``migrants``, in place."""
+    chromosomes, migrant_scores = migrants
+    worst = sorted(range(len(scores)), key=lambda i: scores[i])[:len(chromosomes)]
+    for slot, chrom, score in zip(worst, chromosomes, migrant_scores):
+        population[slot] = chrom
+        scores[slot] = score
+
+
+def _island_main(evolver: Evolver, conn: Connection, seed: int, migrants: int) -> None:
+    """
+    Worker loop: evolve on request, reply with emigrants and the island's
+    best so far.  A request is ``(generations, immigrants)``; ``None``
+    stops the island.
+    """
+    try:
+        random.seed(seed)
+        # with workers > 1 the evolver's own pool runs the initializer instead
+        if evolver.initializer is not None and evolver.workers <= 1:
+            evolver.initializer(*evolver.initargs)
+        population = evolver.initialize()
+        scores = evolver.score_population(population)
+        best_idx = max(range(len(scores)), key=lambda i: scores[i])
+        best, best_score = population[best_idx], scores[best_idx]
+
+        while (request := conn.recv()) is not None:
+            generations, immigrants = request
+            if immigrants is not None:
+                _immigrate(population, scores, immigrants)
+            for _ in range(generations):
+                population, scores = evolver.evolve_generation(population, scores)
+                idx = max(range(len(scores)), key=lambda i: scores[i])
+                if scores[idx] > best_score:
+                    best, best_score = population[idx], scores[idx]
+            conn.send(("ok", (_top(population, scores, migrants), best, best_score)))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        evolver.close()
+        conn.close()
+
+
+class _Island:
+    def __init__(self, ctx, evolver: Evolver, seed: int, migrants: int) -> None:
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_island_main, args=(evolver, child, seed, migrants))
+        self.process.start()
+        child.close()
+
+    def request(self, generations: int, immigrants: Optional[Migrants]) -> None:
+        self.conn.send((generations, immigrants))
+
+    def reply(self) -> Tuple[Migrants, Chromosome, Score]:
+        status, payload = self.conn.recv()
+        if status == "error":
+            raise RuntimeError(f"island process failed:\n{payload}")
+        return payload
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass  # the island has already exited
+        self.process.join(STOP_TIMEOUT)
+        if self.process.is_alive():  # stuck mid-epoch after the run was abandoned
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+@dataclass
+class IslandModel(Generic[Chromosome]):
+    """
+    Runs ``evolvers`` as islands, one process each, exchanging the top
+    ``migrants`` chromosomes every ``migration_interval`` generations.
+
+    Evolvers must be picklable (module-level functions), as for
+    ``Evolver(workers > 1)``.  ``seed`` fixes every island's random
+    stream; islands evolve concurrently but only meet at migrations, so a
+    seeded run is reproducible.
+    """
+    evolvers: List[Evolver]
+    migration_interval: int = 10
+    migrants: int = 2
+    topology: str = "ring"
+    seed: Optional[int] = None
+    convergence_func: ConvergenceFunc = never_stop
+    history: List[Tuple[Chromosome, Score]] = field(default_factory=list)
+    start_method: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.evolvers:
+            raise ValueError("an island model needs at least one evolver")
+        if self.topology not in TOPOLOGIES:
+            raise ValueError(f"topology must be one of {TOPOLOGIES}, not {self.topology!r}")
+        if self.migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+        if not 0 <= self.migrants <= min(e.population_size for e in self.evolvers):
+            raise ValueError("migrants must be between 0 and the smallest population size")
+
+    def _destinations(self, rng: random.Random) -> List[int]:
+        """``dest[i]`` is the island that island ``i``'s emigrants go to."""
+        n = len(self.evolvers)
+        if self.topology == "ring":
+            return [(i + 1) % n for i in range(n)]
+        order = list(range(n))
+        rng.shuffle(order)
+        dest = [0] * n
+        for pos, island in enumerate(order):
+            dest[island] = order[(pos + 1) % n]
+        return dest
+
+    def run(self, generations: int) -> Tuple[Chromosome, Score]:
+        """Evolve every island for ``generations``; returns the best chromosome found anywhere."""
+        rng = random.Random(self.seed)
+        ctx = multiprocessing.get_context(self.start_method)
+        islands: List[_Island] = []
+        try:
+            for evolver in self.evolvers:
+                islands.append(_Island(ctx, evolver, rng.getrandbits(64), self.migrants))
+
+            best, best_score = None, float("-inf")
+            inbound: List[Optional[Migrants]] = [None] * len(islands)
+            done = 0
+            epoch = 0  # the first round only scores the initial populations
+            while True:
+                for island, immigrants in zip(islands, inbound):
+                    island.request(epoch, immigrants)
+                replies = [island.reply() for island in islands]
+                done += epoch
+
+                for _, island_best, island_score in replies:
+                    if island_score > best_score:
+                        best, best_score = island_best, island_score
+                self.history.append((best, best_score))
+                if done >= generations or self.convergence_func(done, [s for _, s in self.history]):
+                    return best, best_score
+
+                inbound = [None] * len(islands)
+                if self.migrants and done:
+                    for source, target in enumerate(self._destinations(rng)):
+                        if target != source:
+                            inbound[target] = replies[source][0]
+                epoch = min(self.migration_interval, generations - done)
+        finally:
+            for island in islands:
+                island.stop()
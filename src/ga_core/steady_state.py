@@ -0,0 +1,60 @@
+"""Survivor bookkeeping for steady-state replacement.
+
+A steady-state GA inserts one child at a time into a fixed-size
+population and drops the worst member.  Re-sorting the population for
+every child costs O(P log P); ``SteadyState`` keeps a min-heap over
+population *slots* instead, so each insert-and-evict is O(log P) and the
+best member is tracked in O(1).  The caller keeps chromosomes (and any
+other per-member data) in its own storage, indexed by slot, and writes
+an accepted child into the slot ``offer`` hands back.
+
+Ties are broken the way a stable descending sort of "population, then
+child" would break them: among equal scores the most recently inserted
+member is evicted first, and the earliest one counts as best.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import List, Optional, Sequence
+
+
+class SteadyState:
+    """Scores of a fixed-size population, one per slot."""
+
+    def __init__(self, scores: Sequence[float]) -> None:
+        if not scores:
+            raise ValueError("population must not be empty")
+        # (score, -insertion order, slot): the heap top is the member to evict
+        self._heap = [(score, -slot, slot) for slot, score in enumerate(scores)]
+        heapq.heapify(self._heap)
+        self._inserted = len(scores)
+        self.best_slot = max(range(len(scores)), key=lambda slot: (scores[slot], -slot))
+        self.best_score = scores[self.best_slot]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def worst_score(self) -> float:
+        return self._heap[0][0]
+
+    def offer(self, score: float) -> Optional[int]:
+        """
+        Insert a child scoring ``score`` and evict the worst member.
+        Returns the freed slot for the child, or ``None`` if the child
+        itself was the one evicted.
+        """
+        entry = (score, -self._inserted, None)
+        self._inserted += 1
+        if entry <= self._heap[0]:
+            return None
+        slot = self._heap[0][2]
+        heapq.heapreplace(self._heap, (score, entry[1], slot))
+        if score > self.best_score:
+            self.best_score = score
+            self.best_slot = slot
+        return slot
+
+    def ranked_slots(self) -> List[int]:
+        """Slots from best to worst, ties in insertion order."""
+        return [slot for _, _, slot in sorted(self._heap, key=lambda e: (-e[0], -e[1]))]
@@ -0,0 +1,82 @@
+"""``fetch_and_cache_draws`` against the local stand-in API."""
+import datetime
+import tempfile
+import unittest
+
+from euromillions import storage
+from euromillions.euromillions_loader import FIRST_DRAW_YEAR, fetch_and_cache_draws
+from euromillions.stub_api import StubDrawsAPI, synthetic_payload
+
+NUM_DRAWS = 495  # 2004-02-13 to 2008-11-07, two draws a week
+NEW_DRAWS = 5
+
+
+def years_from(first_year: int) -> int:
+    """Requests a fetch makes: one per year from ``first_year`` to this one."""
+    return datetime.date.today().year - first_year + 1
+
+
+class FetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.payload = synthetic_payload(NUM_DRAWS)
+        self._dir = tempfile.TemporaryDirectory()
+        self.data_dir = self._dir.name
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def fetch(self, served: list[dict], **stub_options) -> tuple[int, int]:
+        """(new draws, requests made) for one fetch of ``served`` into the cache."""
+        with StubDrawsAPI(served, **stub_options) as api:
+            fetched = fetch_and_cache_draws(api.url, self.data_dir)
+            return fetched, api.requests_served
+
+    def cached_ids(self) -> list[int]:
+        return storage.read_draws(self.data_dir, ["id"])["id"].to_pylist()
+
+    def test_full_fetch(self) -> None:
+        fetched, requests = self.fetch(self.payload)
+        self.assertEqual(fetched, NUM_DRAWS)
+        self.assertEqual(requests, years_from(FIRST_DRAW_YEAR))
+        self.assertEqual(self.cached_ids(), [draw["id"] for draw in self.payload])
+        prizes = storage.read_prizes(self.data_dir)
+        self.assertEqual(prizes.num_rows, sum(len(draw["prizes"]) for draw in self.payload))
+
+    def test_incremental_fetch(self) -> None:
+        self.fetch(self.payload[:-NEW_DRAWS])
+        latest_year = int(self.payload[-NEW_DRAWS - 1]["date"][:4])
+        fetched, requests = self.fetch(self.payload)
+        self.assertEqual(fetched, NEW_DRAWS)
+        self.assertEqual(requests, years_from(latest_year))
+        self.assertEqual(self.cached_ids(), [draw["id"] for draw in self.payload])
+
+    def test_repeat_fetch(self) -> None:
+        self.fetch(self.payload)
+        fetched, _ = self.fetch(self.payload)
+        self.assertEqual(fetched, 0)
+        self.assertEqual(len(self.cached_ids()), NUM_DRAWS)
+
+    def test_cached_draw_replaced_by_id(self) -> None:
+        self.fetch(self.payload)
+        corrected = dict(self.payload[-1], has_winner=not self.payload[-1]["has_winner"])
+        fetched, _ = self.fetch(self.payload[:-1] + [corrected])
+        self.assertEqual(fetched, 0)
+        draws = storage.read_draws(self.data_dir, ["id", "has_winner"])
+        self.assertEqual(draws.num_rows, NUM_DRAWS)
+        self.assertEqual(draws["has_winner"][-1].as_py(), corrected["has_winner"])
+        prizes = storage.read_prizes(self.data_dir, ["draw_id"])
+        self.assertEqual(prizes["draw_id"].to_pylist().count(corrected["id"]), len(corrected["prizes"]))
+
+    def test_years_without_draws_answered_404(self) -> None:
+        fetched, requests = self.fetch(self.payload, missing_year_status=404)
+        self.assertEqual(fetched, NUM_DRAWS)
+        self.assertEqual(requests, years_from(FIRST_DRAW_YEAR))
+
+    def test_nothing_served(self) -> None:
+        fetched, _ = self.fetch([], missing_year_status=404)
+        self.assertEqual(fetched, 0)
+        self.assertFalse(storage.has_store(self.data_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()